@@ -1,11 +1,12 @@
-import orjson as json
 import logging
 import os
 import sys
 import random
-import time
 from typing import Optional
 
+import numpy as np
+from PIL import Image
+
 from models.socket import DataReceiver
 from models.matrix import (
     ActionRequest,
@@ -73,25 +74,34 @@ def matrix_loop(
     previousCanvas: PixelCanvas,
     currentCanvas: PixelCanvas,
 ) -> PixelCanvas:
-    time.sleep(0.1)
-
     # Compare the canvas to the previous canvas contents, if same then skip
-    if currentCanvas.get_hash() == previousCanvas.get_hash():
+    if currentCanvas.matches(previousCanvas):
         return previousCanvas
 
-    logging.info("Displaying new matrix")
-
-    matrix_driver.Clear()
+    framebuffer = currentCanvas.get_framebuffer()
+    dirty_rects = currentCanvas.get_dirty_rects()
+
+    # Colours are scaled by the brightness as they are drawn, so all of it is redrawn
+    if currentCanvas.brightness != previousCanvas.brightness:
+        logging.info(f"Setting brightness to {currentCanvas.brightness}")
+        matrix_driver.brightness = currentCanvas.brightness
+        dirty_rects = None
+
+    # A delta on top of the frame already on screen only redraws what changed
+    if dirty_rects is not None:
+        logging.info(f"Updating {len(dirty_rects)} changed areas of the matrix")
+        for x, y, width, height in dirty_rects:
+            draw_framebuffer(
+                matrix_driver_canvas,
+                framebuffer.array[y: y + height, x: x + width],
+                x,
+                y,
+            )
+    else:
+        logging.info("Displaying new matrix")
 
-    # Loop over pixels and set them on the matrix
-    for pixel in currentCanvas.get_pixels():
-        matrix_driver_canvas.SetPixel(
-            pixel["position"][0],
-            pixel["position"][1],
-            pixel["rgb"][0],
-            pixel["rgb"][1],
-            pixel["rgb"][2],
-        )
+        # Every pixel is overwritten, so there's no need to clear first
+        draw_framebuffer(matrix_driver_canvas, framebuffer.array)
 
     previousCanvas.copy(currentCanvas)
 
@@ -101,11 +111,29 @@ def matrix_loop(
     return previousCanvas
 
 
+# Copy an RGB888 (height, width, 3) array onto the matrix canvas at x, y in one
+# call. Our bindings copy it in C with SetPixels, the emulator and stock bindings
+# paste it as an image.
+def draw_framebuffer(
+    matrix_driver_canvas: Canvas, pixels: np.ndarray, x: int = 0, y: int = 0
+) -> None:
+    pixels = np.ascontiguousarray(pixels)
+    height, width = pixels.shape[:2]
+
+    if hasattr(matrix_driver_canvas, "SetPixels"):
+        matrix_driver_canvas.SetPixels(pixels, width, height, x, y)
+        return
+
+    matrix_driver_canvas.SetImage(Image.fromarray(pixels, "RGB"), x, y)
+
+
 def determine_current_canvas(
     current_action: CurrentAction, canvas: PixelCanvas
 ) -> PixelCanvas:
-    current_matrix_pixels = current_action.get_matrix()["pixels"]
-    canvas.set_pixels(current_matrix_pixels)
+    canvas.set_framebuffer(
+        current_action.get_framebuffer(), current_action.take_dirty_rects()
+    )
+    canvas.set_brightness(current_action.brightness)
     return canvas
 
 
@@ -119,13 +147,9 @@ def update_action(
     if "data_type" not in request:
         return current_action
 
-    # Check if the action is already being handled
-    if current_action.get_last_handled_action_request() == json.dumps(request):
-        return current_action
-
+    # Requests are handed over once by the receiver, so every one is new
     current_action.change_action(
         action=request["data_type"], data=request["data"])
-    current_action.set_last_handled_action_request(json.dumps(request))
 
     return current_action
 
@@ -154,17 +178,22 @@ def main():
     )
 
     # Start a seperate thread to read from socket
-    data_receiver = DataReceiver()
+    data_receiver = DataReceiver(
+        width=matrix_driver.width, height=matrix_driver.height)
     data_receiver.start()
 
     # Begin Loop
     logging.info("Press CTRL-C to stop.")
     try:
         while True:
-            # Determine the current action and update it
-            current_action = update_action(
-                request=data_receiver.get_data(), current_action=current_action
-            )
+            # Determine the current action by applying every request received
+            # since the last loop, in order
+            request = data_receiver.get_data()
+            while request is not None:
+                current_action = update_action(
+                    request=request, current_action=current_action
+                )
+                request = data_receiver.get_data()
             current_action.loop()
 
             # Determine the current canvas to display from the current action
@@ -183,8 +212,12 @@ def main():
                 currentCanvas=current_canvas,
             )
 
+            # Sleep until a new request arrives or the next animation frame is due
+            data_receiver.wait_for_data(
+                timeout=current_action.get_time_until_next_frame()
+            )
+
     except KeyboardInterrupt:
-        data_receiver.join()
         sys.exit(0)
 
 
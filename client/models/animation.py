@@ -0,0 +1,181 @@
+# Animations compiled into framebuffers once, so playback never walks pixel lists
+from __future__ import annotations
+import logging
+import os
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Hashable, Optional
+
+from models.animation_file import FRAME_ENCODING, AnimationFile
+from models.framebuffer import Framebuffer
+
+if TYPE_CHECKING:
+    from models.matrix import Frame
+
+# Number of compiled animations kept around for replaying
+ANIMATION_CACHE_SIZE = int(os.getenv("ANIMATION_CACHE_SIZE", 8))
+
+# Saved animations with more frames than this are streamed rather than compiled
+ANIMATION_STREAM_THRESHOLD = int(os.getenv("ANIMATION_STREAM_THRESHOLD", 64))
+
+# Frames decoded ahead of the one being shown when streaming
+ANIMATION_STREAM_LOOKAHEAD = int(os.getenv("ANIMATION_STREAM_LOOKAHEAD", 4))
+
+
+class CompiledAnimation:
+    def __init__(
+        self,
+        frames: list[Framebuffer],
+        frame_lengths: list[int],
+        width: int,
+        height: int,
+        loop: bool = False,
+    ) -> None:
+        if not frames or len(frames) != len(frame_lengths):
+            raise ValueError("Animation needs a length for each of at least one frame")
+
+        self.width: int = width
+        self.height: int = height
+        self.loop: bool = loop
+        # Shared by everything playing this animation, never change them in place
+        self.frames: list[Framebuffer] = frames
+        self.frame_lengths: list[int] = frame_lengths
+
+        # Rectangles that differ from the frame before, the first frame is compared
+        # with the last one for when the animation loops
+        self.dirty_rects: list[list[tuple[int, int, int, int]]] = [
+            frame.dirty_rects(frames[index - 1]) for index, frame in enumerate(frames)
+        ]
+
+    @classmethod
+    def from_frames(
+        cls, frames: list[Frame], width: int, height: int, loop: bool = False
+    ) -> CompiledAnimation:
+        return cls(
+            [
+                Framebuffer.from_pixels(frame["data"]["pixels"], width, height)
+                for frame in frames
+            ],
+            [frame["frame_length"] for frame in frames],
+            width,
+            height,
+            loop,
+        )
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def get_frame(self, index: int) -> Framebuffer:
+        return self.frames[index]
+
+    def get_dirty_rects(self, index: int) -> list[tuple[int, int, int, int]]:
+        return self.dirty_rects[index]
+
+    # Every frame is ready already
+    def prefetch(self, index: int) -> None:
+        pass
+
+
+# Animation played straight from a mapped animation file. Only the frame before the
+# one being shown, that frame and a few after it are decoded at any time, so long
+# animations start at once and take the same memory as short ones.
+class StreamedAnimation:
+    def __init__(
+        self,
+        animation_file: AnimationFile,
+        lookahead: int = ANIMATION_STREAM_LOOKAHEAD,
+    ) -> None:
+        # Closed along with the map once nothing plays this animation any more
+        self.file: AnimationFile = animation_file
+        self.width: int = animation_file.width
+        self.height: int = animation_file.height
+        self.loop: bool = animation_file.loop
+        self.frame_lengths: list[int] = animation_file.frame_lengths
+        self.lookahead: int = max(1, lookahead)
+
+        # Decoded frames and the rectangles that differ from the frame before them
+        self.window: OrderedDict[
+            int, tuple[Framebuffer, list[tuple[int, int, int, int]]]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.file)
+
+    def get_frame(self, index: int) -> Framebuffer:
+        return self._decode(index)[0]
+
+    def get_dirty_rects(self, index: int) -> list[tuple[int, int, int, int]]:
+        return self._decode(index)[1]
+
+    # Decode the frames coming up after index and forget the ones already played
+    def prefetch(self, index: int) -> None:
+        upcoming = [
+            (index + offset) % len(self)
+            for offset in range(1, self.lookahead + 1)
+            if self.loop or index + offset < len(self)
+        ]
+
+        keep = {(index - 1) % len(self), index, *upcoming}
+        for decoded in list(self.window):
+            if decoded not in keep:
+                del self.window[decoded]
+
+        for upcoming_index in upcoming:
+            self._decode(upcoming_index)
+
+    def _decode(
+        self, index: int
+    ) -> tuple[Framebuffer, list[tuple[int, int, int, int]]]:
+        if index in self.window:
+            return self.window[index]
+
+        previous = self.window.get((index - 1) % len(self))
+        previous_framebuffer = previous[0] if previous is not None else None
+
+        # Jumped somewhere we haven't decoded the frame before, so start from the
+        # whole frame the delta chain starts at
+        if (
+            previous_framebuffer is None
+            and self.file.encodings[index] != FRAME_ENCODING.KEYFRAME
+        ):
+            start = index
+            while self.file.encodings[start] != FRAME_ENCODING.KEYFRAME:
+                start -= 1
+            for chain_index in range(start, index):
+                previous_framebuffer, _ = self.file.decode(
+                    chain_index, previous_framebuffer
+                )
+
+        framebuffer, rects = self.file.decode(index, previous_framebuffer)
+        if rects is None:
+            # A whole frame, only the frame before it tells us what actually changed
+            rects = (
+                framebuffer.dirty_rects(previous_framebuffer)
+                if previous_framebuffer is not None
+                else [(0, 0, self.width, self.height)]
+            )
+
+        self.window[index] = (framebuffer, rects)
+        return self.window[index]
+
+
+# Least recently used compiled animations, keyed by animation id
+class AnimationCache:
+    def __init__(self, size: int = ANIMATION_CACHE_SIZE) -> None:
+        self.size: int = max(0, size)
+        self.animations: OrderedDict[Hashable, CompiledAnimation] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[CompiledAnimation]:
+        animation = self.animations.get(key)
+        if animation is not None:
+            self.animations.move_to_end(key)
+        return animation
+
+    def put(self, key: Hashable, animation: CompiledAnimation) -> None:
+        if self.size == 0:
+            return
+
+        self.animations[key] = animation
+        self.animations.move_to_end(key)
+        while len(self.animations) > self.size:
+            evicted, _ = self.animations.popitem(last=False)
+            logging.info(f"Evicted animation {evicted} from the cache")
@@ -0,0 +1,156 @@
+# Packed single file animations (see server/models/animation_file.py)
+#
+# A file is a header, an index with an entry per frame and then the frame payloads.
+# Frames are either a whole RGB888 framebuffer or the rectangles that changed since
+# the frame before, with a whole frame at least every few frames. Frames with the
+# same payload share it.
+import mmap
+import struct
+from enum import IntEnum
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from models.framebuffer import Framebuffer
+
+ANIMATION_MAGIC = b"LCAN"
+ANIMATION_VERSION = 1
+ANIMATION_EXTENSION = ".lcanim"
+
+# Magic, version, flags, width, height, frame count
+FILE_HEADER = struct.Struct(">4sBBHHI")
+FLAG_LOOP = 1
+
+# Payload offset, payload length, frame length in ms, encoding
+FRAME_ENTRY = struct.Struct(">QIIB")
+FRAME_ENTRY_DTYPE = np.dtype(
+    [("offset", ">u8"), ("length", ">u4"), ("frame_length", ">u4"), ("encoding", "u1")]
+)
+
+# Number of rectangles in a delta payload, each a RECT_HEADER and its RGB888 pixels
+DELTA_HEADER = struct.Struct(">H")
+
+# x, y, width, height of a changed rectangle, the same as in FRAME_DELTA messages
+RECT_HEADER = struct.Struct(">HHHH")
+
+
+class FRAME_ENCODING(IntEnum):
+    KEYFRAME = 1
+    DELTA = 2
+
+
+# Read only view of an animation file, frames are decoded straight out of the map.
+# Animations sent to us in a message are read the same way from their buffer.
+class AnimationFile:
+    def __init__(
+        self, filename: Optional[str] = None, buffer: Optional[bytes] = None
+    ) -> None:
+        if buffer is not None:
+            self.map: Union[mmap.mmap, bytes] = buffer
+        else:
+            with open(filename, "rb") as f:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_index()
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def _read_index(self) -> None:
+        if len(self.map) < FILE_HEADER.size:
+            raise ValueError("Animation file is shorter than its header")
+
+        magic, version, flags, width, height, frame_count = FILE_HEADER.unpack_from(
+            self.map
+        )
+        if magic != ANIMATION_MAGIC:
+            raise ValueError("Not an animation file")
+        if version != ANIMATION_VERSION:
+            raise ValueError(f"Unsupported animation version {version}")
+        if frame_count == 0:
+            raise ValueError("Animation has no frames")
+
+        self.width: int = width
+        self.height: int = height
+        self.loop: bool = bool(flags & FLAG_LOOP)
+
+        # Read the whole index in one go, long animations have thousands of entries
+        index_end = FILE_HEADER.size + FRAME_ENTRY.size * frame_count
+        if index_end > len(self.map):
+            raise ValueError("Animation index is past the end of the file")
+        # Copied so the map can still be closed while an error is being raised
+        index = np.frombuffer(
+            self.map, dtype=FRAME_ENTRY_DTYPE, count=frame_count, offset=FILE_HEADER.size
+        ).copy()
+        if np.any(index["offset"] + index["length"] > len(self.map)):
+            raise ValueError("Animation frame is past the end of the file")
+        if not np.isin(index["encoding"], list(FRAME_ENCODING)).all():
+            raise ValueError("Animation frame has an unknown encoding")
+
+        self.offsets: list[int] = index["offset"].tolist()
+        self.lengths: list[int] = index["length"].tolist()
+        self.frame_lengths: list[int] = index["frame_length"].tolist()
+        self.encodings: list[int] = index["encoding"].tolist()
+
+        if self.encodings[0] != FRAME_ENCODING.KEYFRAME:
+            raise ValueError("Animation doesn't start with a whole frame")
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def close(self) -> None:
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+
+    def __enter__(self) -> "AnimationFile":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    # Decode a frame, deltas are applied to a copy of the frame before it. Also returns
+    # the rectangles that changed, None for a whole frame.
+    def decode(
+        self, index: int, previous: Optional[Framebuffer] = None
+    ) -> tuple[Framebuffer, Optional[list[tuple[int, int, int, int]]]]:
+        offset, length = self.offsets[index], self.lengths[index]
+
+        if self.encodings[index] == FRAME_ENCODING.KEYFRAME:
+            if length != self.width * self.height * 3:
+                raise ValueError(f"Animation frame {index} has the wrong length")
+            array = np.frombuffer(
+                self.map, dtype=np.uint8, count=length, offset=offset
+            ).reshape((self.height, self.width, 3))
+            return (Framebuffer(self.width, self.height, array.copy()), None)
+
+        if previous is None:
+            raise ValueError(f"Animation frame {index} needs the frame before it")
+
+        framebuffer = previous.copy()
+        rects = []
+        (rect_count,) = DELTA_HEADER.unpack_from(self.map, offset)
+        position = offset + DELTA_HEADER.size
+        for _ in range(rect_count):
+            x, y, rect_width, rect_height = RECT_HEADER.unpack_from(self.map, position)
+            position += RECT_HEADER.size
+            if x + rect_width > self.width or y + rect_height > self.height:
+                raise ValueError(f"Animation frame {index} is out of bounds")
+
+            size = rect_width * rect_height * 3
+            framebuffer.set_rect(
+                x, y, rect_width, rect_height, self.map[position: position + size]
+            )
+            rects.append((x, y, rect_width, rect_height))
+            position += size
+
+        if position != offset + length:
+            raise ValueError(f"Animation frame {index} has the wrong length")
+        return (framebuffer, rects)
+
+    # Every frame in order, each only decoded once
+    def frames(self) -> Iterator[Framebuffer]:
+        framebuffer = None
+        for index in range(len(self)):
+            framebuffer, _ = self.decode(index, framebuffer)
+            yield framebuffer
@@ -0,0 +1,108 @@
+# The time drawn by the driver itself, so nothing has to be sent while it ticks
+import time
+from typing import Optional
+from typing_extensions import NotRequired, TypedDict
+
+from models.font import Glyph, load_font
+from models.framebuffer import Framebuffer
+
+DEFAULT_FONT = "6x10"
+DEFAULT_TIME_FORMAT = "%H:%M"
+
+
+# Clock model, how the time is drawn
+class Clock(TypedDict):
+    position: list[int]  # X and Y of the start of the baseline
+    rgb: list[int]
+    background: NotRequired[list[int]]
+    format: NotRequired[str]  # strftime format, DEFAULT_TIME_FORMAT if not given
+    font: NotRequired[str]  # Name of a BDF font, DEFAULT_FONT if not given
+
+
+class ClockFace:
+    def __init__(self, clock: Clock, width: int, height: int) -> None:
+        if len(clock["position"]) != 2 or len(clock["rgb"]) != 3:
+            raise ValueError("Clock needs an [x, y] position and an [r, g, b] colour")
+
+        self.font = load_font(clock.get("font", DEFAULT_FONT))
+        self.format: str = clock.get("format", DEFAULT_TIME_FORMAT)
+        self.x: int = int(clock["position"][0])
+        self.y: int = int(clock["position"][1])
+        self.rgb: list[int] = [min(max(int(v), 0), 255) for v in clock["rgb"]]
+        self.background: list[int] = [
+            min(max(int(v), 0), 255) for v in clock.get("background", [0, 0, 0])
+        ]
+
+        self.framebuffer: Framebuffer = Framebuffer(width, height)
+        self.framebuffer.fill(self.background)
+
+        # Text on screen and the columns each of its glyphs covers
+        self.text: str = ""
+        self.spans: list[tuple[int, int]] = []
+
+        # Rows any glyph of the font can cover
+        _, box_height, _, box_y_offset = self.font.bounding_box
+        self.top: int = max(self.y - box_y_offset - box_height, 0)
+        self.bottom: int = min(self.y - box_y_offset, height)
+
+    # Redraw the glyphs that changed since the last update. Returns the rectangle
+    # that changed, an empty list if the time on screen is still right.
+    def update(self, now: Optional[float] = None) -> list[tuple[int, int, int, int]]:
+        # Not localtime's own clock, which is coarse enough to lag just after a second
+        text = time.strftime(
+            self.format, time.localtime(time.time() if now is None else now)
+        )
+        if text == self.text:
+            return []
+
+        glyphs = [self.font.glyph(char) for char in text]
+        spans = self._layout(glyphs)
+
+        # Columns of every glyph that is different or has moved, then and now
+        changed = [
+            span
+            for index in range(max(len(spans), len(self.spans)))
+            if index >= len(spans)
+            or index >= len(self.spans)
+            or text[index] != self.text[index]
+            or spans[index] != self.spans[index]
+            for span in (self.spans[index:index + 1] + spans[index:index + 1])
+        ]
+        x0 = max(min(start for start, _ in changed), 0)
+        x1 = min(max(end for _, end in changed), self.framebuffer.width)
+
+        self.text, self.spans = text, spans
+        if x0 >= x1 or self.top >= self.bottom:
+            return []
+
+        # Clear the columns and draw every glyph reaching into them again, glyphs
+        # either side that overhang them are only drawn over with the same pixels
+        self.framebuffer.array[self.top: self.bottom, x0:x1] = self.background
+        x = self.x
+        for glyph, (start, end) in zip(glyphs, spans):
+            if glyph is not None and start < x1 and end > x0:
+                self.font.draw_glyph(self.framebuffer, glyph, x, self.y, self.rgb)
+            x += glyph.advance if glyph is not None else 0
+        self.framebuffer.mark_changed()
+
+        return [(x0, self.top, x1 - x0, self.bottom - self.top)]
+
+    # Seconds until the time shown could next change
+    def get_time_until_next_update(self) -> float:
+        return 1 - time.time() % 1
+
+    def _layout(self, glyphs: list[Optional[Glyph]]) -> list[tuple[int, int]]:
+        spans = []
+        x = self.x
+        for glyph in glyphs:
+            if glyph is None:
+                spans.append((x, x))
+                continue
+            spans.append(
+                (
+                    x + min(glyph.x_offset, 0),
+                    x + max(glyph.advance, glyph.x_offset + glyph.width),
+                )
+            )
+            x += glyph.advance
+        return spans
@@ -0,0 +1,169 @@
+# Named layers shown over (or under) whatever the matrix is showing, like a
+# notification over the clock, without the server having to merge them
+from __future__ import annotations
+import time
+from typing import TYPE_CHECKING, Optional
+from typing_extensions import NotRequired, TypedDict
+
+import numpy as np
+
+from models.clock import Clock, ClockFace
+from models.framebuffer import Framebuffer
+
+if TYPE_CHECKING:
+    from models.matrix import Pixel
+
+
+# Layer model, either pixels or a clock the driver keeps up to date
+class LayerRequest(TypedDict):
+    name: str
+    pixels: NotRequired[list[Pixel]]
+    clock: NotRequired[Clock]
+    z: NotRequired[int]  # Higher is on top, negative is under what is shown
+    opacity: NotRequired[float]  # 0 to 1
+    ttl: NotRequired[float]  # Seconds until the layer is removed, forever if not given
+
+
+# Remove layer model
+class RemoveLayer(TypedDict):
+    name: str
+
+
+class Layer:
+    def __init__(
+        self,
+        framebuffer: Framebuffer,
+        z: int,
+        opacity: float,
+        expires: Optional[int],
+        clock: Optional[ClockFace] = None,
+    ) -> None:
+        self.framebuffer: Framebuffer = framebuffer
+        self.z: int = z
+        # Out of 255, so blending stays in integers
+        self.alpha: int = round(min(max(opacity, 0), 1) * 255)
+        # Monotonic time in ns the layer is removed at, None to keep it
+        self.expires: Optional[int] = expires
+        self.clock: Optional[ClockFace] = clock
+
+
+class Compositor:
+    def __init__(self, width: int, height: int) -> None:
+        self.width: int = width
+        self.height: int = height
+        # In the order they were added, sorted by z when blended
+        self.layers: dict[str, Layer] = {}
+
+        # Last composite and the versions it was made from, so it is only blended
+        # again when the content or a layer changes
+        self.output: Framebuffer = Framebuffer(width, height)
+        self.output_key: Optional[tuple] = None
+
+    def __len__(self) -> int:
+        return len(self.layers)
+
+    # Add a layer or replace the one with the same name
+    def set_layer(self, request: LayerRequest) -> None:
+        clock = None
+        if "clock" in request:
+            clock = ClockFace(request["clock"], self.width, self.height)
+            clock.update()
+            framebuffer = clock.framebuffer
+        elif "pixels" in request:
+            framebuffer = Framebuffer.from_pixels(
+                request["pixels"], self.width, self.height
+            )
+        else:
+            raise ValueError("Layer needs pixels or a clock")
+
+        expires = None
+        if request.get("ttl") is not None:
+            expires = time.monotonic_ns() + int(request["ttl"] * 1_000_000_000)
+
+        # Replacing a layer moves it to the top of layers with the same z
+        self.layers.pop(request["name"], None)
+        self.layers[request["name"]] = Layer(
+            framebuffer,
+            int(request.get("z", 0)),
+            float(request.get("opacity", 1)),
+            expires,
+            clock,
+        )
+
+    # Returns whether there was a layer with the name
+    def remove_layer(self, name: str) -> bool:
+        return self.layers.pop(name, None) is not None
+
+    # Remove expired layers and update clocks. Returns the rectangles that changed,
+    # None if the whole composite did.
+    def tick(self, now: Optional[int] = None) -> Optional[list[tuple[int, int, int, int]]]:
+        now = time.monotonic_ns() if now is None else now
+        expired = [
+            name
+            for name, layer in self.layers.items()
+            if layer.expires is not None and now >= layer.expires
+        ]
+        for name in expired:
+            del self.layers[name]
+
+        rects: list[tuple[int, int, int, int]] = []
+        for layer in self.layers.values():
+            if layer.clock is not None:
+                rects += layer.clock.update()
+        return None if expired else rects
+
+    # Seconds until a layer expires or a clock ticks, None if neither will
+    def get_time_until_next_update(self, now: Optional[int] = None) -> Optional[float]:
+        now = time.monotonic_ns() if now is None else now
+        times = [
+            max(0, layer.expires - now) / 1_000_000_000
+            for layer in self.layers.values()
+            if layer.expires is not None
+        ] + [
+            layer.clock.get_time_until_next_update()
+            for layer in self.layers.values()
+            if layer.clock is not None
+        ]
+        return min(times, default=None)
+
+    # Blend the layers with the content shown, from the bottom up. Black pixels are
+    # off on the matrix, so they let whatever is under them through.
+    def compose(self, content: Framebuffer) -> Framebuffer:
+        if not self.layers:
+            return content
+
+        ordered = sorted(self.layers.values(), key=lambda layer: layer.z)
+        # Changing a layer always gives it a new framebuffer, and so a new version
+        key = (
+            content.version,
+            tuple(layer.framebuffer.version for layer in ordered),
+        )
+        if key == self.output_key:
+            return self.output
+
+        under = [layer for layer in ordered if layer.z < 0]
+        over = [layer for layer in ordered if layer.z >= 0]
+        output = np.zeros((self.height, self.width, 3), dtype=np.uint16)
+        for framebuffer, alpha in (
+            [(layer.framebuffer, layer.alpha) for layer in under]
+            + [(content, 255)]
+            + [(layer.framebuffer, layer.alpha) for layer in over]
+        ):
+            source = framebuffer.array
+            lit = (source[..., 0] | source[..., 1] | source[..., 2]) != 0
+            if alpha == 255:
+                np.copyto(output, source, where=lit[..., None])
+                continue
+            if alpha == 0:
+                continue
+
+            # source * alpha + output * (255 - alpha), rounded and divided by 255
+            # with shifts as division is slow
+            weight = lit[..., None] * np.uint16(alpha)
+            blended = source * weight + output * (255 - weight) + 128
+            output = (blended + (blended >> 8)) >> 8
+
+        self.output.array[:] = output
+        self.output.mark_changed()
+        self.output_key = key
+        return self.output
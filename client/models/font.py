@@ -0,0 +1,271 @@
+# BDF bitmap fonts, the same ones the LED matrix library draws text with
+# (see server/models/font.py)
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from models.framebuffer import Framebuffer
+
+# Where the .bdf files are, by default the fonts that come with rpi-rgb-led-matrix
+FONTS_PATH = os.getenv("FONTS_PATH", "rpi-rgb-led-matrix/fonts")
+FONT_EXTENSION = ".bdf"
+
+# Number of fonts kept parsed
+FONT_CACHE_SIZE = 8
+
+# Number of rendered strings kept per font, a clock only ever shows a few thousand
+TEXT_CACHE_SIZE = int(os.getenv("TEXT_CACHE_SIZE", 256))
+
+
+class Glyph:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        x_offset: int,
+        y_offset: int,
+        advance: int,
+        bitmap: bytes,
+    ) -> None:
+        # Bounding box, the offsets are from the origin on the baseline to its
+        # bottom left corner
+        self.width: int = width
+        self.height: int = height
+        self.x_offset: int = x_offset
+        self.y_offset: int = y_offset
+        # How far the next glyph starts to the right
+        self.advance: int = advance
+        # Rows padded to whole bytes, most significant bit on the left
+        self.bitmap: bytes = bitmap
+        # (height, width) bool array of the pixels that are on, a view of its
+        # font's atlas
+        self.mask: np.ndarray = np.zeros((height, width), dtype=bool)
+
+
+# A string rendered once, drawn again with a single masked assignment
+class TextBitmap:
+    def __init__(self, mask: np.ndarray, left: int, top: int, advance: int) -> None:
+        self.mask: np.ndarray = mask
+        # Offsets of the mask's top left corner from the origin on the baseline
+        self.left: int = left
+        self.top: int = top
+        self.advance: int = advance
+
+
+class Font:
+    def __init__(
+        self,
+        glyphs: dict[int, Glyph],
+        ascent: int,
+        descent: int,
+        default_char: int,
+        bounding_box: tuple[int, int, int, int],
+    ) -> None:
+        self.glyphs: dict[int, Glyph] = glyphs
+        self.ascent: int = ascent
+        self.descent: int = descent
+        self.default_char: int = default_char
+        # Width, height and offsets of a box every glyph fits in
+        self.bounding_box: tuple[int, int, int, int] = bounding_box
+
+        # Every glyph unpacked side by side up front, so drawing never decodes
+        self.atlas: np.ndarray = self._pack_glyphs()
+
+        # Rendered strings, least recently used first. Fonts are shared between
+        # threads so the cache is locked.
+        self.texts: OrderedDict[str, TextBitmap] = OrderedDict()
+        self.texts_lock = threading.Lock()
+
+    def _pack_glyphs(self) -> np.ndarray:
+        glyphs = list(self.glyphs.values())
+        atlas = np.zeros(
+            (max(glyph.height for glyph in glyphs), sum(glyph.width for glyph in glyphs)),
+            dtype=bool,
+        )
+
+        column = 0
+        for glyph in glyphs:
+            rows = np.frombuffer(glyph.bitmap, dtype=np.uint8).reshape(
+                (glyph.height, (glyph.width + 7) // 8)
+            )
+            cell = atlas[: glyph.height, column: column + glyph.width]
+            cell[:] = np.unpackbits(rows, axis=1)[:, : glyph.width]
+            glyph.mask = cell
+            column += glyph.width
+        return atlas
+
+    @property
+    def height(self) -> int:
+        return self.ascent + self.descent
+
+    @classmethod
+    def from_file(cls, filename: str) -> "Font":
+        with open(filename, "r", encoding="latin-1") as f:
+            return cls.parse(f.read().splitlines())
+
+    @classmethod
+    def parse(cls, lines: list[str]) -> "Font":
+        glyphs: dict[int, Glyph] = {}
+        ascent = descent = 0
+        default_char = ord("?")
+        box = (0, 0, 0, 0)
+
+        encoding = -1
+        advance = 0
+        glyph_box = box
+        bitmap: Optional[list[str]] = None
+        for line in lines:
+            keyword, _, value = line.strip().partition(" ")
+
+            # Rows of the glyph being read
+            if bitmap is not None and keyword != "ENDCHAR":
+                bitmap.append(keyword)
+                continue
+
+            match keyword:
+                case "FONTBOUNDINGBOX":
+                    box = tuple(int(part) for part in value.split())
+                case "FONT_ASCENT":
+                    ascent = int(value)
+                case "FONT_DESCENT":
+                    descent = int(value)
+                case "DEFAULT_CHAR":
+                    default_char = int(value)
+                case "STARTCHAR":
+                    encoding, advance, glyph_box = -1, box[0], box
+                case "ENCODING":
+                    encoding = int(value.split()[0])
+                case "DWIDTH":
+                    advance = int(value.split()[0])
+                case "BBX":
+                    glyph_box = tuple(int(part) for part in value.split())
+                case "BITMAP":
+                    bitmap = []
+                case "ENDCHAR":
+                    width, height, x_offset, y_offset = glyph_box
+                    row_bytes = (width + 7) // 8
+                    if encoding >= 0 and bitmap is not None and len(bitmap) == height:
+                        glyphs[encoding] = Glyph(
+                            width,
+                            height,
+                            x_offset,
+                            y_offset,
+                            advance,
+                            b"".join(
+                                bytes.fromhex(row.ljust(row_bytes * 2, "0")[: row_bytes * 2])
+                                for row in bitmap
+                            ),
+                        )
+                    bitmap = None
+
+        if not glyphs:
+            raise ValueError("Font has no glyphs")
+        # Fonts without ascent and descent properties only have their bounding box
+        if ascent == 0 and descent == 0:
+            ascent, descent = box[1] + box[3], -box[3]
+        return cls(glyphs, ascent, descent, default_char, box)
+
+    # Characters the font doesn't have are drawn as its default character
+    def glyph(self, char: str) -> Optional[Glyph]:
+        glyph = self.glyphs.get(ord(char))
+        if glyph is None:
+            glyph = self.glyphs.get(self.default_char)
+        return glyph
+
+    def text_width(self, text: str) -> int:
+        return self.render_text(text).advance
+
+    # Glyphs of a string merged into one mask, cached as the same text is drawn
+    # over and over. Colours are only applied when drawing so they share the cache.
+    def render_text(self, text: str) -> TextBitmap:
+        with self.texts_lock:
+            bitmap = self.texts.get(text)
+            if bitmap is not None:
+                self.texts.move_to_end(text)
+                return bitmap
+
+        # Where each glyph's box goes, relative to the origin of the text
+        placed = []
+        x = 0
+        for glyph in filter(None, map(self.glyph, text)):
+            placed.append(
+                (glyph, x + glyph.x_offset, -glyph.y_offset - glyph.height)
+            )
+            x += glyph.advance
+
+        if not placed:
+            bitmap = TextBitmap(np.zeros((0, 0), dtype=bool), 0, 0, x)
+        else:
+            left = min(glyph_left for _, glyph_left, _ in placed)
+            top = min(glyph_top for _, _, glyph_top in placed)
+            right = max(glyph_left + glyph.width for glyph, glyph_left, _ in placed)
+            bottom = max(glyph_top + glyph.height for glyph, _, glyph_top in placed)
+
+            mask = np.zeros((bottom - top, right - left), dtype=bool)
+            for glyph, glyph_left, glyph_top in placed:
+                mask[
+                    glyph_top - top: glyph_top - top + glyph.height,
+                    glyph_left - left: glyph_left - left + glyph.width,
+                ] |= glyph.mask
+            bitmap = TextBitmap(mask, left, top, x)
+
+        with self.texts_lock:
+            self.texts[text] = bitmap
+            while len(self.texts) > TEXT_CACHE_SIZE:
+                self.texts.popitem(last=False)
+        return bitmap
+
+    # Draw text with its baseline at y, like graphics.DrawText. Writes to the array
+    # directly, call mark_changed afterwards. Returns how far the text advanced.
+    def draw_text(
+        self, framebuffer: Framebuffer, x: int, y: int, rgb: list[int], text: str
+    ) -> int:
+        bitmap = self.render_text(text)
+        _draw_mask(framebuffer, bitmap.mask, x + bitmap.left, y + bitmap.top, rgb)
+        return bitmap.advance
+
+    # Draw one glyph with its origin at x on the baseline at y
+    @staticmethod
+    def draw_glyph(
+        framebuffer: Framebuffer, glyph: Glyph, x: int, y: int, rgb: list[int]
+    ) -> None:
+        _draw_mask(
+            framebuffer,
+            glyph.mask,
+            x + glyph.x_offset,
+            y - glyph.y_offset - glyph.height,
+            rgb,
+        )
+
+
+# Set the pixels of a mask with its top left corner at left, top, clipped to the
+# framebuffer
+def _draw_mask(
+    framebuffer: Framebuffer, mask: np.ndarray, left: int, top: int, rgb: list[int]
+) -> None:
+    height, width = mask.shape
+    x0, y0 = max(left, 0), max(top, 0)
+    x1 = min(left + width, framebuffer.width)
+    y1 = min(top + height, framebuffer.height)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    framebuffer.array[y0:y1, x0:x1][
+        mask[y0 - top: y1 - top, x0 - left: x1 - left]
+    ] = rgb
+
+
+# Fonts are looked up by file name without the extension, e.g. 6x10
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font(name: str) -> Font:
+    if not name or os.path.basename(name) != name or name.startswith("."):
+        raise ValueError(f"Invalid font name {name}")
+
+    try:
+        return Font.from_file(os.path.join(FONTS_PATH, f"{name}{FONT_EXTENSION}"))
+    except FileNotFoundError:
+        raise ValueError(f"Unknown font {name}")
@@ -0,0 +1,162 @@
+# NumPy backed RGB888 framebuffer
+from __future__ import annotations
+import hashlib
+import itertools
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from models.matrix import Pixel
+
+# Process wide, so a version identifies one framebuffer state across all instances
+_versions = itertools.count(1)
+
+
+class Framebuffer:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        array: Optional[np.ndarray] = None,
+        version: Optional[int] = None,
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+
+        # Bumped on every mutation, equal versions mean equal contents
+        self.version: int = version if version is not None else next(_versions)
+        self._digest: Optional[bytes] = None
+        self._digest_version: int = 0
+
+        # Contiguous (height, width, 3) array, indexed [y, x]
+        if array is None:
+            array = np.zeros((height, width, 3), dtype=np.uint8)
+        elif array.shape != (height, width, 3) or array.dtype != np.uint8:
+            raise ValueError("Framebuffer array must be (height, width, 3) uint8")
+        self.array: np.ndarray = np.ascontiguousarray(array)
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes, width: int, height: int) -> Framebuffer:
+        if len(buffer) != width * height * 3:
+            raise ValueError("Framebuffer size does not match its dimensions")
+        array = np.frombuffer(buffer, dtype=np.uint8).reshape((height, width, 3))
+        return cls(width, height, array.copy())
+
+    @classmethod
+    def from_pixels(cls, pixels: list[Pixel], width: int, height: int) -> Framebuffer:
+        framebuffer = cls(width, height)
+        framebuffer.set_pixels(pixels)
+        return framebuffer
+
+    def tobytes(self) -> bytes:
+        return self.array.tobytes()
+
+    # Call after writing to self.array directly
+    def mark_changed(self) -> None:
+        self.version = next(_versions)
+
+    # Cheap content hash for telling apart different versions with the same pixels,
+    # only recomputed when the version changes
+    def digest(self) -> bytes:
+        if self._digest is None or self._digest_version != self.version:
+            self._digest = hashlib.blake2b(self.array.data, digest_size=16).digest()
+            self._digest_version = self.version
+        return self._digest
+
+    # Row by row, optionally leaving out the pixels that are off
+    def to_pixels(self, skip_black: bool = False) -> list[Pixel]:
+        if skip_black:
+            ys, xs = np.nonzero(self.array.any(axis=2))
+        else:
+            ys, xs = np.divmod(np.arange(self.width * self.height), self.width)
+        return [
+            {"rgb": rgb, "position": [x, y]}
+            for rgb, x, y in zip(self.array[ys, xs].tolist(), xs.tolist(), ys.tolist())
+        ]
+
+    def get_pixel(self, x: int, y: int) -> list[int]:
+        return self.array[y, x].tolist()
+
+    def set_pixel(self, x: int, y: int, rgb: list[int]) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.array[y, x] = rgb
+            self.mark_changed()
+
+    # Set a list of pixels in one vectorized assignment, out of bounds pixels are skipped
+    def set_pixels(self, pixels: list[Pixel]) -> None:
+        if not pixels:
+            return
+
+        positions = np.array([pixel["position"] for pixel in pixels], dtype=np.int64)
+        colours = np.array([pixel["rgb"] for pixel in pixels], dtype=np.int64)
+        if positions.shape != (len(pixels), 2) or colours.shape != (len(pixels), 3):
+            raise ValueError("Pixels need an [x, y] position and an [r, g, b] colour")
+
+        inside = (
+            (positions[:, 0] >= 0)
+            & (positions[:, 0] < self.width)
+            & (positions[:, 1] >= 0)
+            & (positions[:, 1] < self.height)
+        )
+        positions = positions[inside]
+        self.array[positions[:, 1], positions[:, 0]] = np.clip(colours[inside], 0, 255)
+        self.mark_changed()
+
+    # Overwrite a rectangle with RGB888 bytes, row major
+    def set_rect(self, x: int, y: int, width: int, height: int, buffer: bytes) -> None:
+        self.array[y: y + height, x: x + width] = np.frombuffer(
+            buffer, dtype=np.uint8
+        ).reshape((height, width, 3))
+        self.mark_changed()
+
+    def fill(self, rgb: list[int]) -> None:
+        self.array[:, :] = rgb
+        self.mark_changed()
+
+    def clear(self) -> None:
+        self.array.fill(0)
+        self.mark_changed()
+
+    # Copy another framebuffer on top of this one at (x, y), clipped to our bounds
+    def blit(self, other: Framebuffer, x: int = 0, y: int = 0) -> None:
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + other.width, self.width), min(y + other.height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self.array[y0:y1, x0:x1] = other.array[y0 - y: y1 - y, x0 - x: x1 - x]
+        self.mark_changed()
+
+    # Copies share the version of the original until either is changed
+    def copy(self) -> Framebuffer:
+        return Framebuffer(self.width, self.height, self.array.copy(), self.version)
+
+    def equals(self, other: Framebuffer) -> bool:
+        if self.version == other.version:
+            return True
+        return self.array.shape == other.array.shape and np.array_equal(
+            self.array, other.array
+        )
+
+    # Mask of pixels that differ from another framebuffer of the same size
+    def changed_mask(self, other: Framebuffer) -> np.ndarray:
+        return np.any(self.array != other.array, axis=2)
+
+    # Rectangles that differ from a previous framebuffer. Changed rows are grouped
+    # into bands of consecutive rows, each covering the columns changed in the band.
+    def dirty_rects(self, previous: Framebuffer) -> list[tuple[int, int, int, int]]:
+        changed = self.changed_mask(previous)
+        changed_rows = np.flatnonzero(changed.any(axis=1))
+        if len(changed_rows) == 0:
+            return []
+
+        # Split the changed rows wherever there is a gap between them
+        bands = np.split(changed_rows, np.flatnonzero(np.diff(changed_rows) > 1) + 1)
+
+        rects: list[tuple[int, int, int, int]] = []
+        for band in bands:
+            y0, y1 = int(band[0]), int(band[-1])
+            columns = np.flatnonzero(changed[y0: y1 + 1].any(axis=0))
+            x0, x1 = int(columns[0]), int(columns[-1])
+            rects.append((x0, y0, x1 - x0 + 1, y1 - y0 + 1))
+        return rects
@@ -1,19 +1,46 @@
 # Matrix model
 from __future__ import annotations
-import datetime
 import logging
 import os
 import orjson as json
-from typing import Union
-from typing_extensions import TypedDict
+import struct
+from typing import Optional, Union
+from typing_extensions import NotRequired, TypedDict
 from enum import Enum
 
+from models.animation import (
+    ANIMATION_STREAM_THRESHOLD,
+    AnimationCache,
+    CompiledAnimation,
+    StreamedAnimation,
+)
+from models.animation_file import ANIMATION_EXTENSION, AnimationFile
+from models.clock import Clock, ClockFace
+from models.compositor import Compositor, LayerRequest, RemoveLayer
+from models.framebuffer import Framebuffer
+from models.saved_matrix import SavedMatrixCache
+from models.scheduler import FrameScheduler
+from models.scroller import Scroll, Scroller
+
+saved_animations_path = "saved-animations"
+# Where animations were looked for before the driver and server agreed on a path
+legacy_saved_animations_path = "saved_animations"
+
 
 class DATA_TYPE(Enum):
     MATRIX = "matrix"
     LOAD_MATRIX = "load_matrix"
     ANIMATION = "animation"
     LOAD_ANIMATION = "load_animation"
+    FRAME = "frame"
+    FRAME_DELTA = "frame_delta"
+    CLOCK = "clock"
+    LAYER = "layer"
+    REMOVE_LAYER = "remove_layer"
+    PACKED_ANIMATION = "packed_animation"
+    SCROLL = "scroll"
+    BATCH = "batch"
+    BRIGHTNESS = "brightness"
 
 
 # Pixel model
@@ -32,6 +59,7 @@ class Matrix(TypedDict):
 class LoadMatrix(TypedDict):
     brightness: int
     timestamp: str
+    hash: NotRequired[str]  # Blob with the matrix's pixels
 
 
 # Frame model
@@ -53,27 +81,138 @@ class LoadAnimation(TypedDict):
     timestamp: str
 
 
+# Raw frame model, decoded from a binary FRAME message
+class RawFrame(TypedDict):
+    framebuffer: Framebuffer
+    width: int
+    height: int
+    brightness: int
+    sequence: int  # Set by the server so later deltas can refer to this frame
+
+
+# Frame delta model, dirty rectangles to apply on top of the current raw frame
+class FrameDelta(TypedDict):
+    rects: list[tuple[int, int, int, int, bytes]]  # x, y, width, height, RGB888
+    width: int
+    height: int
+    brightness: int
+    sequence: int
+    base_sequence: int
+
+
+# Packed animation model, decoded from a binary ANIMATION message
+class PackedAnimation(TypedDict):
+    animation_file: AnimationFile
+
+
+# Brightness model, sets the panel's brightness and leaves what is shown as it is
+class Brightness(TypedDict):
+    brightness: int
+
+
 # Action request model
 class ActionRequest(TypedDict):
     data_type: DATA_TYPE
-    data: Union[Matrix, Animation, LoadMatrix, LoadAnimation]
+    data: Union[
+        Matrix,
+        Animation,
+        LoadMatrix,
+        LoadAnimation,
+        RawFrame,
+        FrameDelta,
+        Clock,
+        LayerRequest,
+        RemoveLayer,
+        PackedAnimation,
+        Scroll,
+        Batch,
+        Brightness,
+    ]
+
+
+# Batch model, requests applied one after the other before the next frame is drawn
+class Batch(TypedDict):
+    requests: list[ActionRequest]
 
 
 class CurrentAction:
-    def __init__(self, action: DATA_TYPE, data: Union[Matrix, Animation]) -> None:
+    def __init__(
+        self,
+        action: DATA_TYPE,
+        data: Union[Matrix, Animation],
+        width: int = 64,
+        height: int = 32,
+    ) -> None:
         self.action: DATA_TYPE = action
-        self.data: Union[Matrix, Animation] = data
+        self.data: Union[Matrix, Animation, RawFrame] = data
+        self.width: int = width
+        self.height: int = height
         self.current_frame: int = 0
-        self.time_to_change_frame: datetime.datetime = datetime.datetime.now()
-        self.last_handled_action_request: bytes = b""
+        # What is currently shown, built from the pixel lists on first use
+        self.framebuffer: Optional[Framebuffer] = None
+        # Rectangles of the raw frame changed since the render loop last drew it,
+        # None when the whole frame has to be redrawn
+        self.dirty_rects: Optional[list[tuple[int, int, int, int]]] = None
+
+        # Animation being played and when its frames are due, saved ones are cached by id
+        self.animation: Optional[Union[CompiledAnimation, StreamedAnimation]] = None
+        self.scheduler: Optional[FrameScheduler] = None
+        self.animation_cache: AnimationCache = AnimationCache()
+        self.saved_matrices: SavedMatrixCache = SavedMatrixCache(width, height)
+        # Time drawn on the driver, only the glyphs that change are drawn each tick
+        self.clock: Optional[ClockFace] = None
+        # Text or an image scrolled by the driver, a window of it copied each step
+        self.scroller: Optional[Scroller] = None
+        # Layers blended with whatever is shown, they stay when it changes
+        self.compositor: Compositor = Compositor(width, height)
+        # Brightness of the panel from 0 to 100, set by every request carrying one
+        self.brightness: int = 80
 
     def change_action(
         self,
         action: DATA_TYPE,
-        data: Union[Matrix, Animation, LoadMatrix, LoadAnimation],
+        data: Union[
+            Matrix,
+            Animation,
+            LoadMatrix,
+            LoadAnimation,
+            RawFrame,
+            FrameDelta,
+            Clock,
+            LayerRequest,
+            RemoveLayer,
+            PackedAnimation,
+            Scroll,
+            Batch,
+            Brightness,
+        ],
     ) -> None:
         logging.info(f"Changing action to {action}")
 
+        if action == DATA_TYPE.BATCH.value:
+            for request in data["requests"]:
+                self.change_action(request["data_type"], request["data"])
+            return
+
+        if isinstance(data, dict) and "brightness" in data:
+            try:
+                self.brightness = min(max(int(data["brightness"]), 0), 100)
+            except (TypeError, ValueError):
+                logging.warning(f"Ignoring invalid brightness {data['brightness']}")
+
+        if action == DATA_TYPE.BRIGHTNESS.value:
+            return
+
+        if action == DATA_TYPE.FRAME_DELTA.value:
+            self.apply_delta(data)
+            return
+
+        self.dirty_rects = None
+
+        if action in [DATA_TYPE.LAYER.value, DATA_TYPE.REMOVE_LAYER.value]:
+            self.update_layers(action, data)
+            return
+
         if action in [DATA_TYPE.LOAD_MATRIX.value, DATA_TYPE.LOAD_ANIMATION.value]:
             # Got a request to load from saved files, let's convert it
             if self.convert_action(action, data):
@@ -84,31 +223,136 @@ class CurrentAction:
             logging.warn("Failed to convert action")
             return
 
+        if action == DATA_TYPE.ANIMATION.value:
+            try:
+                animation = CompiledAnimation.from_frames(
+                    data["frames"], self.width, self.height, loop=bool(data["loop"])
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logging.warning(f"Ignoring invalid animation: {e}")
+                return
+
+        if action == DATA_TYPE.PACKED_ANIMATION.value:
+            animation = self._open_animation(data["animation_file"], "from message")
+            if animation is None:
+                return
+
+        if action == DATA_TYPE.CLOCK.value:
+            try:
+                clock = ClockFace(data, self.width, self.height)
+            except (KeyError, TypeError, ValueError) as e:
+                logging.warning(f"Ignoring invalid clock: {e}")
+                return
+
+        if action == DATA_TYPE.SCROLL.value:
+            try:
+                scroller = Scroller(data, self.width, self.height)
+            except (KeyError, TypeError, ValueError) as e:
+                logging.warning(f"Ignoring invalid scroll: {e}")
+                return
+
         self.data = data
         self.current_frame = 0
+        self.framebuffer = None
+        self.animation = None
+        self.scheduler = None
+        self.clock = None
+        self.scroller = None
 
         # Got a request to set the matrix or animation
         # Convert action to DATA_TYPE
         match action:
             case DATA_TYPE.MATRIX.value:
                 self.action = DATA_TYPE.MATRIX
-                self.time_to_change_frame = datetime.datetime.now()
-            case DATA_TYPE.ANIMATION.value:
-                self.action = DATA_TYPE.ANIMATION
-                self.time_to_change_frame = (
-                    datetime.datetime.now()
-                    + datetime.timedelta(
-                        milliseconds=self.data["frames"][self.current_frame][
-                            "frame_length"
-                        ]
-                    )
-                )
+            case DATA_TYPE.FRAME.value:
+                self.action = DATA_TYPE.FRAME
+                # Later deltas are applied to this framebuffer in place
+                self.framebuffer = data["framebuffer"]
+            case DATA_TYPE.ANIMATION.value | DATA_TYPE.PACKED_ANIMATION.value:
+                self.play_animation(animation, animation.loop)
+            case DATA_TYPE.CLOCK.value:
+                self.action = DATA_TYPE.CLOCK
+                self.clock = clock
+                clock.update()
+                # Drawn in place from now on, like raw frames
+                self.framebuffer = clock.framebuffer
+            case DATA_TYPE.SCROLL.value:
+                self.action = DATA_TYPE.SCROLL
+                self.scroller = scroller
+                scroller.update()
+                self.framebuffer = scroller.framebuffer
+
+    # Start playing an animation from its first frame
+    def play_animation(
+        self, animation: Union[CompiledAnimation, StreamedAnimation], loop: bool
+    ) -> bool:
+        try:
+            framebuffer = animation.get_frame(0)
+            animation.prefetch(0)
+        except (ValueError, struct.error) as e:
+            logging.warning(f"Failed to decode animation: {e}")
+            return False
+
+        self.action = DATA_TYPE.ANIMATION
+        self.animation = animation
+        self.scheduler = FrameScheduler(animation.frame_lengths, loop)
+        self.scheduler.start()
+        self.current_frame = 0
+        self.framebuffer = framebuffer
+        self.dirty_rects = None
+        return True
+
+    # Apply dirty rectangles on top of the raw frame being shown
+    def apply_delta(self, delta: FrameDelta) -> None:
+        if self.action != DATA_TYPE.FRAME:
+            logging.warning("Ignoring frame delta, not showing a raw frame")
+            return
+
+        for x, y, rect_width, rect_height, pixels in delta["rects"]:
+            self.framebuffer.set_rect(x, y, rect_width, rect_height, pixels)
+            if self.dirty_rects is not None:
+                self.dirty_rects.append((x, y, rect_width, rect_height))
+
+        self.data["brightness"] = delta["brightness"]
+        self.data["sequence"] = delta["sequence"]
+
+    # Add, replace or remove a layer, what is shown underneath carries on
+    def update_layers(
+        self, action: DATA_TYPE, data: Union[LayerRequest, RemoveLayer]
+    ) -> None:
+        if action == DATA_TYPE.REMOVE_LAYER.value:
+            if not self.compositor.remove_layer(data["name"]):
+                logging.warning(f"No layer named {data['name']} to remove")
+            return
+
+        try:
+            self.compositor.set_layer(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Ignoring invalid layer: {e}")
+
+    # Hand the changed rectangles to the render loop and start tracking afresh
+    def take_dirty_rects(self) -> Optional[list[tuple[int, int, int, int]]]:
+        dirty_rects, self.dirty_rects = self.dirty_rects, []
+        return dirty_rects
 
     def convert_action(
         self, action: DATA_TYPE, data: Union[LoadMatrix, LoadAnimation]
     ) -> bool:
         if action == DATA_TYPE.LOAD_MATRIX.value:
-            # Attempt to load matrix from file
+            # Saved matrices are blobs named by their hash, decoded ones are cached
+            if "hash" in data:
+                framebuffer = self.saved_matrices.load(data["hash"])
+                if framebuffer is None:
+                    return False
+
+                self.action = DATA_TYPE.MATRIX
+                self.data = data
+                self.framebuffer = framebuffer
+                self.animation = None
+                self.scheduler = None
+                return True
+
+            # Attempt to load matrix from file, as saved before there were blobs
             try:
                 with open(f"saved-matrices/{data['timestamp']}.json", "r") as f:
                     matrix = json.loads(f.read())
@@ -130,113 +374,233 @@ class CurrentAction:
 
             self.action = DATA_TYPE.MATRIX
             self.data = matrix
+            self.framebuffer = None
+            self.animation = None
+            self.scheduler = None
             return True
 
         if action == DATA_TYPE.LOAD_ANIMATION.value:
             # Attempt to load animation from file
-
-            # Validate that the animation folder exists
-            if not os.path.exists(f"saved_animations/{data['timestamp']}"):
+            animation = self._load_animation(data["timestamp"])
+            if animation is None:
                 return False
 
-            # Find how many frames there are for the animation in the directory
-            frame_count = 0
-            while os.path.exists(
-                f"saved_animations/{data['timestamp']}/{frame_count}.json"
+            # The saved loop setting comes with the frames, requests can override it
+            if not self.play_animation(
+                animation, bool(data.get("loop", animation.loop))
             ):
-                frame_count += 1
-
-            # Escape if there aren't any frames
-            if frame_count == 0:
                 return False
-
-            # Loop over frames and build animation
-            frames = []
-            for frame_index in range(frame_count):
-                with open(
-                    f"saved_animations/{data['timestamp']}/{frame_index}.json", "r"
-                ) as f:
-                    frame = json.loads(f.read())
-                    frames.append(frame)
-
-            built_animation = Animation(frames=frames, loop=False)
-
-            # Load meta file
-            try:
-                with open(f"saved_animations/{data['timestamp']}/meta.json", "r") as f:
-                    meta = json.loads(f.read())
-                    built_animation["loop"] = meta["loop"]
-            except FileNotFoundError:
-                logging.warn(
-                    f"Failed to load meta file for animation {data['timestamp']}"
-                )
-
-            # Check if request overrides loop
-            if "loop" in data:
-                built_animation["loop"] = data["loop"]
-
-            self.action = DATA_TYPE.ANIMATION
-            self.data = built_animation
+            self.data = data
             return True
 
         # Unknown action
         logging.warn(f"Unknown action {action}")
         return False
 
-    def _next_frame(self) -> None:
+    # Load a saved animation. Long ones are streamed from the file, compiled frames of
+    # short ones are replayed from the cache if we've loaded the same file before.
+    def _load_animation(
+        self, timestamp: str
+    ) -> Optional[Union[CompiledAnimation, StreamedAnimation]]:
+        if os.path.basename(timestamp) != timestamp or timestamp.startswith("."):
+            return None
+
+        filename = f"{saved_animations_path}/{timestamp}{ANIMATION_EXTENSION}"
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return self._load_animation_directory(timestamp)
+
+        cache_key = (filename, stat.st_mtime_ns, self.width, self.height)
+        cached = self.animation_cache.get(cache_key)
+        if cached is not None:
+            logging.info(f"Playing cached animation {timestamp}")
+            return cached
+
+        try:
+            animation_file = AnimationFile(filename)
+        except (OSError, ValueError, struct.error) as e:
+            logging.warning(f"Failed to load animation {timestamp}: {e}")
+            return None
+
+        animation = self._open_animation(animation_file, timestamp)
+        if isinstance(animation, CompiledAnimation):
+            self.animation_cache.put(cache_key, animation)
+        return animation
+
+    # Stream long animations from their file or buffer, compile the frames of short ones
+    def _open_animation(
+        self, animation_file: AnimationFile, name: str
+    ) -> Optional[Union[CompiledAnimation, StreamedAnimation]]:
+        if (animation_file.width, animation_file.height) != (self.width, self.height):
+            logging.warning(f"Animation {name} is for a different matrix")
+            animation_file.close()
+            return None
+
+        if len(animation_file) > ANIMATION_STREAM_THRESHOLD:
+            logging.info(f"Streaming {len(animation_file)} frame animation {name}")
+            return StreamedAnimation(animation_file)
+
+        try:
+            with animation_file:
+                return CompiledAnimation(
+                    list(animation_file.frames()),
+                    animation_file.frame_lengths,
+                    self.width,
+                    self.height,
+                    loop=animation_file.loop,
+                )
+        except (ValueError, struct.error) as e:
+            logging.warning(f"Failed to load animation {name}: {e}")
+            return None
+
+    # Animations saved as a directory of frames, before the server packed them
+    def _load_animation_directory(self, timestamp: str) -> Optional[CompiledAnimation]:
+        for path in [saved_animations_path, legacy_saved_animations_path]:
+            directory = f"{path}/{timestamp}"
+            if os.path.isdir(directory):
+                break
+        else:
+            return None
+
+        # Find how many frames there are for the animation in the directory
+        frame_count = 0
+        while os.path.exists(f"{directory}/{frame_count}.json"):
+            frame_count += 1
+
+        # Escape if there aren't any frames
+        if frame_count == 0:
+            return None
+
+        # Loop over frames and build animation
+        frames = []
+        for frame_index in range(frame_count):
+            with open(f"{directory}/{frame_index}.json", "r") as f:
+                frame = json.loads(f.read())
+                frames.append(frame)
+
+        built_animation = Animation(frames=frames, loop=False)
+
+        # Load meta file
+        try:
+            with open(f"{directory}/meta.json", "r") as f:
+                meta = json.loads(f.read())
+                built_animation["loop"] = meta["loop"]
+        except FileNotFoundError:
+            logging.warn(f"Failed to load meta file for animation {timestamp}")
+
+        try:
+            return CompiledAnimation.from_frames(
+                built_animation["frames"],
+                self.width,
+                self.height,
+                loop=built_animation["loop"],
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Failed to compile animation {timestamp}: {e}")
+            return None
+
+    # Show the current frame of the animation after moving on by a number of frames
+    def _next_frame(self, steps: int) -> None:
         if self.action != DATA_TYPE.ANIMATION:
             return
 
-        self.current_frame += 1
+        self.current_frame = self.scheduler.current_frame
+
+        # The frame is compiled or decoded ahead already, and the render loop only has
+        # to redraw what changed in every frame we moved through since the one on screen
+        try:
+            self.framebuffer = self.animation.get_frame(self.current_frame)
+            if self.dirty_rects is not None and steps >= len(self.animation):
+                self.dirty_rects = None
+            elif self.dirty_rects is not None:
+                for step in range(steps):
+                    self.dirty_rects = self.dirty_rects + self.animation.get_dirty_rects(
+                        (self.current_frame - step) % len(self.animation)
+                    )
 
-        # Check if we need to loop the animation
-        if self.current_frame >= len(self.data["frames"]):
-            if not self.data["loop"]:
-                # We're not looping so keep on the last frame
-                self.current_frame = len(self.data["frames"]) - 1
-                self.time_to_change_frame = (
-                    datetime.datetime.now() + datetime.timedelta(seconds=3600)
-                )
-                return
+            # Get the next few frames ready while we wait for them
+            self.animation.prefetch(self.current_frame)
+        except (ValueError, struct.error) as e:
+            # A damaged file, keep showing what we have
+            logging.error(f"Failed to decode animation frame {self.current_frame}: {e}")
+            self.scheduler.stop()
 
-            # loop back to start
-            self.current_frame = 0
+    def loop(self) -> None:
+        self._tick_layers()
 
-        # Set time to change frame
-        self.time_to_change_frame = datetime.datetime.now() + datetime.timedelta(
-            milliseconds=self.data["frames"][self.current_frame]["frame_length"]
-        )
+        if self.action == DATA_TYPE.CLOCK:
+            self._tick_clock()
+            return
+
+        if self.action == DATA_TYPE.SCROLL:
+            self._tick_scroll()
+            return
 
-    def loop(self) -> None:
-        # Only animations needs a loop atm
         if self.action != DATA_TYPE.ANIMATION:
             return
 
         # Check if it's time to change frame
-        if datetime.datetime.now() < self.time_to_change_frame:
+        steps = self.scheduler.advance()
+        if steps == 0:
             return
 
-        logging.info(f"Changing frame! Current frame: {self.current_frame}")
+        logging.info(f"Changing frame! Current frame: {self.scheduler.current_frame}")
         # Change frame
-        self._next_frame()
-
-    def get_matrix(self) -> Matrix:
-        # Return matrix if it's not an animation
-        if self.action != DATA_TYPE.ANIMATION:
-            return self.data
+        self._next_frame(steps)
+
+    # Redraw the digits that changed, the render loop only redraws them as well
+    def _tick_clock(self) -> None:
+        rects = self.clock.update()
+        if rects and self.dirty_rects is not None:
+            self.dirty_rects = self.dirty_rects + rects
+
+    # Move the scroll on to where it should be by now, only its rows are redrawn
+    def _tick_scroll(self) -> None:
+        rects = self.scroller.update()
+        if rects and self.dirty_rects is not None:
+            self.dirty_rects = self.dirty_rects + rects
+
+    # Expire layers and update clocks on them, a layer going away changes all of it
+    def _tick_layers(self) -> None:
+        if not self.compositor:
+            return
 
-        # Return current animation frame
-        return self.data["frames"][self.current_frame]["data"]
+        rects = self.compositor.tick()
+        if rects is None:
+            self.dirty_rects = None
+        elif rects and self.dirty_rects is not None:
+            self.dirty_rects = self.dirty_rects + rects
+
+    # Seconds until the next animation frame, clock tick or layer change is due, None
+    # if nothing is scheduled
+    def get_time_until_next_frame(self) -> Optional[float]:
+        times = [self.compositor.get_time_until_next_update()]
+        if self.action == DATA_TYPE.CLOCK:
+            times.append(self.clock.get_time_until_next_update())
+        elif self.action == DATA_TYPE.SCROLL:
+            times.append(self.scroller.get_time_until_next_update())
+        elif self.action == DATA_TYPE.ANIMATION:
+            times.append(self.scheduler.get_time_until_next_frame())
+
+        return min((seconds for seconds in times if seconds is not None), default=None)
+
+    def get_matrix(self) -> Union[Matrix, RawFrame, Animation, LoadAnimation]:
+        return self.data
+
+    # Framebuffer of what should be shown right now, pixel lists are converted once
+    # and animation frames when the animation arrives. Layers are blended in only
+    # when they or what is under them changed.
+    def get_framebuffer(self) -> Framebuffer:
+        if self.framebuffer is None:
+            self.framebuffer = Framebuffer.from_pixels(
+                self.data["pixels"], self.width, self.height
+            )
+        return self.compositor.compose(self.framebuffer)
 
     def get_action_type(self) -> DATA_TYPE:
         return self.action
 
-    def get_last_handled_action_request(self) -> bytes:
-        return self.last_handled_action_request
-
-    def set_last_handled_action_request(self, request: bytes) -> None:
-        self.last_handled_action_request = request
-
     def serialize_current_action(self) -> str:
         return json.dumps(self.__dict__)
 
@@ -249,17 +613,29 @@ class PixelCanvas:
         self.width: int = width
         self.height: int = height
         self.brightness: int = brightness
-        self.pixels: list[Pixel] = pixels
+        self.framebuffer: Framebuffer = Framebuffer.from_pixels(pixels, width, height)
+        # Parts of the framebuffer that changed since it was last drawn, None for all of it
+        self.dirty_rects: Optional[list[tuple[int, int, int, int]]] = None
 
     def set_pixel(self, pixel: Pixel) -> None:
-        # Find index of pixel in self.pixels
-        for index, _pixel in enumerate(self.pixels):
-            if _pixel["position"] == pixel["position"]:
-                self.pixels[index] = pixel
-                return
+        self.framebuffer.set_pixel(pixel["position"][0], pixel["position"][1], pixel["rgb"])
 
     def get_pixels(self) -> list[Pixel]:
-        return self.pixels
+        return self.framebuffer.to_pixels()
+
+    def get_framebuffer(self) -> Framebuffer:
+        return self.framebuffer
+
+    def get_dirty_rects(self) -> Optional[list[tuple[int, int, int, int]]]:
+        return self.dirty_rects
+
+    def set_framebuffer(
+        self,
+        framebuffer: Framebuffer,
+        dirty_rects: Optional[list[tuple[int, int, int, int]]] = None,
+    ) -> None:
+        self.framebuffer = framebuffer
+        self.dirty_rects = dirty_rects
 
     def set_brightness(self, brightness: int) -> None:
         self.brightness = brightness
@@ -268,17 +644,41 @@ class PixelCanvas:
         self.width = other.width
         self.height = other.height
         self.brightness = other.brightness
-        self.pixels = other.pixels.copy()
+        # Snapshot the frame, it may be updated in place by deltas
+        self.framebuffer = other.framebuffer.copy()
+        self.dirty_rects = None
 
     def set_pixels(self, pixels: list[Pixel]) -> None:
-        self.pixels = pixels
+        self.framebuffer = Framebuffer.from_pixels(pixels, self.width, self.height)
+        self.dirty_rects = None
 
     def serialize_canvas(self) -> str:
-        return json.dumps(self.__dict__)
+        return json.dumps(
+            {
+                "width": self.width,
+                "height": self.height,
+                "brightness": self.brightness,
+                "pixels": self.get_pixels(),
+            }
+        )
 
-    def get_hash(self) -> str:
-        return hash(self.serialize_canvas())
+    # Changes whenever the framebuffer is mutated or replaced, or the brightness changes
+    def get_version(self) -> tuple[int, int]:
+        return (self.framebuffer.version, self.brightness)
+
+    # Whether this canvas shows the same thing as another. Equal versions are an O(1)
+    # match, otherwise the cached framebuffer digests catch identical frames that
+    # were sent again.
+    def matches(self, other: PixelCanvas) -> bool:
+        if self.get_version() == other.get_version():
+            return True
+        if (self.width, self.height, self.brightness) != (
+            other.width,
+            other.height,
+            other.brightness,
+        ):
+            return False
+        return self.framebuffer.digest() == other.framebuffer.digest()
 
     def clear_canvas(self) -> None:
-        for index, _pixel in enumerate(self.pixels):
-            self.pixels[index]["rgb"] = [0, 0, 0]
+        self.framebuffer.clear()
@@ -0,0 +1,264 @@
+# Wire protocol shared with the server (see server/models/protocol.py)
+import struct
+from enum import IntEnum
+
+import numpy as np
+
+from models.animation_file import AnimationFile
+from models.framebuffer import Framebuffer
+from models.matrix import FrameDelta, PackedAnimation, RawFrame
+
+# Every framed message starts with this magic, anything else is treated as a
+# legacy "4 byte length + JSON" request
+PROTOCOL_MAGIC = b"LC"
+PROTOCOL_VERSION = 1
+
+# Magic, version, message type, request id, payload length
+HEADER = struct.Struct(">2sBBII")
+
+# Status code sent back as the first 4 bytes of a response payload, anything
+# after it is a message specific body
+STATUS = struct.Struct(">I")
+
+# Frame version, pixel format, width, height, brightness, palette entries, sequence
+FRAME_HEADER = struct.Struct(">BBHHBHI")
+FRAME_VERSION = 2
+
+# Version 1 frames have no sequence number and can't be the base of a delta
+FRAME_HEADER_V1 = struct.Struct(">BBHHBH")
+
+# Delta version, width, height, brightness, sequence, base sequence, rectangle count
+DELTA_HEADER = struct.Struct(">BHHBIIH")
+DELTA_VERSION = 1
+
+# x, y, width, height of a dirty rectangle, followed by its RGB888 pixels
+RECT_HEADER = struct.Struct(">HHHH")
+
+# Status we answer a delta with when we don't hold the frame it is based on
+STATUS_STALE_BASE = 409
+
+# Live frames sent over UDP start with their own magic. Magic, version,
+# brightness, frame sequence, width, height and the offset of the RGB888 bytes
+# that follow in the frame.
+DATAGRAM_MAGIC = b"LD"
+DATAGRAM_VERSION = 1
+DATAGRAM_HEADER = struct.Struct(">2sBBIHHI")
+
+# Pixel bytes per datagram, every datagram of a frame but the last is this long
+DATAGRAM_PAYLOAD_SIZE = 1440
+
+# Message type and payload length of every message in a batch, followed by its
+# payload
+BATCH_ENTRY = struct.Struct(">BI")
+
+# Upper bound on a single payload so a corrupt header can't make us allocate GBs
+MAX_PAYLOAD_LENGTH = 64 * 1024 * 1024
+
+
+class MESSAGE_TYPE(IntEnum):
+    JSON = 1
+    RESPONSE = 2
+    # Capability negotiation, answered with the pixel formats we decode
+    HELLO = 3
+    # Binary framebuffer, see decode_frame
+    FRAME = 4
+    # Dirty rectangles applied on top of a previous frame, see decode_delta
+    FRAME_DELTA = 5
+    # A whole animation packed the same way as animation files, see
+    # decode_animation
+    ANIMATION = 6
+    # Messages applied together, with no frame shown between them, see decode_batch
+    BATCH = 7
+
+
+class PIXEL_FORMAT(IntEnum):
+    RGB888 = 1
+    RGB565 = 2
+    # One byte per pixel indexing into an RGB888 palette sent in front of the pixels
+    PALETTE = 3
+
+
+PIXEL_FORMAT_NAMES: dict[PIXEL_FORMAT, str] = {
+    PIXEL_FORMAT.RGB888: "rgb888",
+    PIXEL_FORMAT.RGB565: "rgb565",
+    PIXEL_FORMAT.PALETTE: "palette",
+}
+
+# Optional features we advertise in our HELLO response
+FEATURE_DELTA = "delta"
+FEATURE_ANIMATION = "animation"
+FEATURE_BATCH = "batch"
+
+
+# Decode a FRAME payload into a framebuffer
+def decode_frame(payload: bytes) -> RawFrame:
+    if len(payload) < FRAME_HEADER_V1.size:
+        raise ValueError("Frame is shorter than its header")
+
+    match payload[0]:
+        case 1:
+            version, pixel_format, width, height, brightness, palette_length = (
+                FRAME_HEADER_V1.unpack_from(payload)
+            )
+            sequence = 0
+            header_size = FRAME_HEADER_V1.size
+        case 2:
+            if len(payload) < FRAME_HEADER.size:
+                raise ValueError("Frame is shorter than its header")
+            (
+                version,
+                pixel_format,
+                width,
+                height,
+                brightness,
+                palette_length,
+                sequence,
+            ) = FRAME_HEADER.unpack_from(payload)
+            header_size = FRAME_HEADER.size
+        case version:
+            raise ValueError(f"Unsupported frame version {version}")
+
+    pixel_count = width * height
+    view = memoryview(payload)[header_size:]
+
+    match pixel_format:
+        case PIXEL_FORMAT.RGB888:
+            if len(view) != pixel_count * 3:
+                raise ValueError("RGB888 frame has the wrong length")
+            # The whole decode is this one copy
+            pixels = np.frombuffer(view, dtype=np.uint8).reshape((height, width, 3)).copy()
+        case PIXEL_FORMAT.RGB565:
+            if len(view) != pixel_count * 2:
+                raise ValueError("RGB565 frame has the wrong length")
+            packed = np.frombuffer(view, dtype=">u2").reshape((height, width))
+            pixels = np.empty((height, width, 3), dtype=np.uint8)
+            pixels[:, :, 0] = (packed >> 8) & 0xF8
+            pixels[:, :, 1] = (packed >> 3) & 0xFC
+            pixels[:, :, 2] = (packed << 3) & 0xF8
+        case PIXEL_FORMAT.PALETTE:
+            if palette_length == 0 or palette_length > 256:
+                raise ValueError("Palette frame has an invalid palette")
+            if len(view) != palette_length * 3 + pixel_count:
+                raise ValueError("Palette frame has the wrong length")
+            palette = np.frombuffer(
+                view[: palette_length * 3], dtype=np.uint8
+            ).reshape((palette_length, 3))
+            indices = np.frombuffer(view[palette_length * 3:], dtype=np.uint8)
+            if pixel_count and indices.max() >= palette_length:
+                raise ValueError("Palette frame references a missing colour")
+            pixels = palette[indices].reshape((height, width, 3))
+        case _:
+            raise ValueError(f"Unknown pixel format {pixel_format}")
+
+    return RawFrame(
+        framebuffer=Framebuffer(width, height, pixels),
+        width=width,
+        height=height,
+        brightness=brightness,
+        sequence=sequence,
+    )
+
+
+# Decode a FRAME_DELTA payload into its dirty rectangles
+def decode_delta(payload: bytes) -> FrameDelta:
+    if len(payload) < DELTA_HEADER.size:
+        raise ValueError("Delta is shorter than its header")
+
+    version, width, height, brightness, sequence, base_sequence, rect_count = (
+        DELTA_HEADER.unpack_from(payload)
+    )
+    if version != DELTA_VERSION:
+        raise ValueError(f"Unsupported delta version {version}")
+
+    view = memoryview(payload)
+    offset = DELTA_HEADER.size
+    rects = []
+    for _ in range(rect_count):
+        if len(view) < offset + RECT_HEADER.size:
+            raise ValueError("Delta is missing a rectangle")
+        x, y, rect_width, rect_height = RECT_HEADER.unpack_from(view, offset)
+        offset += RECT_HEADER.size
+
+        if x + rect_width > width or y + rect_height > height:
+            raise ValueError("Delta rectangle is out of bounds")
+
+        length = rect_width * rect_height * 3
+        if len(view) < offset + length:
+            raise ValueError("Delta rectangle is missing pixels")
+        rects.append((x, y, rect_width, rect_height, bytes(view[offset: offset + length])))
+        offset += length
+
+    if offset != len(view):
+        raise ValueError("Delta has trailing bytes")
+
+    return FrameDelta(
+        rects=rects,
+        width=width,
+        height=height,
+        brightness=brightness,
+        sequence=sequence,
+        base_sequence=base_sequence,
+    )
+
+
+# Decode an ANIMATION payload, its frames are decoded when it is played
+def decode_animation(payload: bytes) -> PackedAnimation:
+    try:
+        animation_file = AnimationFile(buffer=payload)
+    except struct.error as e:
+        raise ValueError(f"Animation is truncated: {e}")
+    return PackedAnimation(animation_file=animation_file)
+
+
+# Decode the header of a live frame datagram. Returns brightness, sequence,
+# width, height, offset and the pixel bytes it carries.
+def decode_datagram(
+    packet: bytes,
+) -> tuple[int, int, int, int, int, memoryview]:
+    if len(packet) < DATAGRAM_HEADER.size:
+        raise ValueError("Datagram is shorter than its header")
+
+    magic, version, brightness, sequence, width, height, offset = (
+        DATAGRAM_HEADER.unpack_from(packet)
+    )
+    if magic != DATAGRAM_MAGIC or version != DATAGRAM_VERSION:
+        raise ValueError("Not a frame datagram")
+
+    # Frames are split into whole chunks, so no two datagrams of one frame overlap
+    pixels = memoryview(packet)[DATAGRAM_HEADER.size:]
+    frame_length = width * height * 3
+    if offset % DATAGRAM_PAYLOAD_SIZE or offset >= frame_length:
+        raise ValueError("Datagram is outside its frame")
+    if len(pixels) != min(DATAGRAM_PAYLOAD_SIZE, frame_length - offset):
+        raise ValueError("Datagram doesn't hold a whole chunk of its frame")
+    return (brightness, sequence, width, height, offset, pixels)
+
+
+# Split a BATCH payload into the type and payload of each message in it
+def decode_batch(payload: bytes) -> list[tuple[int, bytes]]:
+    messages = []
+    offset = 0
+    while offset < len(payload):
+        if offset + BATCH_ENTRY.size > len(payload):
+            raise ValueError("Batch is truncated")
+        message_type, length = BATCH_ENTRY.unpack_from(payload, offset)
+        offset += BATCH_ENTRY.size
+        if offset + length > len(payload):
+            raise ValueError("Batch is truncated")
+        messages.append((message_type, payload[offset: offset + length]))
+        offset += length
+    return messages
+
+
+def encode_response(request_id: int, status: int, body: bytes = b"") -> bytes:
+    payload = STATUS.pack(status) + body
+    return (
+        HEADER.pack(
+            PROTOCOL_MAGIC,
+            PROTOCOL_VERSION,
+            MESSAGE_TYPE.RESPONSE,
+            request_id,
+            len(payload),
+        )
+        + payload
+    )
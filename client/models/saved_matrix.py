@@ -0,0 +1,54 @@
+# Saved matrices, stored by the server as content addressed blobs of packed RGB888
+# (see server/models/matrix_store.py)
+import logging
+import os
+import string
+from collections import OrderedDict
+from typing import Optional
+
+from models.framebuffer import Framebuffer
+
+saved_matrices_path = "saved-matrices"
+BLOB_DIRECTORY = "blobs"
+BLOB_EXTENSION = ".rgb"
+
+# Number of decoded saved matrices kept around for loading again
+SAVED_MATRIX_CACHE_SIZE = int(os.getenv("SAVED_MATRIX_CACHE_SIZE", 16))
+
+
+# Least recently used saved matrices, keyed by the hash of their pixels. The same
+# pixels always have the same hash, so entries never go stale.
+class SavedMatrixCache:
+    def __init__(
+        self, width: int, height: int, size: int = SAVED_MATRIX_CACHE_SIZE
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.size: int = max(0, size)
+        self.framebuffers: OrderedDict[str, Framebuffer] = OrderedDict()
+
+    # Shared by everything showing this matrix, never change it in place
+    def load(self, blob_hash: str) -> Optional[Framebuffer]:
+        framebuffer = self.framebuffers.get(blob_hash)
+        if framebuffer is not None:
+            self.framebuffers.move_to_end(blob_hash)
+            return framebuffer
+
+        if not blob_hash or not all(c in string.hexdigits for c in blob_hash):
+            logging.warning(f"Invalid saved matrix hash {blob_hash}")
+            return None
+
+        try:
+            with open(
+                f"{saved_matrices_path}/{BLOB_DIRECTORY}/{blob_hash}{BLOB_EXTENSION}", "rb"
+            ) as f:
+                framebuffer = Framebuffer.from_bytes(f.read(), self.width, self.height)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Failed to load saved matrix {blob_hash}: {e}")
+            return None
+
+        if self.size > 0:
+            self.framebuffers[blob_hash] = framebuffer
+            while len(self.framebuffers) > self.size:
+                self.framebuffers.popitem(last=False)
+        return framebuffer
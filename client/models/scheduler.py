@@ -0,0 +1,152 @@
+# Animation frame timing on the monotonic clock
+import logging
+import os
+import time
+from typing import Optional
+from typing_extensions import TypedDict
+
+# Whether frames whose time has already passed are skipped to stay in sync, or
+# shown back to back until playback has caught up
+ANIMATION_SKIP_LATE_FRAMES = os.getenv(
+    "ANIMATION_SKIP_LATE_FRAMES", "true"
+).lower() in ["1", "true", "yes"]
+
+# How late a frame can be shown before it counts as late
+LATE_FRAME_TOLERANCE_NS = 2_000_000
+
+# Shortest a frame is shown for, frames of 0ms would never let playback catch up
+MIN_FRAME_LENGTH_NS = 1_000_000
+
+
+# Playback stats for one pass through an animation
+class SchedulerStats(TypedDict):
+    frames_shown: int
+    late_frames: int
+    skipped_frames: int
+    mean_jitter_ms: float  # Average time frames were shown after their deadline
+    max_jitter_ms: float
+    duration_ms: float  # Time from the first frame to the end of the last one
+    nominal_duration_ms: float
+
+
+class FrameScheduler:
+    def __init__(
+        self,
+        frame_lengths: list[int],
+        loop: bool,
+        skip_late_frames: bool = ANIMATION_SKIP_LATE_FRAMES,
+    ) -> None:
+        # Frame lengths in ms as sent, kept in ns so deadlines add up exactly
+        self.frame_lengths: list[int] = [
+            max(MIN_FRAME_LENGTH_NS, int(length * 1_000_000)) for length in frame_lengths
+        ]
+        self.loop: bool = loop
+        self.skip_late_frames: bool = skip_late_frames
+
+        self.current_frame: int = 0
+        # Absolute time the current frame is replaced, None once a non looping
+        # animation has reached its last frame
+        self.deadline: Optional[int] = None
+        self.loop_started: int = 0
+        self._reset_stats()
+
+    # Show the first frame now
+    def start(self, now: Optional[int] = None) -> None:
+        now = time.monotonic_ns() if now is None else now
+        self.current_frame = 0
+        self.loop_started = now
+        self.deadline = now + self.frame_lengths[0]
+        self._reset_stats()
+        self._record_shown(0)
+
+    # Stay on the current frame
+    def stop(self) -> None:
+        self.deadline = None
+
+    # Number of frames to move on by, each deadline follows on from the previous
+    # deadline rather than from when we noticed it so polling delays don't add up
+    def advance(self, now: Optional[int] = None) -> int:
+        now = time.monotonic_ns() if now is None else now
+        steps = 0
+
+        # At most one pass per call, so a late animation can't hold up the render loop
+        while (
+            self.deadline is not None
+            and now >= self.deadline
+            and steps < len(self.frame_lengths)
+        ):
+            due = self.deadline
+            if self.current_frame + 1 >= len(self.frame_lengths):
+                self._log_stats(now)
+                if not self.loop:
+                    # We're not looping so keep on the last frame
+                    self.deadline = None
+                    break
+                self.loop_started = due
+                self._reset_stats()
+                self.current_frame = 0
+            else:
+                self.current_frame += 1
+
+            self.deadline = due + self.frame_lengths[self.current_frame]
+            steps += 1
+
+            # Only skip a frame if the one after it is due as well, the last frame of
+            # an animation that doesn't loop stays up so it is always shown
+            final = not self.loop and self.current_frame + 1 >= len(self.frame_lengths)
+            if self.skip_late_frames and not final and now >= self.deadline:
+                self.skipped_frames += 1
+                continue
+
+            self._record_shown(now - due)
+            if not self.skip_late_frames:
+                break
+
+        # More than a whole pass behind, carry on from now rather than catching up
+        if self.skip_late_frames and self.deadline is not None and now >= self.deadline:
+            self.deadline = now + self.frame_lengths[self.current_frame]
+
+        return steps
+
+    # Seconds until the next frame is due, None if there is no next frame
+    def get_time_until_next_frame(self, now: Optional[int] = None) -> Optional[float]:
+        if self.deadline is None:
+            return None
+
+        now = time.monotonic_ns() if now is None else now
+        return max(0, self.deadline - now) / 1_000_000_000
+
+    def get_stats(self, now: Optional[int] = None) -> SchedulerStats:
+        now = time.monotonic_ns() if now is None else now
+        return SchedulerStats(
+            frames_shown=self.frames_shown,
+            late_frames=self.late_frames,
+            skipped_frames=self.skipped_frames,
+            mean_jitter_ms=self.total_lateness / max(1, self.frames_shown) / 1_000_000,
+            max_jitter_ms=self.max_lateness / 1_000_000,
+            duration_ms=(now - self.loop_started) / 1_000_000,
+            nominal_duration_ms=sum(self.frame_lengths) / 1_000_000,
+        )
+
+    def _record_shown(self, lateness: int) -> None:
+        self.frames_shown += 1
+        self.total_lateness += lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+        if lateness > LATE_FRAME_TOLERANCE_NS:
+            self.late_frames += 1
+
+    def _reset_stats(self) -> None:
+        self.frames_shown = 0
+        self.late_frames = 0
+        self.skipped_frames = 0
+        self.total_lateness = 0
+        self.max_lateness = 0
+
+    def _log_stats(self, end: int) -> None:
+        stats = self.get_stats(end)
+        logging.info(
+            f"Animation pass took {stats['duration_ms']:.1f}ms "
+            f"(nominal {stats['nominal_duration_ms']:.1f}ms), "
+            f"{stats['late_frames']} late and {stats['skipped_frames']} skipped frames, "
+            f"jitter {stats['mean_jitter_ms']:.2f}ms mean {stats['max_jitter_ms']:.2f}ms max"
+        )
@@ -0,0 +1,145 @@
+# Text or an image scrolled across the matrix by the driver, rendered once into a
+# strip that is wider than the matrix and shown a window of it at a time
+from __future__ import annotations
+import time
+from typing import TYPE_CHECKING, Literal, Optional
+from typing_extensions import NotRequired, TypedDict
+
+import numpy as np
+
+from models.font import load_font
+from models.framebuffer import Framebuffer
+
+if TYPE_CHECKING:
+    from models.matrix import Pixel
+
+DEFAULT_FONT = "7x13"
+DEFAULT_SPEED = 32
+
+# Widest content that can be scrolled, a strip this wide is a few MB
+MAX_CONTENT_WIDTH = 16384
+
+
+# Scroll model, either text or pixels of an image that can be wider than the matrix
+class Scroll(TypedDict):
+    text: NotRequired[str]
+    rgb: NotRequired[list[int]]  # Colour of the text
+    font: NotRequired[str]  # Name of a BDF font, DEFAULT_FONT if not given
+    y: NotRequired[int]  # Baseline of the text, centred if not given
+    pixels: NotRequired[list[Pixel]]
+    width: NotRequired[int]  # Width of the image, the matrix's if not given
+    background: NotRequired[list[int]]
+    speed: NotRequired[float]  # Pixels per second, DEFAULT_SPEED if not given
+    direction: NotRequired[Literal["left", "right"]]  # Left by default
+    loop: NotRequired[bool]  # Scrolls once and stays blank if false, loops by default
+
+
+class Scroller:
+    def __init__(self, scroll: Scroll, width: int, height: int) -> None:
+        self.speed: float = float(scroll.get("speed", DEFAULT_SPEED))
+        if not self.speed > 0:
+            raise ValueError("Scroll speed must be more than 0")
+        direction = scroll.get("direction", "left")
+        if direction not in ["left", "right"]:
+            raise ValueError(f"Unknown scroll direction {direction}")
+        self.leftwards: bool = direction == "left"
+        self.loop: bool = bool(scroll.get("loop", True))
+
+        background = _colour(scroll.get("background", [0, 0, 0]))
+        content = self._render_content(scroll, height, background)
+
+        # Blank the width of the matrix either side, so the content comes in from
+        # one edge and leaves by the other, and every window is a single slice
+        self.width: int = width
+        self.strip: np.ndarray = np.empty(
+            (height, content.shape[1] + 2 * width, 3), dtype=np.uint8
+        )
+        self.strip[:, :] = background
+        self.strip[:, width: width + content.shape[1]] = content
+        # Offsets go from 0 to period and wrap, windows at either end are blank
+        self.period: int = content.shape[1] + width
+
+        # Only the rows with content change as it scrolls
+        rows = np.flatnonzero((content != background).any(axis=(1, 2)))
+        self.rows: Optional[tuple[int, int]] = (
+            (int(rows[0]), int(rows[-1]) + 1) if len(rows) else None
+        )
+
+        self.framebuffer: Framebuffer = Framebuffer(width, height)
+        self.offset: Optional[int] = None
+        # Positions follow the time since the start rather than counting frames, so
+        # late frames skip ahead instead of slowing the scroll down
+        self.start: int = time.monotonic_ns()
+
+    @staticmethod
+    def _render_content(
+        scroll: Scroll, height: int, background: list[int]
+    ) -> np.ndarray:
+        if "text" in scroll:
+            font = load_font(scroll.get("font", DEFAULT_FONT))
+            rgb = _colour(scroll.get("rgb", [255, 255, 255]))
+            content_width = font.text_width(scroll["text"])
+            y = int(scroll.get("y", (height - font.height) // 2 + font.ascent))
+        elif "pixels" in scroll:
+            content_width = int(scroll.get("width", 0)) or None
+        else:
+            raise ValueError("Scroll needs text or pixels")
+
+        if content_width is None:
+            content_width = max(
+                (int(pixel["position"][0]) + 1 for pixel in scroll["pixels"]), default=0
+            )
+        if not 0 <= content_width <= MAX_CONTENT_WIDTH:
+            raise ValueError(f"Scrolled content can be at most {MAX_CONTENT_WIDTH} wide")
+
+        content = Framebuffer(content_width, height)
+        content.array[:, :] = background
+        if "text" in scroll:
+            font.draw_text(content, 0, y, rgb, scroll["text"])
+        else:
+            content.set_pixels(scroll["pixels"])
+        return content.array
+
+    # Whether a scroll that doesn't loop has gone all the way across
+    def finished(self, now: Optional[int] = None) -> bool:
+        return not self.loop and self._steps(now) >= self.period
+
+    # Show the window of the strip for the time now. Returns the rectangle that
+    # changed, an empty list if the content hasn't moved a whole pixel yet.
+    def update(self, now: Optional[int] = None) -> list[tuple[int, int, int, int]]:
+        steps = self._steps(now)
+        if not self.loop:
+            steps = min(steps, self.period)
+        offset = steps % self.period if self.leftwards else self.period - steps % self.period
+        if offset == self.offset:
+            return []
+
+        first = self.offset is None
+        self.offset = offset
+        np.copyto(self.framebuffer.array, self.strip[:, offset: offset + self.width])
+        self.framebuffer.mark_changed()
+
+        if first:
+            return [(0, 0, self.width, self.framebuffer.height)]
+        if self.rows is None:
+            return []
+        top, bottom = self.rows
+        return [(0, top, self.width, bottom - top)]
+
+    # Seconds until the content moves on by a pixel, None once it has stopped
+    def get_time_until_next_update(self, now: Optional[int] = None) -> Optional[float]:
+        now = time.monotonic_ns() if now is None else now
+        if self.finished(now):
+            return None
+        due = self.start + (self._steps(now) + 1) * 1_000_000_000 / self.speed
+        return max(0, due - now) / 1_000_000_000
+
+    def _steps(self, now: Optional[int]) -> int:
+        now = time.monotonic_ns() if now is None else now
+        return int((now - self.start) * self.speed // 1_000_000_000)
+
+
+def _colour(rgb: list[int]) -> list[int]:
+    if len(rgb) != 3:
+        raise ValueError("Colours need an [r, g, b] value")
+    return [min(max(int(value), 0), 255) for value in rgb]
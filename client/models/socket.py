@@ -1,81 +1,366 @@
+import asyncio
 import logging
 import os
 import socket
 import json
+import struct
 import threading
+import time
+from collections import deque
 from typing import Optional
 
-from models.matrix import ActionRequest
+import numpy as np
+
+from models.framebuffer import Framebuffer
+from models.matrix import ActionRequest, DATA_TYPE, RawFrame
+from models.protocol import (
+    FEATURE_ANIMATION,
+    FEATURE_BATCH,
+    FEATURE_DELTA,
+    HEADER,
+    MAX_PAYLOAD_LENGTH,
+    DATAGRAM_PAYLOAD_SIZE,
+    MESSAGE_TYPE,
+    PIXEL_FORMAT_NAMES,
+    PROTOCOL_MAGIC,
+    STATUS_STALE_BASE,
+    decode_animation,
+    decode_batch,
+    decode_datagram,
+    decode_delta,
+    decode_frame,
+    encode_response,
+)
 
 DRIVER_HOST = os.getenv("DRIVER_HOST", "0.0.0.0")
-DRIVER_PORT = os.getenv("DRIVER_PORT", 8888)
+DRIVER_PORT = int(os.getenv("DRIVER_PORT", 8888))
+
+# Requests waiting for the render loop before we stop reading from clients
+DRIVER_QUEUE_SIZE = int(os.getenv("DRIVER_QUEUE_SIZE", 32))
+
+# Port live frames are received on over UDP, not listened on if not set
+DRIVER_UDP_PORT = int(os.getenv("DRIVER_UDP_PORT", 0)) or None
+
+# Frames this far behind the newest are late and dropped, anything further back
+# is taken as a sender that restarted its sequence
+DATAGRAM_STALE_WINDOW = 64
+
+
 
 class DataReceiver(threading.Thread):
-    def __init__(self, host=DRIVER_HOST, port=DRIVER_PORT):
-        super().__init__()
+    def __init__(
+        self,
+        host=DRIVER_HOST,
+        port=DRIVER_PORT,
+        queue_size=DRIVER_QUEUE_SIZE,
+        udp_port=DRIVER_UDP_PORT,
+        width=64,
+        height=32,
+    ):
+        super().__init__(daemon=True)
         self.host = host
         self.port = port
-        self.data = None
+        self.udp_port = udp_port
+        # Size of the panel, live frames of any other size are dropped
+        self.width = width
+        self.height = height
+        # Requests waiting for the render loop, in the order they were accepted
+        self.data = deque()
+        self.queue_size = max(1, queue_size)
+        self.data_lock = threading.Lock()
+        # Wakes the render loop as soon as a request is queued
+        self.data_ready = threading.Condition(self.data_lock)
+
+        # Live frame queued for the render loop, replaced if a newer one arrives first
+        self.live_request: Optional[ActionRequest] = None
+
+        # Sequence of the raw frame the render loop will be showing once it has caught
+        # up with the queue, 0 when it is showing anything else
+        self.frame_sequence = 0
+
+        # Event loop serving the connections, and the event it waits on while the
+        # queue is full. Both only exist once the thread is running.
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.space_available: Optional[asyncio.Event] = None
 
     def run(self):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            # Open socket and wait for connections
-            s.bind((self.host, self.port))
-            s.listen()
+        # Keep listening whatever happens, a failure here would freeze the matrix
+        while True:
+            try:
+                asyncio.run(self.serve())
+            except Exception:
+                logging.exception("Receiver stopped unexpectedly, restarting")
+                time.sleep(1)
+
+    async def serve(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.space_available = asyncio.Event()
+
+        server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, reuse_address=True
+        )
+
+        # Log that we are listening
+        logging.info(f"Listening for matrix updates on {self.host}:{self.port}")
+
+        if self.udp_port is not None:
+            await self.loop.create_datagram_endpoint(
+                lambda: FrameDatagramProtocol(self),
+                local_addr=(self.host, self.udp_port),
+            )
+            logging.info(f"Listening for live frames on {self.host}:{self.udp_port}/udp")
+
+        async with server:
+            await server.serve_forever()
 
-            # Log that we are listening
-            logging.info(f"Listening for matrix updates on {self.host}:{self.port}")
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        client_ip = writer.get_extra_info("peername")
+        client_socket = writer.get_extra_info("socket")
+        if client_socket is not None:
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
-            while True:
-                #  Wait for client connection and read data
-                client_socket, client_ip = s.accept()
+        try:
+            await self.serve_connection(reader, writer, client_ip)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            logging.info(f"Connection from {client_ip} closed")
+        except OSError as e:
+            logging.warning(f"Connection from {client_ip} failed: {e}")
+        except Exception:
+            # A bad request only costs the client its connection
+            logging.exception(f"Error serving connection from {client_ip}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
 
-                # Receive the length of the incoming data
-                length = int.from_bytes(client_socket.recv(4), byteorder="big")
+    async def serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, client_ip
+    ) -> None:
+        prefix = await reader.readexactly(4)
 
-                logging.info(
-                    f"Received connection from {client_ip} and expecting {length} bytes"
+        # Legacy clients send a 4 byte length, JSON and then wait for a 4 byte status
+        if prefix[:2] != PROTOCOL_MAGIC:
+            length = int.from_bytes(prefix, byteorder="big")
+            logging.info(
+                f"Received connection from {client_ip} and expecting {length} bytes"
+            )
+            if length > MAX_PAYLOAD_LENGTH:
+                logging.error(f"Request from {client_ip} is too large ({length} bytes)")
+                return
+            payload = await reader.readexactly(length)
+            logging.info(f"Done receiving {length} bytes from {client_ip}")
+
+            status, _ = await self.handle_message(MESSAGE_TYPE.JSON, payload)
+            writer.write(int(status).to_bytes(4, byteorder="big"))
+            await writer.drain()
+            return
+
+        # Framed clients keep the connection open and may pipeline many requests,
+        # every response carries the request id it answers
+        logging.info(f"Received persistent connection from {client_ip}")
+        while True:
+            header = prefix + await reader.readexactly(HEADER.size - 4)
+            _, _, message_type, request_id, length = HEADER.unpack(header)
+            if length > MAX_PAYLOAD_LENGTH:
+                logging.error(f"Request {request_id} is too large ({length} bytes)")
+                return
+
+            payload = await reader.readexactly(length)
+            status, body = await self.handle_message(message_type, payload)
+            writer.write(encode_response(request_id, status, body))
+            # Stop reading more requests while the client isn't reading responses
+            await writer.drain()
+
+            prefix = await reader.readexactly(4)
+
+    async def handle_message(self, message_type: int, payload: bytes) -> (int, bytes):
+        match message_type:
+            case MESSAGE_TYPE.HELLO:
+                # Let the server know which binary pixel formats and features we support
+                body = json.dumps(
+                    {
+                        "formats": list(PIXEL_FORMAT_NAMES.values()),
+                        "features": [FEATURE_DELTA, FEATURE_ANIMATION, FEATURE_BATCH],
+                    }
                 )
-                chunks = []
-                bytes_received = 0
-                while bytes_received < length:
-                    chunk = client_socket.recv(min(length - bytes_received, 4096))
-                    chunks.append(chunk)
-                    bytes_received += len(chunk)
+                return (200, body.encode())
+            case MESSAGE_TYPE.FRAME:
+                try:
+                    frame = decode_frame(payload)
+                except ValueError as e:
+                    logging.error(f"Error decoding frame: {e}")
+                    return (400, b"")
 
-                logging.info(f"Done receiving {length} bytes from {client_ip}")
+                await self.wait_for_space()
+                self.set_data(
+                    {"data_type": DATA_TYPE.FRAME.value, "data": frame},
+                    frame_sequence=frame["sequence"],
+                )
+                return (200, b"")
+            case MESSAGE_TYPE.FRAME_DELTA:
+                try:
+                    delta = decode_delta(payload)
+                except ValueError as e:
+                    logging.error(f"Error decoding frame delta: {e}")
+                    return (400, b"")
+
+                # Only apply deltas on top of the exact frame they were computed from
+                await self.wait_for_space()
+                with self.data_lock:
+                    if (
+                        self.frame_sequence == 0
+                        or self.frame_sequence != delta["base_sequence"]
+                    ):
+                        return (STATUS_STALE_BASE, b"")
+                    self.data.append(
+                        {"data_type": DATA_TYPE.FRAME_DELTA.value, "data": delta}
+                    )
+                    self.frame_sequence = delta["sequence"]
+                    self.data_ready.notify()
+                return (200, b"")
+            case MESSAGE_TYPE.ANIMATION:
+                try:
+                    animation = decode_animation(payload)
+                except ValueError as e:
+                    logging.error(f"Error decoding animation: {e}")
+                    return (400, b"")
 
-                # Decode data
+                await self.wait_for_space()
+                self.set_data(
+                    {"data_type": DATA_TYPE.PACKED_ANIMATION.value, "data": animation}
+                )
+                return (200, b"")
+            case MESSAGE_TYPE.BATCH:
+                # Every message is checked before any is queued, so a batch is
+                # applied whole or not at all
                 try:
-                    input_data = json.loads(b"".join(chunks))
-                except json.decoder.JSONDecodeError:
-                    logging.error("Error decoding JSON")
-                    logging.error(b"".join(chunks))
-                    self.data = None
+                    requests = [
+                        self.decode_batch_message(batch_type, batch_payload)
+                        for batch_type, batch_payload in decode_batch(payload)
+                    ]
+                except ValueError as e:
+                    logging.error(f"Error decoding batch: {e}")
+                    return (400, b"")
+
+                await self.wait_for_space()
+                self.set_data(
+                    {"data_type": DATA_TYPE.BATCH.value, "data": {"requests": requests}}
+                )
+                return (200, b"")
+            case MESSAGE_TYPE.JSON:
+                pass
+            case _:
+                logging.error(f"Unsupported message type {message_type}")
+                return (400, b"")
+
+        # Decode data
+        try:
+            input_data = json.loads(payload)
+        except ValueError:
+            logging.error("Error decoding JSON")
+            logging.error(payload)
+            return (400, b"")
+
+        # Validate data
+        validation: (bool, str) = self.validate_request(input_data)
+        if not validation[0]:
+            logging.error(f"Error validating request: {validation[1]}")
+            return (400, b"")
+
+        logging.info(f"Successfully validated request: {validation[1]}")
+        await self.wait_for_space()
+        self.set_data(input_data)
+        return (200, b"")
+
+    # Decode a message from a batch into the request it would have queued by itself
+    def decode_batch_message(self, message_type: int, payload: bytes) -> ActionRequest:
+        match message_type:
+            case MESSAGE_TYPE.FRAME:
+                return {"data_type": DATA_TYPE.FRAME.value, "data": decode_frame(payload)}
+            case MESSAGE_TYPE.ANIMATION:
+                return {
+                    "data_type": DATA_TYPE.PACKED_ANIMATION.value,
+                    "data": decode_animation(payload),
+                }
+            case MESSAGE_TYPE.JSON:
+                request = json.loads(payload)
+                valid, reason = self.validate_request(request)
+                if not valid:
+                    raise ValueError(reason)
+                return request
+        raise ValueError(f"Unsupported message type {message_type} in a batch")
+
+    # Wait until the render loop has room for another request. Connections waiting
+    # here aren't read from, so busy clients are slowed down by TCP instead of
+    # queueing up frames we would never show in time.
+    async def wait_for_space(self) -> None:
+        while True:
+            # Cleared before checking so a wake up from get_data can't be missed
+            self.space_available.clear()
+            with self.data_lock:
+                if len(self.data) < self.queue_size:
                     return
+            await self.space_available.wait()
 
-                # Validate data
-                validation: (bool, str) = self.validate_request(input_data)
-                if not validation[0]:
-                    logging.error(f"Error validating request: {validation[1]}")
-                    client_socket.sendall(int(400).to_bytes(4, byteorder="big"))
-                    input_data = None
-                else:
-                    client_socket.sendall(int(200).to_bytes(4, byteorder="big"))
-                    logging.info(f"Successfully validated request: {validation[1]}")
+    def set_data(self, data: ActionRequest, frame_sequence: int = 0) -> None:
+        with self.data_lock:
+            self.data.append(data)
+            self.frame_sequence = frame_sequence
+            self.data_ready.notify()
 
-                # Close connection
-                client_socket.close()
+    # Queue a frame that came in over UDP. Never waits, a live frame the render loop
+    # hasn't taken yet is replaced and frames are dropped while the queue is full.
+    def set_live_frame(self, frame: RawFrame) -> bool:
+        request = {"data_type": DATA_TYPE.FRAME.value, "data": frame}
+        with self.data_lock:
+            if self.data and self.data[-1] is self.live_request:
+                self.data[-1] = request
+            elif len(self.data) < self.queue_size:
+                self.data.append(request)
+            else:
+                return False
 
-                self.data = input_data
+            self.live_request = request
+            # Deltas sent over TCP can't be based on a frame the server didn't ack
+            self.frame_sequence = 0
+            self.data_ready.notify()
+        return True
 
+    # Hand the oldest pending request over to the render loop, each is returned once
     def get_data(self) -> Optional[ActionRequest]:
-        return self.data
+        with self.data_lock:
+            if not self.data:
+                return None
+            request = self.data.popleft()
+
+        # Let a connection waiting on a full queue carry on
+        if self.loop is not None:
+            try:
+                self.loop.call_soon_threadsafe(self.space_available.set)
+            except RuntimeError:
+                # The loop is being restarted, nothing is waiting on it
+                pass
+        return request
+
+    # Block until a request is queued or the timeout (in seconds, None for no limit)
+    # passes, returns whether there is a request waiting
+    def wait_for_data(self, timeout: Optional[float] = None) -> bool:
+        with self.data_lock:
+            if not self.data:
+                self.data_ready.wait(timeout)
+            return len(self.data) > 0
 
     def validate_request(self, data) -> (bool, str):
         if data is None:
             return (False, "Data is None")
 
+        if not isinstance(data, dict):
+            return (False, "Data is not an object")
+
         # Check if data looks like ActionRequest Model
         if "data_type" not in data:
             return (False, "data_type not in data")
@@ -83,6 +368,9 @@ class DataReceiver(threading.Thread):
         if "data" not in data:
             return (False, "data not in data")
 
+        if not isinstance(data["data"], dict):
+            return (False, "data is not an object")
+
         # Validate matrix request type
         match data["data_type"]:
             case "matrix":
@@ -97,6 +385,18 @@ class DataReceiver(threading.Thread):
             case "load_animation":
                 if not self.validate_load_animation(data["data"]):
                     return (False, "data is not a valid load_animation request")
+            case "clock":
+                if not self.validate_clock(data["data"]):
+                    return (False, "data is not a valid clock request")
+            case "scroll":
+                if not self.validate_scroll(data["data"]):
+                    return (False, "data is not a valid scroll request")
+            case "layer" | "remove_layer":
+                if "name" not in data["data"]:
+                    return (False, "data is not a valid layer request")
+            case "brightness":
+                if not isinstance(data["data"].get("brightness"), int):
+                    return (False, "data is not a valid brightness request")
             case _:
                 return (False, "data_type is not valid")
         return (True, "Data is valid")
@@ -137,3 +437,81 @@ class DataReceiver(threading.Thread):
             return False
 
         return True
+
+    # Validate request to draw the time on the driver
+    def validate_clock(self, clock) -> bool:
+        if "position" not in clock:
+            return False
+
+        if "rgb" not in clock:
+            return False
+
+        return True
+
+    # Validate request to scroll text or an image
+    def validate_scroll(self, scroll) -> bool:
+        return "text" in scroll or "pixels" in scroll
+
+
+# Reassembles live frames from datagrams, see decode_datagram. Only the newest
+# frame is kept, one that is late or still missing packets when the next starts
+# is dropped rather than waited for.
+class FrameDatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, receiver: DataReceiver) -> None:
+        self.receiver = receiver
+        # Sequence of the frame being assembled, or shown if it is complete
+        self.sequence: Optional[int] = None
+        self.brightness: int = 0
+        self.pixels: Optional[np.ndarray] = None
+        # Offsets of the chunks of the frame received so far, and how many are left
+        self.offsets: set[int] = set()
+        self.missing: int = 0
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            brightness, sequence, width, height, offset, pixels = decode_datagram(data)
+        except (ValueError, struct.error) as e:
+            logging.debug(f"Ignoring datagram from {addr}: {e}")
+            return
+
+        if (width, height) != (self.receiver.width, self.receiver.height):
+            logging.debug(f"Ignoring datagram from {addr} for a {width}x{height} frame")
+            return
+
+        if sequence != self.sequence:
+            # Serial number arithmetic, so the sequence can wrap around
+            if self.sequence is not None:
+                behind = (self.sequence - sequence) & 0xFFFFFFFF
+                if behind < DATAGRAM_STALE_WINDOW:
+                    return
+                if self.missing:
+                    logging.info(f"Dropping incomplete live frame {self.sequence}")
+
+            frame_length = width * height * 3
+            self.sequence = sequence
+            self.brightness = brightness
+            self.pixels = np.zeros(frame_length, dtype=np.uint8)
+            self.offsets = set()
+            self.missing = -(-frame_length // DATAGRAM_PAYLOAD_SIZE)
+        elif brightness != self.brightness:
+            return
+
+        if not self.missing or offset in self.offsets:
+            return
+        self.pixels[offset: offset + len(pixels)] = np.frombuffer(pixels, dtype=np.uint8)
+        self.offsets.add(offset)
+        self.missing -= 1
+        if self.missing:
+            return
+
+        framebuffer = Framebuffer(width, height, self.pixels.reshape((height, width, 3)))
+        self.pixels = None
+        frame = RawFrame(
+            framebuffer=framebuffer,
+            width=width,
+            height=height,
+            brightness=brightness,
+            sequence=0,
+        )
+        if not self.receiver.set_live_frame(frame):
+            logging.info(f"Dropping live frame {sequence}, the render loop is behind")
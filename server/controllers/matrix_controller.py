@@ -1,27 +1,67 @@
 # For if we're emulating an LED
+import asyncio
 import math
 import orjson as json
 import logging
 import os
 import random
-import socket
-from threading import Lock
+from typing import Optional
 
-from fastapi import HTTPException
+from fastapi import HTTPException, WebSocket
+from fastapi.concurrency import run_in_threadpool
 
 # For a live local LED
-from models.matrix import Pixel, Canvas, Animation
+from models.animation_file import (
+    ANIMATION_EXTENSION,
+    encode_animation,
+    import_animation_directory,
+    write_animation,
+)
+from models.driver_connection import DriverDatagrams, DriverPool
+from models.framebuffer import Framebuffer
+from models.image import ImageOptions, load_gif, load_image
+from models.matrix import (
+    Animation,
+    Batch,
+    Canvas,
+    Clock,
+    Layer,
+    Pixel,
+    Scroll,
+    decode_compact_matrix,
+    decode_matrix,
+)
+from models.matrix_store import MatrixStore
+from models.scene import Scene, has_time, render_scene
+from models.stream import FrameStream
+from models.protocol import (
+    FEATURE_ANIMATION,
+    FEATURE_BATCH,
+    FEATURE_DELTA,
+    MESSAGE_TYPE,
+    PIXEL_FORMAT,
+    STATUS_STALE_BASE,
+    encode_batch,
+    encode_delta,
+    encode_frame,
+)
 import time
 
 saved_matrices_path = "saved-matrices"
 saved_animations_path = "saved-animations"
 
 DRIVER_URL = os.getenv("DRIVER_URL", "localhost")
-DRIVER_PORT = os.getenv("DRIVER_PORT", 8888)
+DRIVER_PORT = int(os.getenv("DRIVER_PORT", 8888))
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", 2))
+DRIVER_TIMEOUT = float(os.getenv("DRIVER_TIMEOUT", 5))
 
-MAX_LIMIT = 10
+# Live frames from /stream are sent to this UDP port on the driver if it is set
+DRIVER_UDP_PORT = int(os.getenv("DRIVER_UDP_PORT", 0)) or None
+
+# How full frames are sent to the driver: auto, rgb888, rgb565, palette or json
+DRIVER_FRAME_FORMAT = os.getenv("DRIVER_FRAME_FORMAT", "auto")
 
-lock = Lock()
+MAX_LIMIT = 10
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -33,14 +73,44 @@ class MatrixController:
         logging.info("Initializing MatrixController")
         self.canvas = Canvas(width=64, height=32, brightness=80, pixels=[])
 
-        # Initialize the pixels
-        for x in range(self.canvas.width):
-            for y in range(self.canvas.height):
-                self.canvas.pixels.append(
-                    Pixel(rgb=[0, 0, 0], position=[x, y]))
+        # Saved matrices and the catalog we list them from
+        self.matrix_store = MatrixStore(
+            saved_matrices_path, self.canvas.width, self.canvas.height
+        )
+
+        os.makedirs(saved_animations_path, exist_ok=True)
+        self._import_saved_animations()
+
+        # Connections to the driver are opened lazily and kept alive between requests
+        self.driver = DriverPool(
+            host=DRIVER_URL,
+            port=DRIVER_PORT,
+            size=DRIVER_POOL_SIZE,
+            timeout=DRIVER_TIMEOUT,
+        )
+        self.driver_datagrams: Optional[DriverDatagrams] = (
+            DriverDatagrams(DRIVER_URL, DRIVER_UDP_PORT)
+            if DRIVER_UDP_PORT is not None
+            else None
+        )
+
+        # Last frame the driver acknowledged, so following frames can be sent as deltas.
+        # Frames are sent one at a time so every delta is based on the previous one.
+        self.frame_lock = asyncio.Lock()
+        self.frame_sequence: int = 0
+        self.last_frame: Optional[Framebuffer] = None
+        self.last_frame_sequence: int = 0
+
+        # Scene being shown, rerendered in the background while it shows the time.
+        # Taken before frame_lock when both are needed.
+        self.scene_lock = asyncio.Lock()
+        self.scene: Optional[Scene] = None
+        self.scene_frame: Optional[Framebuffer] = None
+        self.scene_wakeup = asyncio.Event()
+        self.scene_task: Optional[asyncio.Task] = None
 
     # Generate random pixels and set them on the matrix
-    def randomize_matrix(self):
+    async def randomize_matrix(self):
         _max_pixels = 32
         self.canvas.clear_canvas()
 
@@ -58,7 +128,7 @@ class MatrixController:
             _pixel["position"][1] = random.randrange(self.canvas.height)
 
         # Send to driver
-        driver_status = self._update_matrix(
+        driver_status = await self._update_matrix(
             {
                 "data_type": "matrix",
                 "data": {
@@ -74,25 +144,19 @@ class MatrixController:
 
         return "Successfully randomized matrix", 200
 
-    # Set the matrix to the given matrix
-    def set_matrix(self, matrix: list[Pixel]):
+    # Set the matrix to the one in a request body, see decode_matrix
+    async def set_matrix(self, body: bytes, content_type: str, pixel_lists: bool = True):
         start_time = time.time()
+        try:
+            framebuffer = decode_matrix(
+                body, content_type, self.canvas.width, self.canvas.height, pixel_lists)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        # Set local canvas
-        # self.canvas.clear_canvas()
-        # for pixel in matrix:
-        #     self.canvas.set_pixel(pixel)
+        await self._stop_scene()
 
         # Send to driver
-        driver_status = self._update_matrix(
-            {
-                "data_type": "matrix",
-                "data": {
-                    "pixels": matrix,
-                    "brightness": self.canvas.brightness,
-                },
-            }
-        )
+        driver_status = await self._update_frame(framebuffer, self.canvas.brightness)
         if driver_status != 200:
             raise HTTPException(
                 status_code=500, detail="Error updating matrix")
@@ -104,25 +168,233 @@ class MatrixController:
 
         return "Successfully set matrix", 200
 
+    # Frames and pixel updates pushed over a WebSocket. They are applied as they
+    # arrive and the latest frame is sent at most STREAM_FPS times a second, so a
+    # burst of strokes goes to the driver as one delta.
+    async def stream(self, websocket: WebSocket):
+        await self._stop_scene()
+
+        # Drawing carries on from what the driver shows
+        async with self.frame_lock:
+            framebuffer = (
+                self.last_frame.copy()
+                if self.last_frame is not None
+                else Framebuffer(self.canvas.width, self.canvas.height)
+            )
+        stream = FrameStream(framebuffer, self.canvas.brightness)
+        sender = asyncio.create_task(self._send_stream(websocket, stream))
+
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+
+                try:
+                    if message.get("bytes") is not None:
+                        stream.set_frame(message["bytes"])
+                    else:
+                        stream.apply(json.loads(message["text"]))
+                except (KeyError, TypeError, OverflowError, ValueError) as e:
+                    await websocket.send_json({"detail": f"Invalid stream message: {e}"})
+        finally:
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+
+    async def _send_stream(self, websocket: WebSocket, stream: FrameStream) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            framebuffer, brightness = await stream.next_frame()
+            started = loop.time()
+
+            driver_status = await self._update_frame(framebuffer, brightness, True)
+            if driver_status != 200:
+                await websocket.send_json({"detail": "Error updating matrix"})
+
+            # Whatever arrives meanwhile is sent together with the next frame
+            await asyncio.sleep(stream.interval - (loop.time() - started))
+
     # Save the matrix to a file with the current date and time as the name
-    def save_matrix(self, matrix: list[Pixel]):
+    async def save_matrix(self, matrix: list[Pixel]):
         # Get the current date and time as a string
         current_time: str = time.strftime(
             "%Y-%m-%d-%H-%M-%S", time.localtime())
 
-        # Check if saved_matrices_path exists, if not create it
-        if not os.path.exists(saved_matrices_path):
-            os.makedirs(saved_matrices_path)
-
-        # Save the matrix to a file with time as the name
-        with open(f"{saved_matrices_path}/{current_time}.json", "wb") as f:
-            f.write(json.dumps(matrix))
+        # Save the matrix with time as the name, identical matrices share their pixels
+        framebuffer = Framebuffer.from_pixels(
+            matrix, self.canvas.width, self.canvas.height)
+        await run_in_threadpool(self.matrix_store.save, current_time, framebuffer)
 
         return {"filename": current_time}
 
-    def set_animation(self, animation: Animation):
+    # Render a scene and show it, scenes with the time in them are kept up to date
+    async def set_scene(self, scene: Scene):
+        brightness = scene.get("brightness", self.canvas.brightness)
+        try:
+            framebuffer = await run_in_threadpool(self._render_scene, scene)
+        except (OverflowError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        async with self.scene_lock:
+            driver_status = await self._update_frame(framebuffer, brightness)
+            if driver_status != 200:
+                self.scene = None
+                raise HTTPException(
+                    status_code=500, detail="Error updating matrix")
+
+            self.scene = scene if has_time(scene) else None
+            self.scene_frame = framebuffer
+
+        if self.scene is not None:
+            self._start_scene_task()
+
+        return "Successfully set scene", 200
+
+    # Have the driver draw the time itself, nothing is sent while it ticks
+    async def set_clock(self, clock: Clock):
+        driver_status = await self._update_matrix(
+            {
+                "data_type": "clock",
+                "data": clock,
+            }
+        )
+
+        if driver_status != 200:
+            raise HTTPException(
+                status_code=500, detail="Error updating matrix")
+
+        return "Successfully set clock", 200
+
+    # Have the driver scroll text or an image across the matrix on its own
+    async def set_scroll(self, scroll: Scroll):
+        if ("text" in scroll) == ("pixels" in scroll):
+            raise HTTPException(
+                status_code=400, detail="Scroll needs either text or pixels")
+        if scroll.get("speed", 1) <= 0:
+            raise HTTPException(
+                status_code=400, detail="Scroll speed must be more than 0")
+
+        driver_status = await self._update_matrix(
+            {
+                "data_type": "scroll",
+                "data": scroll,
+            }
+        )
+
+        if driver_status != 200:
+            raise HTTPException(
+                status_code=500, detail="Error updating matrix")
+
+        return "Successfully set scroll", 200
+
+    # Add or replace a layer on the driver, what it shows underneath carries on
+    async def set_layer(self, layer: Layer):
+        if "pixels" not in layer and "clock" not in layer:
+            raise HTTPException(
+                status_code=400, detail="Layer needs pixels or a clock")
+
+        driver_status = await self._send_request({"data_type": "layer", "data": layer})
+        if driver_status != 200:
+            raise HTTPException(
+                status_code=500, detail="Error updating matrix")
+
+        return "Successfully set layer", 200
+
+    async def remove_layer(self, name: str):
+        driver_status = await self._send_request(
+            {"data_type": "remove_layer", "data": {"name": name}})
+        if driver_status != 200:
+            raise HTTPException(
+                status_code=500, detail="Error updating matrix")
+
+        return "Successfully removed layer", 200
+
+    # Show an uploaded image, fitted to the matrix. Saved as well if asked to.
+    async def set_image(self, data: bytes, options: ImageOptions, save: bool = False):
+        try:
+            framebuffer = await run_in_threadpool(
+                load_image, data, self.canvas.width, self.canvas.height, options)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        await self._stop_scene()
+        driver_status = await self._update_frame(framebuffer, self.canvas.brightness)
+        if driver_status != 200:
+            raise HTTPException(
+                status_code=500, detail="Error updating matrix")
+
+        if save:
+            current_time: str = time.strftime(
+                "%Y-%m-%d-%H-%M-%S", time.localtime())
+            await run_in_threadpool(self.matrix_store.save, current_time, framebuffer)
+            return {"filename": current_time}
+
+        return "Successfully set image", 200
+
+    # Play an uploaded GIF with its own frame lengths. Saved as well if asked to.
+    async def set_gif(self, data: bytes, options: ImageOptions, save: bool = False):
+        try:
+            framebuffers, frame_lengths, loop = await run_in_threadpool(
+                load_gif, data, self.canvas.width, self.canvas.height, options)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        try:
+            driver_features = await self.driver.features()
+        except ConnectionError as e:
+            logger.error(f"Failed to connect to driver: {e}")
+            raise HTTPException(
+                status_code=500, detail="Error updating matrix")
+
+        # Packed, repeated frames and the parts that don't change are only sent once
+        if FEATURE_ANIMATION in driver_features:
+            payload = await run_in_threadpool(
+                encode_animation, framebuffers, frame_lengths, loop)
+            driver_status = await self._replace_content(MESSAGE_TYPE.ANIMATION, payload)
+        else:
+            driver_status = await self._update_matrix(
+                {
+                    "data_type": "animation",
+                    "data": {
+                        "frames": [
+                            {
+                                "data": {
+                                    "pixels": framebuffer.to_pixels(skip_black=True),
+                                    "brightness": self.canvas.brightness,
+                                },
+                                "frame_length": frame_length,
+                                "index": index,
+                            }
+                            for index, (framebuffer, frame_length) in enumerate(
+                                zip(framebuffers, frame_lengths))
+                        ],
+                        "loop": loop,
+                        "brightness": self.canvas.brightness,
+                    },
+                }
+            )
+
+        if driver_status != 200:
+            raise HTTPException(
+                status_code=500, detail="Error updating matrix")
+
+        if save:
+            current_time: str = time.strftime(
+                "%Y-%m-%d-%H-%M-%S", time.localtime())
+            await run_in_threadpool(
+                write_animation,
+                f"{saved_animations_path}/{current_time}{ANIMATION_EXTENSION}",
+                framebuffers,
+                frame_lengths,
+                loop,
+            )
+            return {"filename": current_time}
+
+        return "Successfully set GIF", 200
+
+    async def set_animation(self, animation: Animation):
         # Send to driver
-        driver_status = self._update_matrix(
+        driver_status = await self._update_matrix(
             {
                 "data_type": "animation",
                 "data": {
@@ -139,57 +411,225 @@ class MatrixController:
 
         return "Successfully set animation", 200
 
-    def save_animation(self, animation: Animation):
+    async def save_animation(self, animation: Animation):
         # Get the current date and time as a string
         current_time: str = time.strftime(
             "%Y-%m-%d-%H-%M-%S", time.localtime())
 
-        # Check if animations path exists, if not create it
-        if not os.path.exists(saved_animations_path):
-            os.makedirs(saved_animations_path)
-
-        # create folder for animation
-        if not os.path.exists(f"{saved_animations_path}/{current_time}"):
-            os.makedirs(f"{saved_animations_path}/{current_time}")
-        else:
+        filename = f"{saved_animations_path}/{current_time}{ANIMATION_EXTENSION}"
+        if os.path.exists(filename):
             return "Animation already exists", 400
 
-        # Loop through frames and save them as individual files in new directory
-        for index, frame in enumerate(animation["frames"]):
-            with open(
-                f"{saved_animations_path}/{current_time}/{index}.json", "wb"
-            ) as f:
-                f.write(json.dumps(frame))
-
-        # Save a meta file as well which meta information about the animation
-        with open(f"{saved_animations_path}/{current_time}/meta.json", "wb") as f:
-            f.write(json.dumps({"loop": animation["loop"]}))
+        # Pack every frame into a single file the driver can map and stream
+        try:
+            await run_in_threadpool(
+                write_animation,
+                filename,
+                [
+                    Framebuffer.from_pixels(
+                        frame["data"]["pixels"], self.canvas.width, self.canvas.height
+                    )
+                    for frame in animation["frames"]
+                ],
+                [frame["frame_length"] for frame in animation["frames"]],
+                animation["loop"],
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         return {"filename": current_time}
 
+    # Apply operations in order as one. All of them are checked before anything is
+    # sent, and the driver gets them in a single message it applies between two
+    # frames. Saves only happen once the driver took the batch.
+    async def run_batch(self, batch: Batch):
+        operations = batch["operations"]
+        results = [{"op": operation["op"], "status": 200} for operation in operations]
+
+        try:
+            pixel_formats = await self.driver.pixel_formats()
+            driver_features = await self.driver.features()
+        except ConnectionError as e:
+            logger.error(f"Failed to connect to driver: {e}")
+            raise HTTPException(
+                status_code=500, detail="Error updating matrix")
+        pixel_format = self._pick_pixel_format(pixel_formats)
+
+        brightness = self.canvas.brightness
+        messages: list[tuple[MESSAGE_TYPE, bytes]] = []
+        saves: list[tuple[int, Framebuffer]] = []
+        framebuffer: Optional[Framebuffer] = None
+        for index, operation in enumerate(operations):
+            try:
+                match operation["op"]:
+                    case "brightness":
+                        if not 0 <= operation["brightness"] <= 100:
+                            raise ValueError("Brightness must be from 0 to 100")
+                        if FEATURE_BATCH not in driver_features:
+                            raise ValueError("The driver can't set the brightness")
+                        brightness = operation["brightness"]
+                        request = {"data_type": "brightness", "data": {"brightness": brightness}}
+                        messages.append((MESSAGE_TYPE.JSON, json.dumps(request)))
+                    case "save":
+                        if framebuffer is None:
+                            raise ValueError("Nothing to save, no matrix operation before it")
+                        saves.append((index, framebuffer))
+                    case "matrix":
+                        framebuffer = decode_compact_matrix(
+                            operation, self.canvas.width, self.canvas.height)
+                        messages.append(
+                            self._batch_frame(framebuffer, brightness, pixel_format))
+                    case _:
+                        messages.append(await self._batch_request(operation, brightness))
+            except ValueError as e:
+                # Nothing is applied if one operation can't be
+                for result in results:
+                    result.update(status=424, detail="Not applied, another operation failed")
+                results[index] = {"op": operation["op"], "status": 400, "detail": str(e)}
+                raise HTTPException(status_code=400, detail=results)
+
+        # Only brightness leaves what is shown, and a scene, as it is
+        replaces_content = any(
+            operation["op"] not in ["brightness", "save"] for operation in operations)
+        if messages:
+            if not replaces_content:
+                driver_status = await self._send_message(
+                    MESSAGE_TYPE.BATCH, encode_batch(messages))
+            elif FEATURE_BATCH in driver_features:
+                driver_status = await self._replace_content(
+                    MESSAGE_TYPE.BATCH, encode_batch(messages))
+            else:
+                # Older drivers get the operations one at a time and may show the
+                # steps in between
+                for message_type, payload in messages:
+                    driver_status = await self._replace_content(message_type, payload)
+                    if driver_status != 200:
+                        break
+
+            if driver_status != 200:
+                raise HTTPException(
+                    status_code=500, detail="Error updating matrix")
+
+        self.canvas.brightness = brightness
+
+        # Saves in the same second would share a name, later ones are numbered
+        current_time: str = time.strftime(
+            "%Y-%m-%d-%H-%M-%S", time.localtime())
+        for number, (index, saved_framebuffer) in enumerate(saves):
+            filename = current_time if number == 0 else f"{current_time}-{number}"
+            await run_in_threadpool(self.matrix_store.save, filename, saved_framebuffer)
+            results[index]["filename"] = filename
+
+        return {"results": results}
+
+    # Message showing a framebuffer from a batch. It isn't the base for deltas, the
+    # driver only keeps the sequence of frames sent by themselves.
+    def _batch_frame(
+        self,
+        framebuffer: Framebuffer,
+        brightness: int,
+        pixel_format: Optional[PIXEL_FORMAT],
+    ) -> tuple[MESSAGE_TYPE, bytes]:
+        if pixel_format is None:
+            request = {
+                "data_type": "matrix",
+                "data": {
+                    "pixels": framebuffer.to_pixels(),
+                    "brightness": brightness,
+                },
+            }
+            return (MESSAGE_TYPE.JSON, json.dumps(request))
+
+        return (
+            MESSAGE_TYPE.FRAME,
+            self._encode_frame(framebuffer, brightness, pixel_format),
+        )
+
+    # Request for a batch operation the driver loads or plays, raises ValueError if
+    # what it loads isn't saved
+    async def _batch_request(
+        self, operation: dict, brightness: int
+    ) -> tuple[MESSAGE_TYPE, bytes]:
+        match operation["op"]:
+            case "load_matrix":
+                saved_matrix = await run_in_threadpool(
+                    self.matrix_store.get, operation["timestamp"])
+                if saved_matrix is None:
+                    raise ValueError(f"No saved matrix {operation['timestamp']}")
+                request = {
+                    "data_type": "load_matrix",
+                    "data": {
+                        "timestamp": operation["timestamp"],
+                        "brightness": brightness,
+                        "hash": saved_matrix["thumbnail_hash"],
+                    },
+                }
+            case "animation":
+                request = {
+                    "data_type": "animation",
+                    "data": {
+                        "frames": operation["frames"],
+                        "loop": operation["loop"],
+                        "brightness": brightness,
+                    },
+                }
+            case "load_animation":
+                timestamp = operation["timestamp"]
+                if os.path.basename(timestamp) != timestamp or not os.path.exists(
+                    f"{saved_animations_path}/{timestamp}{ANIMATION_EXTENSION}"
+                ):
+                    raise ValueError(f"No saved animation {timestamp}")
+                request = {
+                    "data_type": "load_animation",
+                    "data": {"timestamp": timestamp, "brightness": brightness},
+                }
+                if "loop" in operation:
+                    request["data"]["loop"] = operation["loop"]
+            case _:
+                raise ValueError(f"Unknown operation {operation['op']}")
+
+        return (MESSAGE_TYPE.JSON, json.dumps(request))
+
+    # Pack animations saved as a directory per animation by older versions
+    def _import_saved_animations(self) -> None:
+        for name in os.listdir(saved_animations_path):
+            directory = f"{saved_animations_path}/{name}"
+            filename = f"{directory}{ANIMATION_EXTENSION}"
+            if not os.path.isdir(directory) or os.path.exists(filename):
+                continue
+
+            try:
+                import_animation_directory(
+                    directory, filename, self.canvas.width, self.canvas.height
+                )
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Failed to import animation {name}: {e}")
+                continue
+            logger.info(f"Imported animation {name}")
+
     # Delete the matrix with the given timestamp name
-    def delete_matrix(self, timestamp: str):
-        # Check if the file exists
-        if not os.path.exists(f"{saved_matrices_path}/{timestamp}.json"):
+    async def delete_matrix(self, timestamp: str):
+        # Delete the file, if it exists
+        if not await run_in_threadpool(self.matrix_store.delete, timestamp):
             return "File not found", 404
 
-        # Delete the file
-        os.remove(f"{saved_matrices_path}/{timestamp}.json")
-
         return "File deleted"
 
     # Load the matrix with the given timestamp name and set it
-    def load_matrix(self, timestamp: str, brightness: int = 80):
+    async def load_matrix(self, timestamp: str, brightness: int = 80):
         # Check if the file exists
-        if not os.path.exists(f"{saved_matrices_path}/{timestamp}.json"):
+        saved_matrix = await run_in_threadpool(self.matrix_store.get, timestamp)
+        if saved_matrix is None:
             return "File not found", 404
 
-        driver_status = self._update_matrix(
+        # The driver reads the blob itself and caches it by hash
+        driver_status = await self._update_matrix(
             {
                 "data_type": "load_matrix",
                 "data": {
                     "timestamp": timestamp,
                     "brightness": brightness,
+                    "hash": saved_matrix["thumbnail_hash"],
                 },
             }
         )
@@ -201,17 +641,23 @@ class MatrixController:
         return "Successfully Loaded matrix", 200
 
     # Get the matrix with the given timestamp name and return it
-    def get_matrix(self, timestamp: str):
-        # Check if the file exists
-        if not os.path.exists(f"{saved_matrices_path}/{timestamp}.json"):
+    async def get_matrix(self, timestamp: str):
+        # Read the matrix from its blob, if it exists
+        saved_matrix = await run_in_threadpool(self.matrix_store.get, timestamp)
+        framebuffer = await run_in_threadpool(self.matrix_store.read, timestamp)
+        if saved_matrix is None or framebuffer is None:
             return "File not found", 404
 
-        # Read the matrix from the file
-        with open(f"{saved_matrices_path}/{timestamp}.json", "r") as f:
-            return f.read()
+        # Every pixel, black ones included, and the brightness if it was saved with one
+        pixels = framebuffer.to_pixels()
+        if saved_matrix["brightness"] is None:
+            return json.dumps(pixels).decode()
+        return json.dumps(
+            {"pixels": pixels, "brightness": saved_matrix["brightness"]}).decode()
 
-    # Get a list of all the saved matrices
-    def get_matrixes(self, page: int, limit: int):
+    # Get a page of the saved matrices, newest first. Pass the last timestamp of a
+    # page as before to get the next one, page numbers still work for the first pages.
+    async def get_matrixes(self, page: int, limit: int, before: Optional[str] = None):
         # Cap limit at MAX_LIMIT
         if limit > MAX_LIMIT:
             limit = MAX_LIMIT
@@ -219,65 +665,233 @@ class MatrixController:
         if limit < 1:
             limit = 1
 
-        # Check if directory exists
-        if not os.path.exists(saved_matrices_path):
-            return "Directory not found", 404
-
-        # Get a list of all the saved matrices
-        saved_matrices = os.listdir(saved_matrices_path)
+        page = max(page, 0)
 
-        # Sort the list of matrices by date
-        saved_matrices.sort()
-
-        # Reverse the list so the most recent matrix is first
-        saved_matrices.reverse()
-
-        # Get the start and end index of the matrices we want to return
-        start_index = page * limit
-        end_index = start_index + limit
+        # The catalog knows how many there are without listing the directory
+        count = await run_in_threadpool(self.matrix_store.count)
+        saved_matrices = await run_in_threadpool(
+            self.matrix_store.list, limit, before=before, offset=page * limit)
 
         # Calculate the number of pages
-        number_of_pages = math.ceil(len(saved_matrices) / limit)
+        number_of_pages = math.ceil(count / limit)
 
         # Return the matrices
         return {
-            "matrixes": saved_matrices[start_index:end_index],
+            "matrixes": [f"{matrix['timestamp']}.json" for matrix in saved_matrices],
             "pages": number_of_pages,
+            "count": count,
+            "next": saved_matrices[-1]["timestamp"]
+            if len(saved_matrices) == limit
+            else None,
         }
 
+    def _render_scene(self, scene: Scene) -> Framebuffer:
+        return render_scene(
+            scene, self.canvas.width, self.canvas.height, self.matrix_store.read)
+
+    # Anything else shown replaces the scene
+    async def _stop_scene(self) -> None:
+        async with self.scene_lock:
+            self.scene = None
+            self.scene_frame = None
+
+    def _start_scene_task(self) -> None:
+        if self.scene_task is not None and not self.scene_task.done():
+            self.scene_wakeup.set()
+            return
+
+        self.scene_task = asyncio.create_task(self._run_scene())
+
+    # Rerender the scene on every second and send it when it looks different, which
+    # with the driver supporting deltas is only the digits that changed. Stops once
+    # something else is shown.
+    async def _run_scene(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self.scene_wakeup.wait(), 1 - time.time() % 1)
+            except TimeoutError:
+                pass
+            self.scene_wakeup.clear()
+
+            async with self.scene_lock:
+                scene, shown = self.scene, self.scene_frame
+            if scene is None:
+                return
+
+            try:
+                framebuffer = await run_in_threadpool(self._render_scene, scene)
+            except ValueError as e:
+                # A saved matrix it shows was deleted, keep showing the last frame
+                logger.warning(f"Failed to render scene: {e}")
+                continue
+            if shown is not None and framebuffer.equals(shown):
+                continue
+
+            async with self.scene_lock:
+                # Replaced while we were rendering
+                if self.scene is not scene:
+                    continue
+
+                driver_status = await self._update_frame(
+                    framebuffer, scene.get("brightness", self.canvas.brightness))
+                if driver_status == 200:
+                    self.scene_frame = framebuffer
+                else:
+                    logger.warning(f"Failed to update scene, driver status {driver_status}")
+
+    # Send a framebuffer to the driver in the most compact form it accepts,
+    # as the changes since the last frame when the driver supports deltas. Live
+    # frames go over UDP when the driver listens for them.
+    async def _update_frame(
+        self, framebuffer: Framebuffer, brightness: int, live: bool = False
+    ) -> int:
+        if live and self.driver_datagrams is not None:
+            # The driver drops late frames, so none can be the base of a delta
+            async with self.frame_lock:
+                self.last_frame = None
+            return self.driver_datagrams.send_frame(framebuffer, brightness)
+
+        try:
+            pixel_formats = await self.driver.pixel_formats()
+            delta = FEATURE_DELTA in await self.driver.features()
+        except ConnectionError as e:
+            logger.error(f"Failed to connect to driver: {e}")
+            return 503
+
+        pixel_format = self._pick_pixel_format(pixel_formats)
+        if pixel_format is None:
+            # Not _update_matrix, that would stop the scene this frame may be from
+            async with self.frame_lock:
+                self.last_frame = None
+            return await self._send_request(
+                {
+                    "data_type": "matrix",
+                    "data": {
+                        "pixels": framebuffer.to_pixels(),
+                        "brightness": brightness,
+                    },
+                }
+            )
+
+        async with self.frame_lock:
+            self.frame_sequence = self.frame_sequence % 0xFFFFFFFF + 1
+            sequence = self.frame_sequence
+
+            if delta and self.last_frame is not None:
+                driver_status = await self._send_delta(framebuffer, brightness, sequence)
+                if driver_status != STATUS_STALE_BASE:
+                    return driver_status
+
+                # The driver lost our previous frame (restart, other content), resend it all
+                logger.info("Driver does not hold the base frame, sending a full frame")
+
+            return await self._send_frame(framebuffer, brightness, pixel_format, sequence)
+
+    # Send only the rectangles that changed since the last acknowledged frame
+    async def _send_delta(
+        self, framebuffer: Framebuffer, brightness: int, sequence: int
+    ) -> int:
+        rects = framebuffer.dirty_rects(self.last_frame)
+        payload = encode_delta(
+            framebuffer, brightness, rects, sequence, self.last_frame_sequence
+        )
+
+        # Mostly changed frames are smaller as a palette than as rectangles
+        if len(payload) > framebuffer.width * framebuffer.height:
+            return STATUS_STALE_BASE
+
+        return await self._send_frame_message(
+            MESSAGE_TYPE.FRAME_DELTA, payload, framebuffer, sequence)
+
+    async def _send_frame(
+        self,
+        framebuffer: Framebuffer,
+        brightness: int,
+        pixel_format: PIXEL_FORMAT,
+        sequence: int,
+    ) -> int:
+        payload = self._encode_frame(framebuffer, brightness, pixel_format, sequence)
+        return await self._send_frame_message(
+            MESSAGE_TYPE.FRAME, payload, framebuffer, sequence)
+
+    @staticmethod
+    def _encode_frame(
+        framebuffer: Framebuffer,
+        brightness: int,
+        pixel_format: PIXEL_FORMAT,
+        sequence: int = 0,
+    ) -> bytes:
+        try:
+            return encode_frame(framebuffer, brightness, pixel_format, sequence)
+        except ValueError:
+            # Too many colours for a palette, fall back to the raw framebuffer
+            return encode_frame(
+                framebuffer, brightness, PIXEL_FORMAT.RGB888, sequence)
+
+    async def _send_frame_message(
+        self,
+        message_type: MESSAGE_TYPE,
+        payload: bytes,
+        framebuffer: Framebuffer,
+        sequence: int,
+    ) -> int:
+        try:
+            driver_status = await self.driver.request(message_type, payload)
+        except ConnectionError as e:
+            logger.error(f"Failed to send frame to driver: {e}")
+            driver_status = 503
+
+        if driver_status == 200:
+            self.last_frame = framebuffer.copy()
+            self.last_frame_sequence = sequence
+        elif driver_status != STATUS_STALE_BASE:
+            self.last_frame = None
+
+        return driver_status
+
+    @staticmethod
+    def _pick_pixel_format(pixel_formats: set[PIXEL_FORMAT]) -> PIXEL_FORMAT | None:
+        match DRIVER_FRAME_FORMAT:
+            case "json":
+                return None
+            case "rgb565" if PIXEL_FORMAT.RGB565 in pixel_formats:
+                return PIXEL_FORMAT.RGB565
+            case "rgb888" if PIXEL_FORMAT.RGB888 in pixel_formats:
+                return PIXEL_FORMAT.RGB888
+
+        # Palettes are a third of the size for the few colour frames a clock shows
+        if PIXEL_FORMAT.PALETTE in pixel_formats:
+            return PIXEL_FORMAT.PALETTE
+        if PIXEL_FORMAT.RGB888 in pixel_formats:
+            return PIXEL_FORMAT.RGB888
+        return None
+
     # Update the matrix locally
-    def _update_matrix(self, request: dict) -> bool:
+    async def _update_matrix(self, request: dict) -> int:
         logger.info("Updating matrix")
+        return await self._replace_content(MESSAGE_TYPE.JSON, json.dumps(request))
 
-        global lock
-        # Serialize the canvas and save it to tmp directory
-        with lock:
-            # Open socket and conenct to server
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.connect((DRIVER_URL, DRIVER_PORT))
-
-                # TODO: HAVE SOME LOGIC FOR HANDLING MATRIX VS ANIMATION
-                # ALSO BRIGHTNESS ETC...
-                # test_request = {
-                #     "data_type": "matrix",
-                #     "data": {
-                #         "pixels": self.canvas.get_pixels(),
-                #         "brightness": self.canvas.brightness,
-                #     },
-                # }
+    # Send something that replaces what the driver shows
+    async def _replace_content(self, message_type: MESSAGE_TYPE, payload: bytes) -> int:
+        await self._stop_scene()
 
-                serialized_request = json.dumps(request)
+        # Anything but a frame replaces what the driver shows, so the next frame is sent whole
+        async with self.frame_lock:
+            self.last_frame = None
 
-                # Send length of serialized matrix
-                s.sendall(len(serialized_request).to_bytes(4, byteorder="big"))
+        return await self._send_message(message_type, payload)
 
-                # Send matrix to server
-                s.sendall(serialized_request)
+    # Send a JSON request to the driver as it is
+    async def _send_request(self, request: dict) -> int:
+        return await self._send_message(MESSAGE_TYPE.JSON, json.dumps(request))
 
-                logger.info("Sent request to driver")
+    async def _send_message(self, message_type: MESSAGE_TYPE, payload: bytes) -> int:
+        try:
+            response = await self.driver.request(message_type, payload)
+        except ConnectionError as e:
+            logger.error(f"Failed to send request to driver: {e}")
+            return 503
 
-                # Receive error code status from server
-                response = s.recv(4)
-                response = int.from_bytes(response, byteorder="big")
+        logger.info("Sent request to driver")
 
-                return response
+        return response
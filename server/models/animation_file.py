@@ -0,0 +1,173 @@
+# Packed single file animations (see client/models/animation_file.py)
+#
+# A file is a header, an index with an entry per frame and then the frame payloads.
+# Frames are either a whole RGB888 framebuffer or the rectangles that changed since
+# the frame before, with a whole frame at least every KEYFRAME_INTERVAL frames.
+# Frames with the same payload share it.
+import logging
+import os
+import struct
+import tempfile
+from enum import IntEnum
+
+import orjson as json
+
+from models.framebuffer import Framebuffer
+
+logger = logging.getLogger(__name__)
+
+ANIMATION_MAGIC = b"LCAN"
+ANIMATION_VERSION = 1
+ANIMATION_EXTENSION = ".lcanim"
+
+# Magic, version, flags, width, height, frame count
+FILE_HEADER = struct.Struct(">4sBBHHI")
+FLAG_LOOP = 1
+
+# Payload offset, payload length, frame length in ms, encoding
+FRAME_ENTRY = struct.Struct(">QIIB")
+
+# Number of rectangles in a delta payload, each a RECT_HEADER and its RGB888 pixels
+DELTA_HEADER = struct.Struct(">H")
+
+# x, y, width, height of a changed rectangle, the same as in FRAME_DELTA messages
+RECT_HEADER = struct.Struct(">HHHH")
+
+# Most frames a reader has to walk through to decode any one frame
+KEYFRAME_INTERVAL = 32
+
+
+class FRAME_ENCODING(IntEnum):
+    KEYFRAME = 1
+    DELTA = 2
+
+
+# Pack framebuffers into an animation file, replacing any file already there at once
+def write_animation(
+    filename: str,
+    framebuffers: list[Framebuffer],
+    frame_lengths: list[int],
+    loop: bool,
+) -> None:
+    parts = _pack_animation(framebuffers, frame_lengths, loop)
+
+    directory = os.path.dirname(filename) or "."
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.writelines(parts)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp only lets us read it, the driver has to as well
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, filename)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+# The same as an animation file, to send to the driver in an ANIMATION message
+def encode_animation(
+    framebuffers: list[Framebuffer], frame_lengths: list[int], loop: bool
+) -> bytes:
+    return b"".join(_pack_animation(framebuffers, frame_lengths, loop))
+
+
+def _pack_animation(
+    framebuffers: list[Framebuffer], frame_lengths: list[int], loop: bool
+) -> list[bytes]:
+    if not framebuffers or len(framebuffers) != len(frame_lengths):
+        raise ValueError("Animation needs a length for each of at least one frame")
+
+    width, height = framebuffers[0].width, framebuffers[0].height
+    payloads: list[tuple[bytes, FRAME_ENCODING]] = []
+    for index, framebuffer in enumerate(framebuffers):
+        if (framebuffer.width, framebuffer.height) != (width, height):
+            raise ValueError("Animation frames must all be the same size")
+        payloads.append(
+            _encode_frame(framebuffer, framebuffers[index - 1] if index else None, index)
+        )
+
+    # Frames that repeat, like a held frame or a loop going back and forth, point
+    # at the payload already written instead of storing it again
+    offset = FILE_HEADER.size + FRAME_ENTRY.size * len(payloads)
+    offsets: dict[tuple[bytes, FRAME_ENCODING], int] = {}
+    entries = []
+    unique_payloads = []
+    for (payload, encoding), frame_length in zip(payloads, frame_lengths):
+        payload_offset = offsets.get((payload, encoding))
+        if payload_offset is None:
+            payload_offset = offsets[(payload, encoding)] = offset
+            unique_payloads.append(payload)
+            offset += len(payload)
+        entries.append(
+            FRAME_ENTRY.pack(
+                payload_offset, len(payload), max(0, int(frame_length)), encoding
+            )
+        )
+
+    return [
+        FILE_HEADER.pack(
+            ANIMATION_MAGIC,
+            ANIMATION_VERSION,
+            FLAG_LOOP if loop else 0,
+            width,
+            height,
+            len(payloads),
+        ),
+        *entries,
+        *unique_payloads,
+    ]
+
+
+# Pack an animation saved as a directory of <index>.json frames and a meta.json
+def import_animation_directory(
+    directory: str, filename: str, width: int, height: int
+) -> None:
+    frame_files = sorted(
+        (int(name[: -len(".json")]), name)
+        for name in os.listdir(directory)
+        if name.endswith(".json") and name[: -len(".json")].isdigit()
+    )
+    if not frame_files:
+        raise ValueError(f"No frames in {directory}")
+
+    framebuffers = []
+    frame_lengths = []
+    for _, name in frame_files:
+        with open(os.path.join(directory, name), "rb") as f:
+            frame = json.loads(f.read())
+        framebuffers.append(
+            Framebuffer.from_pixels(frame["data"]["pixels"], width, height)
+        )
+        frame_lengths.append(frame["frame_length"])
+
+    loop = False
+    try:
+        with open(os.path.join(directory, "meta.json"), "rb") as f:
+            loop = bool(json.loads(f.read())["loop"])
+    except FileNotFoundError:
+        logger.warning(f"Failed to load meta file for animation {directory}")
+
+    write_animation(filename, framebuffers, frame_lengths, loop)
+
+
+def _encode_frame(
+    framebuffer: Framebuffer, previous: Framebuffer | None, index: int
+) -> tuple[bytes, FRAME_ENCODING]:
+    keyframe = framebuffer.tobytes()
+    if previous is None or index % KEYFRAME_INTERVAL == 0:
+        return (keyframe, FRAME_ENCODING.KEYFRAME)
+
+    rects = framebuffer.dirty_rects(previous)
+    parts = [DELTA_HEADER.pack(len(rects))]
+    for x, y, rect_width, rect_height in rects:
+        parts.append(RECT_HEADER.pack(x, y, rect_width, rect_height))
+        parts.append(
+            framebuffer.array[y: y + rect_height, x: x + rect_width].tobytes()
+        )
+    delta = b"".join(parts)
+
+    if len(delta) >= len(keyframe):
+        return (keyframe, FRAME_ENCODING.KEYFRAME)
+    return (delta, FRAME_ENCODING.DELTA)
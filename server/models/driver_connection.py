@@ -0,0 +1,288 @@
+# Persistent, pipelined connections to the LED driver
+import asyncio
+import itertools
+import logging
+import orjson as json
+import os
+import socket
+from typing import Optional
+
+from models.protocol import (
+    HEADER,
+    MESSAGE_TYPE,
+    PIXEL_FORMAT,
+    PIXEL_FORMAT_NAMES,
+    PROTOCOL_MAGIC,
+    STATUS,
+    encode_datagrams,
+    encode_message,
+)
+from models.framebuffer import Framebuffer
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the driver to answer HELLO. Drivers from before the framed
+# protocol never answer it, they need upgrading along with the server.
+DRIVER_HELLO_TIMEOUT = float(os.getenv("DRIVER_HELLO_TIMEOUT", 1))
+
+
+# The driver connected but didn't negotiate, connecting again won't help
+class NegotiationError(ConnectionError):
+    pass
+
+
+class DriverConnection:
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.timeout: float = timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.reader_task: Optional[asyncio.Task] = None
+
+        # Requests sent on this connection that are waiting on a response
+        self.pending: dict[int, asyncio.Future] = {}
+
+        # Only one request connects, the rest wait for it. Writes need no lock, each
+        # message is handed to the transport whole.
+        self.connect_lock = asyncio.Lock()
+
+        # Pixel formats and optional features the driver told us about when we connected
+        self.pixel_formats: set[PIXEL_FORMAT] = set()
+        self.features: set[str] = set()
+
+    def is_connected(self) -> bool:
+        return self.writer is not None
+
+    def pending_count(self) -> int:
+        return len(self.pending)
+
+    async def ensure_connected(self) -> None:
+        async with self.connect_lock:
+            if self.writer is None:
+                await self._connect()
+
+    async def send(
+        self, message_type: MESSAGE_TYPE, request_id: int, payload: bytes
+    ) -> asyncio.Future:
+        await self.ensure_connected()
+
+        writer = self.writer
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        try:
+            writer.write(encode_message(message_type, request_id, payload))
+            # Stop sending while the driver isn't reading
+            await writer.drain()
+        except OSError as e:
+            self.pending.pop(request_id, None)
+            self._disconnect(writer, e)
+            raise ConnectionError(f"Failed to send request to driver: {e}")
+
+        return future
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self._disconnect(self.writer, ConnectionError("Connection closed"))
+
+    async def _connect(self) -> None:
+        logger.info(f"Connecting to driver at {self.host}:{self.port}")
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        except (OSError, TimeoutError) as e:
+            raise ConnectionError(f"Failed to connect to driver: {e}")
+
+        # Requests are small and latency sensitive, don't let Nagle hold them back
+        _socket = writer.get_extra_info("socket")
+        if _socket is not None:
+            _socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self.reader, self.writer = reader, writer
+        self.reader_task = asyncio.create_task(self._read_responses(reader, writer))
+
+        await self._negotiate()
+
+    # Tell the driver which pixel formats we can send and keep the ones it accepts
+    async def _negotiate(self) -> None:
+        writer = self.writer
+        future = asyncio.get_running_loop().create_future()
+        self.pending[0] = future
+        offer = {"formats": list(PIXEL_FORMAT_NAMES.values())}
+        try:
+            writer.write(encode_message(MESSAGE_TYPE.HELLO, 0, json.dumps(offer)))
+            response = await asyncio.wait_for(future, min(self.timeout, DRIVER_HELLO_TIMEOUT))
+        except TimeoutError as e:
+            self._disconnect(writer, e)
+            raise NegotiationError(
+                "Driver did not answer HELLO, it may be too old for this server "
+                "and need upgrading"
+            )
+        except (OSError, ConnectionError) as e:
+            self._disconnect(writer, e)
+            raise ConnectionError(f"Failed to negotiate with driver: {e}")
+
+        self.pixel_formats = set()
+        self.features = set()
+        if STATUS.unpack_from(response)[0] != 200:
+            logger.warning("Driver refused HELLO, only sending JSON requests")
+            return
+
+        capabilities = json.loads(response[STATUS.size:])
+        accepted = capabilities.get("formats", [])
+        self.pixel_formats = {
+            pixel_format
+            for pixel_format, name in PIXEL_FORMAT_NAMES.items()
+            if name in accepted
+        }
+        self.features = set(capabilities.get("features", []))
+        logger.info(
+            f"Driver accepts pixel formats {accepted} and features {self.features}"
+        )
+
+    def _disconnect(self, writer: asyncio.StreamWriter, error: Exception) -> None:
+        writer.close()
+
+        # The reader task and a failed send can both end up here, a connection
+        # replaced since doesn't take the new one's requests with it
+        if self.writer is not writer:
+            return
+        self.reader = self.writer = None
+
+        # Fail everything that was still waiting on this connection
+        pending, self.pending = self.pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(str(error)))
+
+    async def _read_responses(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                magic, _, message_type, request_id, length = HEADER.unpack(
+                    await reader.readexactly(HEADER.size)
+                )
+                payload = await reader.readexactly(length)
+
+                if magic != PROTOCOL_MAGIC or message_type != MESSAGE_TYPE.RESPONSE:
+                    raise ConnectionError("Received malformed response from driver")
+
+                future = self.pending.pop(request_id, None)
+                if future is None:
+                    logger.warning(f"Received response for unknown request {request_id}")
+                    continue
+
+                # Requests that timed out have already given up on their response
+                if not future.done():
+                    future.set_result(payload)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError) as e:
+            logger.info(f"Driver connection closed: {e}")
+            self._disconnect(writer, e)
+
+
+# Small pool of persistent connections so concurrent API requests don't queue
+# behind a single socket round-trip
+class DriverPool:
+    def __init__(
+        self, host: str, port: int, size: int = 2, timeout: float = 5.0
+    ) -> None:
+        self.timeout: float = timeout
+        self.connections: list[DriverConnection] = [
+            DriverConnection(host, port, timeout) for _ in range(max(1, size))
+        ]
+        self.request_ids = itertools.count(1)
+
+    # Send a request and wait for its status code
+    async def request(self, message_type: MESSAGE_TYPE, payload: bytes) -> int:
+        # A request may be retried once on a fresh connection if the old one dropped
+        for attempt in range(2):
+            connection = self._pick_connection()
+            try:
+                future = await connection.send(
+                    message_type, self._next_request_id(), payload)
+                response = await asyncio.wait_for(future, self.timeout)
+                return STATUS.unpack_from(response)[0]
+            except ConnectionError as e:
+                if attempt == 1 or isinstance(e, NegotiationError):
+                    raise
+                logger.warning(f"Retrying driver request after error: {e}")
+            except TimeoutError:
+                # Don't leave a connection behind that might never answer
+                connection.close()
+                raise ConnectionError("Timed out waiting for the driver")
+
+    # Pixel formats negotiated with the driver, connecting first if we have to
+    async def pixel_formats(self) -> set[PIXEL_FORMAT]:
+        return (await self._negotiated_connection()).pixel_formats
+
+    # Optional features negotiated with the driver, connecting first if we have to
+    async def features(self) -> set[str]:
+        return (await self._negotiated_connection()).features
+
+    async def _negotiated_connection(self) -> DriverConnection:
+        for connection in self.connections:
+            if connection.is_connected():
+                return connection
+
+        await self.connections[0].ensure_connected()
+        return self.connections[0]
+
+    def close(self) -> None:
+        for connection in self.connections:
+            connection.close()
+
+    def _next_request_id(self) -> int:
+        return next(self.request_ids) & 0xFFFFFFFF
+
+    def _pick_connection(self) -> DriverConnection:
+        # Prefer the least busy connection, connected ones first
+        return min(
+            self.connections,
+            key=lambda c: (c.pending_count(), not c.is_connected()),
+        )
+
+
+# Live frames sent over UDP. Nothing is acknowledged, a lost packet costs its frame
+# instead of holding up the ones after it.
+class DriverDatagrams:
+    def __init__(self, host: str, port: int) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.socket: Optional[socket.socket] = None
+        self.address = None
+        self.sequence: int = 0
+
+    # Returns a status like a request would, 503 if the frame couldn't be sent
+    def send_frame(self, framebuffer: Framebuffer, brightness: int) -> int:
+        self.sequence = self.sequence % 0xFFFFFFFF + 1
+        try:
+            if self.socket is None:
+                self._open()
+            for datagram in encode_datagrams(framebuffer, brightness, self.sequence):
+                self.socket.sendto(datagram, self.address)
+        except BlockingIOError:
+            # The send buffer is full, the frame is late already
+            logger.info(f"Dropping live frame {self.sequence}")
+            return 503
+        except OSError as e:
+            logger.error(f"Failed to send live frame to driver: {e}")
+            self.close()
+            return 503
+        return 200
+
+    # Resolved once, rather than on every packet
+    def _open(self) -> None:
+        family, kind, proto, _, address = socket.getaddrinfo(
+            self.host, self.port, type=socket.SOCK_DGRAM
+        )[0]
+        self.socket = socket.socket(family, kind, proto)
+        # Sent from the event loop, which must never wait on the network
+        self.socket.setblocking(False)
+        self.address = address
+
+    def close(self) -> None:
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
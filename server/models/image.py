@@ -0,0 +1,179 @@
+# Images and GIFs converted into framebuffers for the matrix
+import io
+from typing import Literal, Optional
+from typing_extensions import TypedDict
+
+import numpy as np
+from PIL import Image, ImageOps, ImageSequence, UnidentifiedImageError
+
+from models.framebuffer import Framebuffer
+
+# More frames than this and a GIF is refused, even packed they'd be a lot to send
+MAX_GIF_FRAMES = 1000
+
+# GIFs asking for frames shorter than this get the default length, like browsers do
+MIN_GIF_FRAME_LENGTH = 20
+DEFAULT_GIF_FRAME_LENGTH = 100
+
+# Thresholds for ordered dithering, spread evenly over [0, 1)
+BAYER_MATRIX = (
+    np.array(
+        [
+            [0, 32, 8, 40, 2, 34, 10, 42],
+            [48, 16, 56, 24, 50, 18, 58, 26],
+            [12, 44, 4, 36, 14, 46, 6, 38],
+            [60, 28, 52, 20, 62, 30, 54, 22],
+            [3, 35, 11, 43, 1, 33, 9, 41],
+            [51, 19, 59, 27, 49, 17, 57, 25],
+            [15, 47, 7, 39, 13, 45, 5, 37],
+            [63, 31, 55, 23, 61, 29, 53, 21],
+        ],
+        dtype=np.float32,
+    )
+    + 0.5
+) / 64
+
+
+# How an image is fitted to the matrix and its colours reduced
+class ImageOptions(TypedDict):
+    # contain keeps all of the image with black bars, cover fills the matrix and
+    # crops, stretch ignores the aspect ratio
+    fit: Literal["contain", "cover", "stretch"]
+    # Applied as value ** gamma, 1 leaves colours as they are
+    gamma: float
+    dither: Literal["none", "ordered", "floyd-steinberg"]
+    bits: int  # Bits per channel the colours are reduced to, 1 to 8
+
+
+def load_image(
+    data: bytes, width: int, height: int, options: ImageOptions
+) -> Framebuffer:
+    image = _open(data, (width, height))
+    frames = _convert_frames([_fit(image, width, height, options)], options)
+    return Framebuffer(width, height, frames[0])
+
+
+# Frames of a GIF (or any animated image), their lengths in ms and whether it loops
+def load_gif(
+    data: bytes, width: int, height: int, options: ImageOptions
+) -> tuple[list[Framebuffer], list[int], bool]:
+    image = _open(data)
+
+    fitted = []
+    frame_lengths = []
+    for frame in ImageSequence.Iterator(image):
+        if len(fitted) == MAX_GIF_FRAMES:
+            raise ValueError(f"Animations can have at most {MAX_GIF_FRAMES} frames")
+
+        fitted.append(_fit(frame, width, height, options))
+        frame_length = int(frame.info.get("duration", DEFAULT_GIF_FRAME_LENGTH))
+        frame_lengths.append(
+            frame_length
+            if frame_length >= MIN_GIF_FRAME_LENGTH
+            else DEFAULT_GIF_FRAME_LENGTH
+        )
+
+    # Frames are dithered together so it is one pass over the pixels
+    frames = _convert_frames(fitted, options)
+    framebuffers = [Framebuffer(width, height, frame) for frame in frames]
+    return (framebuffers, frame_lengths, "loop" in image.info)
+
+
+def _open(data: bytes, size: Optional[tuple[int, int]] = None) -> Image.Image:
+    try:
+        image = Image.open(io.BytesIO(data))
+        # Lets JPEGs decode at a fraction of their size, far quicker for photos
+        if size is not None:
+            image.draft("RGB", size)
+        image.load()
+    except UnidentifiedImageError:
+        raise ValueError("Not an image file Pillow can read")
+    except OSError as e:
+        raise ValueError(f"Can't read image: {e}")
+    return image
+
+
+# Resize a frame to the matrix, transparent parts are black as that is off
+def _fit(
+    image: Image.Image, width: int, height: int, options: ImageOptions
+) -> np.ndarray:
+    image = image.convert("RGBA")
+
+    # Small images are usually pixel art, which should stay sharp when scaled up
+    if image.width <= width and image.height <= height:
+        resample = Image.Resampling.NEAREST
+    else:
+        resample = Image.Resampling.LANCZOS
+
+    match options["fit"]:
+        case "cover":
+            image = ImageOps.fit(image, (width, height), resample)
+        case "stretch":
+            image = image.resize((width, height), resample)
+        case _:
+            image = ImageOps.contain(image, (width, height), resample)
+
+    pixels = np.asarray(image, dtype=np.float32)
+    fitted = np.zeros((height, width, 3), dtype=np.float32)
+    x, y = (width - image.width) // 2, (height - image.height) // 2
+    fitted[y: y + image.height, x: x + image.width] = (
+        pixels[..., :3] * pixels[..., 3:] / 255
+    )
+    return fitted
+
+
+# Apply gamma, reduce the colours and dither a stack of (height, width, 3) frames
+# with values from 0 to 255
+def _convert_frames(frames: list[np.ndarray], options: ImageOptions) -> np.ndarray:
+    bits = options["bits"]
+    if not 1 <= bits <= 8:
+        raise ValueError("Bits per channel must be from 1 to 8")
+    if options["gamma"] <= 0:
+        raise ValueError("Gamma must be more than 0")
+
+    levels = (1 << bits) - 1
+    values = np.stack(frames) / 255
+    if options["gamma"] != 1:
+        values **= options["gamma"]
+    values *= levels
+
+    match options["dither"]:
+        case "ordered":
+            _, height, width, _ = values.shape
+            thresholds = np.tile(
+                BAYER_MATRIX, (height // 8 + 1, width // 8 + 1)
+            )[:height, :width, None]
+            quantised = np.floor(values + thresholds)
+        case "floyd-steinberg":
+            quantised = _floyd_steinberg(values, levels)
+        case _:
+            quantised = np.rint(values)
+
+    return np.rint(np.clip(quantised, 0, levels) * (255 / levels)).astype(np.uint8)
+
+
+# Error diffusion, each pixel is rounded and its error pushed onto the pixels right
+# and below it. Only the pass along a row has to go pixel by pixel, the error for
+# the row below is spread in one go, and every frame is done at once.
+def _floyd_steinberg(values: np.ndarray, levels: int) -> np.ndarray:
+    values = values.astype(np.float32)
+    _, height, width, _ = values.shape
+    quantised = np.empty_like(values)
+    errors = np.empty((values.shape[0], width, 3), dtype=np.float32)
+
+    for y in range(height):
+        carry = 0
+        for x in range(width):
+            value = values[:, y, x] + carry
+            rounded = np.clip(np.rint(value), 0, levels)
+            quantised[:, y, x] = rounded
+            errors[:, x] = value - rounded
+            carry = errors[:, x] * (7 / 16)
+
+        if y + 1 < height:
+            below = values[:, y + 1]
+            below[:, :-1] += errors[:, 1:] * (3 / 16)
+            below += errors * (5 / 16)
+            below[:, 1:] += errors[:, :-1] * (1 / 16)
+
+    return quantised
@@ -1,6 +1,12 @@
 # Matrix model
 import json
-from typing_extensions import TypedDict
+from typing import Literal, Union
+from typing_extensions import NotRequired, TypedDict
+
+import numpy as np
+import orjson
+
+from models.framebuffer import Framebuffer
 
 
 # Pixel model
@@ -15,6 +21,13 @@ class Matrix(TypedDict):
     brightness: int
 
 
+# Compact matrix model, the r, g and b of every pixel one after the other, row by row
+class CompactMatrix(TypedDict):
+    width: int
+    height: int
+    pixels: list[int]
+
+
 # Frame model
 class Frame(TypedDict):
     data: Matrix
@@ -29,6 +42,131 @@ class Animation(TypedDict):
     loop: bool
 
 
+# Clock model, the time is drawn and kept up to date by the driver
+class Clock(TypedDict):
+    position: list[int]  # X and Y of the start of the baseline
+    rgb: list[int]
+    background: NotRequired[list[int]]
+    format: NotRequired[str]  # strftime format, %H:%M if not given
+    font: NotRequired[str]  # Name of a BDF font, 6x10 if not given
+
+
+# Scroll model, text or an image wider than the matrix scrolled across it by the driver
+class Scroll(TypedDict):
+    text: NotRequired[str]
+    rgb: NotRequired[list[int]]  # Colour of the text
+    font: NotRequired[str]  # Name of a BDF font, 7x13 if not given
+    y: NotRequired[int]  # Baseline of the text, centred if not given
+    pixels: NotRequired[list[Pixel]]
+    width: NotRequired[int]  # Width of the image, the matrix's if not given
+    background: NotRequired[list[int]]
+    speed: NotRequired[float]  # Pixels per second, 32 if not given
+    direction: NotRequired[Literal["left", "right"]]  # Left by default
+    loop: NotRequired[bool]  # Scrolls once and stays blank if false, loops by default
+
+
+# Layer model, shown by the driver over (or under) whatever else is shown
+class Layer(TypedDict):
+    name: str
+    pixels: NotRequired[list[Pixel]]
+    clock: NotRequired[Clock]
+    z: NotRequired[int]  # Higher is on top, negative is under what is shown
+    opacity: NotRequired[float]  # 0 to 1
+    ttl: NotRequired[float]  # Seconds until the layer is removed, forever if not given
+
+
+# Batch operation models, told apart by op. The operations of a batch are applied
+# in order and reach the driver as one message, so none of the steps is shown.
+class MatrixOperation(CompactMatrix):
+    op: Literal["matrix"]
+
+
+class LoadMatrixOperation(TypedDict):
+    op: Literal["load_matrix"]
+    timestamp: str
+
+
+class AnimationOperation(Animation):
+    op: Literal["animation"]
+
+
+class LoadAnimationOperation(TypedDict):
+    op: Literal["load_animation"]
+    timestamp: str
+    loop: NotRequired[bool]  # As the animation was saved if not given
+
+
+# Brightness of the panel from here on, what is shown stays as it is
+class BrightnessOperation(TypedDict):
+    op: Literal["brightness"]
+    brightness: int
+
+
+# Save the matrix set by the last matrix operation before it
+class SaveOperation(TypedDict):
+    op: Literal["save"]
+
+
+class Batch(TypedDict):
+    operations: list[
+        Union[
+            MatrixOperation,
+            LoadMatrixOperation,
+            AnimationOperation,
+            LoadAnimationOperation,
+            BrightnessOperation,
+            SaveOperation,
+        ]
+    ]
+
+
+# Framebuffer from a matrix request body, without a dict per pixel. The body is raw
+# RGB888 sent as application/octet-stream, a CompactMatrix or, if pixel_lists is
+# set, a list of Pixels. Raises ValueError for anything that isn't a whole matrix.
+def decode_matrix(
+    body: bytes, content_type: str, width: int, height: int, pixel_lists: bool = True
+) -> Framebuffer:
+    if content_type.split(";")[0].strip().lower() == "application/octet-stream":
+        if len(body) != width * height * 3:
+            raise ValueError(f"Matrix must be {width * height * 3} bytes of RGB888")
+        return Framebuffer.from_bytes(body, width, height)
+
+    try:
+        matrix = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise ValueError("Matrix is not valid JSON")
+
+    if isinstance(matrix, list) and pixel_lists:
+        try:
+            return Framebuffer.from_pixels(matrix, width, height)
+        except (KeyError, TypeError, OverflowError, ValueError):
+            raise ValueError("Pixels need an [x, y] position and an [r, g, b] colour")
+
+    if not isinstance(matrix, dict) or not {"width", "height", "pixels"} <= matrix.keys():
+        raise ValueError("Matrix needs a width, height and pixels")
+    return decode_compact_matrix(matrix, width, height)
+
+
+# Framebuffer from a CompactMatrix, raises ValueError if it isn't a whole matrix
+def decode_compact_matrix(matrix: CompactMatrix, width: int, height: int) -> Framebuffer:
+    if (matrix["width"], matrix["height"]) != (width, height):
+        raise ValueError(f"Matrix must be {width}x{height}")
+
+    try:
+        pixels = np.asarray(matrix["pixels"])
+    except (OverflowError, ValueError):
+        pixels = None
+    if (
+        pixels is None
+        or pixels.dtype.kind not in "iu"
+        or pixels.shape != (width * height * 3,)
+        or pixels.min() < 0
+        or pixels.max() > 255
+    ):
+        raise ValueError(f"Pixels must be {width * height * 3} values from 0 to 255")
+    return Framebuffer(width, height, pixels.astype(np.uint8).reshape((height, width, 3)))
+
+
 # Canvas Class
 class Canvas:
     def __init__(
@@ -37,21 +175,29 @@ class Canvas:
         self.width: int = width
         self.height: int = height
         self.brightness: int = brightness
-        self.pixels: list[Pixel] = pixels
+        self.framebuffer: Framebuffer = Framebuffer.from_pixels(pixels, width, height)
 
     def set_pixel(self, pixel: Pixel) -> None:
-        # Find index of pixel in self.pixels
-        for index, _pixel in enumerate(self.pixels):
-            if _pixel["position"] == pixel["position"]:
-                self.pixels[index] = pixel
-                return
+        self.framebuffer.set_pixel(pixel["position"][0], pixel["position"][1], pixel["rgb"])
+
+    def set_pixels(self, pixels: list[Pixel]) -> None:
+        self.framebuffer.set_pixels(pixels)
 
     def get_pixels(self) -> list[Pixel]:
-        return self.pixels
+        return self.framebuffer.to_pixels()
+
+    def get_framebuffer(self) -> Framebuffer:
+        return self.framebuffer
 
     def serialize_canvas(self) -> str:
-        return json.dumps(self.__dict__)
+        return json.dumps(
+            {
+                "width": self.width,
+                "height": self.height,
+                "brightness": self.brightness,
+                "pixels": self.get_pixels(),
+            }
+        )
 
     def clear_canvas(self) -> None:
-        for index, _pixel in enumerate(self.pixels):
-            self.pixels[index]["rgb"] = [0, 0, 0]
+        self.framebuffer.clear()
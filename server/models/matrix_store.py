@@ -0,0 +1,316 @@
+# Saved matrices on disk, with an SQLite catalog so listing them doesn't touch the directory.
+# Each matrix is a reference to a content addressed blob of its packed RGB888
+# framebuffer, so saving the same image again only adds a catalog row.
+import logging
+import orjson as json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional
+from typing_extensions import TypedDict
+
+from models.framebuffer import Framebuffer
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "catalog.sqlite3"
+
+# Blobs are named after their hash, the driver reads them from here as well
+BLOB_DIRECTORY = "blobs"
+BLOB_EXTENSION = ".rgb"
+
+# Saved matrices from before the catalog are kept here once imported
+LEGACY_DIRECTORY = "legacy"
+
+# Bumped when saved matrices need migrating, kept in the catalog's user_version
+CATALOG_VERSION = 1
+
+
+# Catalog entry for a saved matrix
+class SavedMatrix(TypedDict):
+    timestamp: str
+    size: int  # Bytes of its blob
+    width: int
+    height: int
+    thumbnail_hash: str  # Digest of the packed framebuffer and the name of its blob
+    saved_at: float
+    brightness: Optional[int]  # Saved with the pixels, None if it wasn't given
+
+
+class MatrixStore:
+    def __init__(self, path: str, width: int, height: int) -> None:
+        self.path: str = path
+        # Size of the panel, what the matrices saved before the catalog were drawn on
+        self.width: int = width
+        self.height: int = height
+        self.blob_path: str = os.path.join(path, BLOB_DIRECTORY)
+        os.makedirs(self.blob_path, exist_ok=True)
+
+        # FastAPI calls us from its thread pool, so share one connection behind a lock
+        self.lock = threading.Lock()
+        self.catalog = sqlite3.connect(
+            os.path.join(path, CATALOG_FILENAME), check_same_thread=False
+        )
+        self.catalog.row_factory = sqlite3.Row
+
+        with self.lock, self.catalog:
+            self.catalog.execute("PRAGMA journal_mode=WAL")
+            # Timestamps sort by date, so the primary key index is all we need to page
+            self.catalog.execute(
+                """
+                CREATE TABLE IF NOT EXISTS matrices (
+                    timestamp TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    width INTEGER NOT NULL,
+                    height INTEGER NOT NULL,
+                    thumbnail_hash TEXT NOT NULL,
+                    saved_at REAL NOT NULL,
+                    brightness INTEGER
+                ) WITHOUT ROWID
+                """
+            )
+            # Number of saved matrices referencing each blob
+            self.catalog.execute(
+                """
+                CREATE TABLE IF NOT EXISTS blobs (
+                    hash TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    refcount INTEGER NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            # Catalogs made before brightness was kept with the pixels
+            columns = [
+                row["name"]
+                for row in self.catalog.execute("PRAGMA table_info(matrices)")
+            ]
+            if "brightness" not in columns:
+                self.catalog.execute("ALTER TABLE matrices ADD COLUMN brightness INTEGER")
+            version = self.catalog.execute("PRAGMA user_version").fetchone()[0]
+
+        if version < CATALOG_VERSION:
+            self._import_json_files()
+            with self.lock, self.catalog:
+                self.catalog.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+
+    # Save a matrix, its blob is only written if no other matrix has the same pixels
+    def save(
+        self, timestamp: str, framebuffer: Framebuffer, brightness: Optional[int] = None
+    ) -> SavedMatrix:
+        if not self._valid_name(timestamp):
+            raise ValueError(f"Invalid matrix name {timestamp}")
+
+        return self._save(timestamp, framebuffer, time.time(), brightness)
+
+    # Remove a matrix, and its blob if nothing else references it. Returns whether
+    # the matrix existed.
+    def delete(self, timestamp: str) -> bool:
+        with self.lock:
+            with self.catalog:
+                row = self.catalog.execute(
+                    "SELECT thumbnail_hash FROM matrices WHERE timestamp = ?",
+                    (timestamp,),
+                ).fetchone()
+                if row is None:
+                    return False
+
+                self.catalog.execute(
+                    "DELETE FROM matrices WHERE timestamp = ?", (timestamp,)
+                )
+                unused = self._release_blob(row["thumbnail_hash"])
+
+            # Only once nothing in the catalog points at it any more
+            if unused is not None:
+                self._remove_blob(unused)
+        return True
+
+    def exists(self, timestamp: str) -> bool:
+        return self.get(timestamp) is not None
+
+    def get(self, timestamp: str) -> Optional[SavedMatrix]:
+        with self.lock:
+            row = self.catalog.execute(
+                "SELECT * FROM matrices WHERE timestamp = ?", (timestamp,)
+            ).fetchone()
+        return SavedMatrix(**row) if row is not None else None
+
+    def read(self, timestamp: str) -> Optional[Framebuffer]:
+        matrix = self.get(timestamp)
+        if matrix is None:
+            return None
+
+        try:
+            with open(self.blob_filename(matrix["thumbnail_hash"]), "rb") as f:
+                return Framebuffer.from_bytes(f.read(), matrix["width"], matrix["height"])
+        except (OSError, ValueError) as e:
+            logger.warning(f"Saved matrix {timestamp} can't be read: {e}")
+            return None
+
+    def blob_filename(self, blob_hash: str) -> str:
+        return os.path.join(self.blob_path, f"{blob_hash}{BLOB_EXTENSION}")
+
+    def count(self) -> int:
+        with self.lock:
+            return self.catalog.execute("SELECT COUNT(*) FROM matrices").fetchone()[0]
+
+    # Newest first. Pass the last timestamp of a page as before to get the next one,
+    # that is an index seek however deep we are. An offset is still accepted for
+    # page numbers.
+    def list(
+        self, limit: int, before: Optional[str] = None, offset: int = 0
+    ) -> list[SavedMatrix]:
+        with self.lock:
+            if before is not None:
+                rows = self.catalog.execute(
+                    """
+                    SELECT * FROM matrices WHERE timestamp < ?
+                    ORDER BY timestamp DESC LIMIT ?
+                    """,
+                    (before, limit),
+                ).fetchall()
+            else:
+                rows = self.catalog.execute(
+                    "SELECT * FROM matrices ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+                    (limit, offset),
+                ).fetchall()
+        return [SavedMatrix(**row) for row in rows]
+
+    def _save(
+        self,
+        timestamp: str,
+        framebuffer: Framebuffer,
+        saved_at: float,
+        brightness: Optional[int] = None,
+    ) -> SavedMatrix:
+        content = framebuffer.tobytes()
+        entry = SavedMatrix(
+            timestamp=timestamp,
+            size=len(content),
+            width=framebuffer.width,
+            height=framebuffer.height,
+            thumbnail_hash=framebuffer.digest().hex(),
+            saved_at=saved_at,
+            brightness=brightness,
+        )
+
+        with self.lock:
+            # Written before it is referenced, so a reader never finds it missing
+            filename = self.blob_filename(entry["thumbnail_hash"])
+            if not os.path.exists(filename):
+                self._write_atomically(filename, content)
+
+            with self.catalog:
+                replaced = self.catalog.execute(
+                    """
+                    SELECT thumbnail_hash FROM matrices
+                    WHERE timestamp = ? AND thumbnail_hash IN (SELECT hash FROM blobs)
+                    """,
+                    (timestamp,),
+                ).fetchone()
+                self.catalog.execute(
+                    """
+                    INSERT OR REPLACE INTO matrices
+                        (timestamp, size, width, height, thumbnail_hash, saved_at, brightness)
+                    VALUES (
+                        :timestamp, :size, :width, :height, :thumbnail_hash, :saved_at,
+                        :brightness
+                    )
+                    """,
+                    entry,
+                )
+
+                # Saving the same pixels under the same name keeps its one reference
+                unused = None
+                if replaced is None or replaced["thumbnail_hash"] != entry["thumbnail_hash"]:
+                    self.catalog.execute(
+                        """
+                        INSERT INTO blobs VALUES (?, ?, 1)
+                        ON CONFLICT (hash) DO UPDATE SET refcount = refcount + 1
+                        """,
+                        (entry["thumbnail_hash"], entry["size"]),
+                    )
+                    if replaced is not None:
+                        unused = self._release_blob(replaced["thumbnail_hash"])
+
+            if unused is not None:
+                self._remove_blob(unused)
+        return entry
+
+    # Drop a reference to a blob, returns its hash if that was the last one
+    def _release_blob(self, blob_hash: str) -> Optional[str]:
+        self.catalog.execute(
+            "UPDATE blobs SET refcount = refcount - 1 WHERE hash = ?", (blob_hash,)
+        )
+        unused = self.catalog.execute(
+            "DELETE FROM blobs WHERE hash = ? AND refcount <= 0", (blob_hash,)
+        ).rowcount
+        return blob_hash if unused else None
+
+    def _remove_blob(self, blob_hash: str) -> None:
+        try:
+            os.remove(self.blob_filename(blob_hash))
+        except FileNotFoundError:
+            pass
+
+    # Matrices saved as JSON files, before there were blobs and a catalog. They are
+    # copied into blobs and the files kept in the legacy directory, the copy only has
+    # the pixels that fit on the panel.
+    def _import_json_files(self) -> None:
+        legacy_path = os.path.join(self.path, LEGACY_DIRECTORY)
+        imported = 0
+        for name in os.listdir(self.path):
+            if not name.endswith(".json"):
+                continue
+            timestamp = name[: -len(".json")]
+            filename = os.path.join(self.path, name)
+
+            # Everything saved so far was a list of pixels for the panel
+            try:
+                with open(filename, "rb") as f:
+                    pixels = json.loads(f.read())
+                brightness = None
+                if isinstance(pixels, dict):
+                    brightness = pixels.get("brightness")
+                    pixels = pixels["pixels"]
+                framebuffer = Framebuffer.from_pixels(pixels, self.width, self.height)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping unreadable saved matrix {name}: {e}")
+                continue
+
+            self._save(timestamp, framebuffer, os.stat(filename).st_mtime, brightness)
+            os.makedirs(legacy_path, exist_ok=True)
+            os.replace(filename, os.path.join(legacy_path, name))
+            imported += 1
+
+        if imported:
+            logger.info(
+                f"Copied {imported} saved matrices into the blob store, "
+                f"the original files are in {legacy_path}"
+            )
+
+    # Readers see the old file or the new one, never half of one
+    def _write_atomically(self, filename: str, content: bytes) -> None:
+        directory = os.path.dirname(filename)
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp only lets us read it, the driver has to as well
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, filename)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    # Names that would leave the directory aren't allowed
+    @staticmethod
+    def _valid_name(timestamp: str) -> bool:
+        return (
+            bool(timestamp)
+            and os.path.basename(timestamp) == timestamp
+            and not timestamp.startswith(".")
+        )
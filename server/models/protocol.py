@@ -0,0 +1,202 @@
+# Wire protocol shared with the driver (see client/models/protocol.py)
+import struct
+from enum import IntEnum
+
+import numpy as np
+
+from models.framebuffer import Framebuffer
+
+# Every framed message starts with this magic so the driver can tell it apart
+# from the legacy "4 byte length + JSON" requests
+PROTOCOL_MAGIC = b"LC"
+PROTOCOL_VERSION = 1
+
+# Magic, version, message type, request id, payload length
+HEADER = struct.Struct(">2sBBII")
+
+# Status code sent back as the first 4 bytes of a response payload, anything
+# after it is a message specific body
+STATUS = struct.Struct(">I")
+
+# Frame version, pixel format, width, height, brightness, palette entries, sequence
+FRAME_HEADER = struct.Struct(">BBHHBHI")
+FRAME_VERSION = 2
+
+# Delta version, width, height, brightness, sequence, base sequence, rectangle count
+DELTA_HEADER = struct.Struct(">BHHBIIH")
+DELTA_VERSION = 1
+
+# x, y, width, height of a dirty rectangle, followed by its RGB888 pixels
+RECT_HEADER = struct.Struct(">HHHH")
+
+# Status the driver answers a delta with when it doesn't hold the base frame
+STATUS_STALE_BASE = 409
+
+# Live frames sent over UDP start with their own magic. Magic, version,
+# brightness, frame sequence, width, height and the offset of the RGB888 bytes
+# that follow in the frame.
+DATAGRAM_MAGIC = b"LD"
+DATAGRAM_VERSION = 1
+DATAGRAM_HEADER = struct.Struct(">2sBBIHHI")
+
+# Message type and payload length of every message in a batch, followed by its
+# payload
+BATCH_ENTRY = struct.Struct(">BI")
+
+# Pixel bytes per datagram, so a packet fits in an Ethernet frame unfragmented
+DATAGRAM_PAYLOAD_SIZE = 1440
+
+
+class MESSAGE_TYPE(IntEnum):
+    JSON = 1
+    RESPONSE = 2
+    # Capability negotiation, answered with the pixel formats the driver decodes
+    HELLO = 3
+    # Binary framebuffer, see encode_frame
+    FRAME = 4
+    # Dirty rectangles applied on top of a previous frame, see encode_delta
+    FRAME_DELTA = 5
+    # A whole animation packed the same way as animation files, see
+    # models/animation_file.py
+    ANIMATION = 6
+    # Messages applied together, with no frame shown between them, see encode_batch
+    BATCH = 7
+
+
+class PIXEL_FORMAT(IntEnum):
+    RGB888 = 1
+    RGB565 = 2
+    # One byte per pixel indexing into an RGB888 palette sent in front of the pixels
+    PALETTE = 3
+
+
+PIXEL_FORMAT_NAMES: dict[PIXEL_FORMAT, str] = {
+    PIXEL_FORMAT.RGB888: "rgb888",
+    PIXEL_FORMAT.RGB565: "rgb565",
+    PIXEL_FORMAT.PALETTE: "palette",
+}
+
+# Optional features a driver can advertise in its HELLO response
+FEATURE_DELTA = "delta"
+FEATURE_ANIMATION = "animation"
+FEATURE_BATCH = "batch"
+
+
+def encode_message(message_type: MESSAGE_TYPE, request_id: int, payload: bytes) -> bytes:
+    return (
+        HEADER.pack(
+            PROTOCOL_MAGIC, PROTOCOL_VERSION, message_type, request_id, len(payload)
+        )
+        + payload
+    )
+
+
+# Encode a framebuffer as a FRAME payload
+def encode_frame(
+    framebuffer: Framebuffer,
+    brightness: int,
+    pixel_format: PIXEL_FORMAT = PIXEL_FORMAT.RGB888,
+    sequence: int = 0,
+) -> bytes:
+    width, height = framebuffer.width, framebuffer.height
+    pixels = framebuffer.array
+
+    match pixel_format:
+        case PIXEL_FORMAT.RGB888:
+            return (
+                FRAME_HEADER.pack(
+                    FRAME_VERSION, pixel_format, width, height, brightness, 0, sequence
+                )
+                + framebuffer.tobytes()
+            )
+        case PIXEL_FORMAT.RGB565:
+            channels = pixels.astype(np.uint16)
+            packed = (
+                ((channels[:, :, 0] >> 3) << 11)
+                | ((channels[:, :, 1] >> 2) << 5)
+                | (channels[:, :, 2] >> 3)
+            )
+            return (
+                FRAME_HEADER.pack(
+                    FRAME_VERSION, pixel_format, width, height, brightness, 0, sequence
+                )
+                + packed.astype(">u2").tobytes()
+            )
+        case PIXEL_FORMAT.PALETTE:
+            palette, indices = np.unique(
+                pixels.reshape(-1, 3), axis=0, return_inverse=True
+            )
+            if len(palette) > 256:
+                raise ValueError("Framebuffer has more than 256 colours")
+            return (
+                FRAME_HEADER.pack(
+                    FRAME_VERSION,
+                    pixel_format,
+                    width,
+                    height,
+                    brightness,
+                    len(palette),
+                    sequence,
+                )
+                + palette.tobytes()
+                + indices.reshape(-1).astype(np.uint8).tobytes()
+            )
+
+    raise ValueError(f"Unknown pixel format {pixel_format}")
+
+
+# Encode the given dirty rectangles of a framebuffer as a FRAME_DELTA payload
+def encode_delta(
+    framebuffer: Framebuffer,
+    brightness: int,
+    rects: list[tuple[int, int, int, int]],
+    sequence: int,
+    base_sequence: int,
+) -> bytes:
+    parts = [
+        DELTA_HEADER.pack(
+            DELTA_VERSION,
+            framebuffer.width,
+            framebuffer.height,
+            brightness,
+            sequence,
+            base_sequence,
+            len(rects),
+        )
+    ]
+    for x, y, rect_width, rect_height in rects:
+        parts.append(RECT_HEADER.pack(x, y, rect_width, rect_height))
+        parts.append(
+            framebuffer.array[y: y + rect_height, x: x + rect_width].tobytes()
+        )
+    return b"".join(parts)
+
+
+# Split a framebuffer into the datagrams of one live frame, a frame is only shown
+# once all of them have arrived
+def encode_datagrams(
+    framebuffer: Framebuffer, brightness: int, sequence: int
+) -> list[bytes]:
+    pixels = framebuffer.array.tobytes()
+    return [
+        DATAGRAM_HEADER.pack(
+            DATAGRAM_MAGIC,
+            DATAGRAM_VERSION,
+            brightness,
+            sequence,
+            framebuffer.width,
+            framebuffer.height,
+            offset,
+        )
+        + pixels[offset: offset + DATAGRAM_PAYLOAD_SIZE]
+        for offset in range(0, len(pixels), DATAGRAM_PAYLOAD_SIZE)
+    ]
+
+
+# Encode messages as a BATCH payload, the driver applies them in order
+def encode_batch(messages: list[tuple[MESSAGE_TYPE, bytes]]) -> bytes:
+    parts = []
+    for message_type, payload in messages:
+        parts.append(BATCH_ENTRY.pack(message_type, len(payload)))
+        parts.append(payload)
+    return b"".join(parts)
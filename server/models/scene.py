@@ -0,0 +1,248 @@
+# Scenes, a short description of what to draw that is rendered into a framebuffer
+# on the server, so clients don't have to send every pixel
+import time
+from typing import Callable, Literal, Optional, Union
+from typing_extensions import NotRequired, TypedDict
+
+import numpy as np
+
+from models.font import load_font
+from models.framebuffer import Framebuffer
+
+DEFAULT_FONT = "6x10"
+DEFAULT_TIME_FORMAT = "%H:%M"
+
+
+# Text with its baseline at position, like graphics.DrawText
+class TextElement(TypedDict):
+    type: Literal["text"]
+    text: str
+    position: list[int]  # X and Y of the start of the baseline
+    rgb: list[int]
+    font: NotRequired[str]  # Name of a BDF font, DEFAULT_FONT if not given
+
+
+# The current time, kept up to date for as long as the scene is shown
+class TimeElement(TypedDict):
+    type: Literal["time"]
+    position: list[int]
+    rgb: list[int]
+    format: NotRequired[str]  # strftime format, DEFAULT_TIME_FORMAT if not given
+    font: NotRequired[str]
+
+
+class RectElement(TypedDict):
+    type: Literal["rect"]
+    position: list[int]  # X and Y of the top left corner
+    size: list[int]  # Width and height
+    rgb: list[int]
+    fill: NotRequired[bool]  # Only the outline if false, filled by default
+
+
+class LineElement(TypedDict):
+    type: Literal["line"]
+    start: list[int]
+    end: list[int]
+    rgb: list[int]
+
+
+class CircleElement(TypedDict):
+    type: Literal["circle"]
+    center: list[int]
+    radius: int
+    rgb: list[int]
+    fill: NotRequired[bool]  # Only the outline by default, like graphics.DrawCircle
+
+
+# A saved matrix drawn at position, black pixels are left transparent
+class ImageElement(TypedDict):
+    type: Literal["image"]
+    timestamp: str
+    position: NotRequired[list[int]]
+
+
+SceneElement = Union[
+    TextElement, TimeElement, RectElement, LineElement, CircleElement, ImageElement
+]
+
+
+# Elements are drawn in order, later ones on top
+class Scene(TypedDict):
+    elements: list[SceneElement]
+    background: NotRequired[list[int]]
+    brightness: NotRequired[int]
+
+
+# Whether the scene looks different as time goes on
+def has_time(scene: Scene) -> bool:
+    return any(element["type"] == "time" for element in scene["elements"])
+
+
+# Render a scene into a new framebuffer. Images are saved matrices looked up with
+# load_image. Raises ValueError for anything that can't be drawn.
+def render_scene(
+    scene: Scene,
+    width: int,
+    height: int,
+    load_image: Callable[[str], Optional[Framebuffer]],
+    now: Optional[float] = None,
+) -> Framebuffer:
+    framebuffer = Framebuffer(width, height)
+    if "background" in scene:
+        framebuffer.array[:, :] = _colour(scene["background"])
+
+    # Not localtime's own clock, which is coarse enough to lag just after a second
+    local_time = time.localtime(time.time() if now is None else now)
+    for element in scene["elements"]:
+        match element["type"]:
+            case "text":
+                _draw_text(framebuffer, element, element["text"])
+            case "time":
+                _draw_text(
+                    framebuffer,
+                    element,
+                    time.strftime(element.get("format", DEFAULT_TIME_FORMAT), local_time),
+                )
+            case "rect":
+                _draw_rect(framebuffer, element)
+            case "line":
+                _draw_line(framebuffer, element)
+            case "circle":
+                _draw_circle(framebuffer, element)
+            case "image":
+                _draw_image(framebuffer, element, load_image)
+            case other:
+                raise ValueError(f"Unknown scene element {other}")
+
+    # Everything above wrote to the array directly
+    framebuffer.mark_changed()
+    return framebuffer
+
+
+def _draw_text(
+    framebuffer: Framebuffer, element: Union[TextElement, TimeElement], text: str
+) -> None:
+    x, y = _point(element["position"])
+    font = load_font(element.get("font", DEFAULT_FONT))
+    font.draw_text(framebuffer, x, y, _colour(element["rgb"]), text)
+
+
+def _draw_rect(framebuffer: Framebuffer, element: RectElement) -> None:
+    x, y = _point(element["position"])
+    rect_width, rect_height = _point(element["size"])
+    rgb = _colour(element["rgb"])
+    if rect_width <= 0 or rect_height <= 0:
+        return
+
+    # Slices are clipped by NumPy, only negative starts need clamping
+    def fill(x0: int, y0: int, x1: int, y1: int) -> None:
+        framebuffer.array[max(y0, 0): max(y1, 0), max(x0, 0): max(x1, 0)] = rgb
+
+    if element.get("fill", True):
+        fill(x, y, x + rect_width, y + rect_height)
+        return
+
+    fill(x, y, x + rect_width, y + 1)
+    fill(x, y + rect_height - 1, x + rect_width, y + rect_height)
+    fill(x, y, x + 1, y + rect_height)
+    fill(x + rect_width - 1, y, x + rect_width, y + rect_height)
+
+
+def _draw_line(framebuffer: Framebuffer, element: LineElement) -> None:
+    (x0, y0), (x1, y1) = _point(element["start"]), _point(element["end"])
+
+    # One point per pixel along the longer axis, rounded onto the grid. That axis
+    # moves a pixel every step, so only the steps it spends on the framebuffer are
+    # made, however far off it the line reaches.
+    steps = max(abs(x1 - x0), abs(y1 - y0)) + 1
+    if abs(x1 - x0) >= abs(y1 - y0):
+        first, last = _steps_inside(x0, x1, steps, framebuffer.width)
+    else:
+        first, last = _steps_inside(y0, y1, steps, framebuffer.height)
+    if first > last:
+        return
+
+    index = np.arange(last - first + 1) + float(first)
+    xs = _along(x0, x1, steps, index, framebuffer.width)
+    ys = _along(y0, y1, steps, index, framebuffer.height)
+    _set_points(framebuffer, xs, ys, _colour(element["rgb"]))
+
+
+# First and last step of a line from start to end along its longer axis that are
+# within size
+def _steps_inside(start: int, end: int, steps: int, size: int) -> tuple[int, int]:
+    if end >= start:
+        return max(0, -start), min(steps - 1, size - 1 - start)
+    return max(0, start - (size - 1)), min(steps - 1, start)
+
+
+# Position at the given steps, as np.linspace would place them, clipped to just
+# outside the framebuffer so far off points still fit the grid's integers
+def _along(start: int, end: int, steps: int, index: np.ndarray, size: int) -> np.ndarray:
+    if steps == 1:
+        values = np.full(len(index), float(start))
+    else:
+        values = index * ((end - start) / (steps - 1)) + start
+    return np.clip(np.rint(values), -1, size).astype(np.int64)
+
+
+def _draw_circle(framebuffer: Framebuffer, element: CircleElement) -> None:
+    center_x, center_y = _point(element["center"])
+    radius = int(element["radius"])
+    if radius < 0:
+        raise ValueError("Circle radius can't be negative")
+
+    # Distance from the center of every pixel in the part of the circle's bounding
+    # box that is on the framebuffer
+    x0, x1 = max(center_x - radius, 0), min(center_x + radius + 1, framebuffer.width)
+    y0, y1 = max(center_y - radius, 0), min(center_y + radius + 1, framebuffer.height)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    ys, xs = np.mgrid[y0:y1, x0:x1]
+    distance = np.hypot(xs - float(center_x), ys - float(center_y))
+    if element.get("fill", False):
+        inside = distance <= radius + 0.5
+    else:
+        inside = np.abs(distance - radius) < 0.5
+    _set_points(framebuffer, xs[inside], ys[inside], _colour(element["rgb"]))
+
+
+def _draw_image(
+    framebuffer: Framebuffer,
+    element: ImageElement,
+    load_image: Callable[[str], Optional[Framebuffer]],
+) -> None:
+    image = load_image(element["timestamp"])
+    if image is None:
+        raise ValueError(f"Unknown saved matrix {element['timestamp']}")
+    x, y = _point(element.get("position", [0, 0]))
+
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + image.width, framebuffer.width), min(y + image.height, framebuffer.height)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    source = image.array[y0 - y: y1 - y, x0 - x: x1 - x]
+    target = framebuffer.array[y0:y1, x0:x1]
+    lit = source.any(axis=2)
+    target[lit] = source[lit]
+
+
+def _set_points(
+    framebuffer: Framebuffer, xs: np.ndarray, ys: np.ndarray, rgb: list[int]
+) -> None:
+    inside = (xs >= 0) & (xs < framebuffer.width) & (ys >= 0) & (ys < framebuffer.height)
+    framebuffer.array[ys[inside], xs[inside]] = rgb
+
+
+def _point(point: list[int]) -> tuple[int, int]:
+    if len(point) != 2:
+        raise ValueError("Positions and sizes need two values")
+    return (int(point[0]), int(point[1]))
+
+
+def _colour(rgb: list[int]) -> list[int]:
+    if len(rgb) != 3:
+        raise ValueError("Colours need an [r, g, b] value")
+    return [min(max(int(value), 0), 255) for value in rgb]
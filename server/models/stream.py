@@ -0,0 +1,71 @@
+# Frames pushed live over a WebSocket. Messages are applied to one framebuffer as
+# they arrive, and only the latest state is sent at the driver's pace.
+import asyncio
+import os
+from typing_extensions import NotRequired, TypedDict
+
+import numpy as np
+
+from models.framebuffer import Framebuffer
+from models.matrix import Pixel
+
+# Most frames a second sent to the driver, the panel refreshes at 70Hz
+STREAM_FPS = float(os.getenv("STREAM_FPS", 60))
+
+
+# Stream message model, sent as text. Binary messages are whole RGB888 frames.
+class StreamUpdate(TypedDict):
+    pixels: NotRequired[list[Pixel]]  # Drawn on top of the frame so far
+    clear: NotRequired[bool]  # Cleared before the pixels are drawn
+    brightness: NotRequired[int]
+
+
+class FrameStream:
+    def __init__(
+        self, framebuffer: Framebuffer, brightness: int, fps: float = STREAM_FPS
+    ) -> None:
+        self.framebuffer: Framebuffer = framebuffer
+        self.brightness: int = brightness
+        # Seconds between frames sent to the driver
+        self.interval: float = 1 / fps
+
+        # Version and brightness last taken to be sent, what is sent is always
+        # everything applied until then
+        self.sent: tuple[int, int] = (framebuffer.version, brightness)
+        self.changed = asyncio.Event()
+
+    # Replace the whole frame with RGB888 bytes, row major
+    def set_frame(self, buffer: bytes) -> None:
+        width, height = self.framebuffer.width, self.framebuffer.height
+        if len(buffer) != width * height * 3:
+            raise ValueError(f"Frames must be {width * height * 3} bytes of RGB888")
+
+        self.framebuffer.array[:] = np.frombuffer(buffer, dtype=np.uint8).reshape(
+            (height, width, 3)
+        )
+        self.framebuffer.mark_changed()
+        self.changed.set()
+
+    def apply(self, update: StreamUpdate) -> None:
+        if not isinstance(update, dict):
+            raise ValueError("Stream updates must be JSON objects")
+
+        if update.get("clear", False):
+            self.framebuffer.clear()
+        if update.get("pixels"):
+            self.framebuffer.set_pixels(update["pixels"])
+        if "brightness" in update:
+            self.brightness = min(max(int(update["brightness"]), 0), 100)
+        self.changed.set()
+
+    # Wait for changes that haven't been sent. Returns a copy of the frame to send
+    # and its brightness.
+    async def next_frame(self) -> tuple[Framebuffer, int]:
+        while True:
+            await self.changed.wait()
+            self.changed.clear()
+
+            state = (self.framebuffer.version, self.brightness)
+            if state != self.sent:
+                self.sent = state
+                return (self.framebuffer.copy(), self.brightness)
@@ -2,6 +2,7 @@
 
 from libcpp cimport bool
 from libc.stdint cimport uint8_t, uint32_t, uintptr_t
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_C_CONTIGUOUS
 from PIL import Image
 import cython
 
@@ -53,6 +54,38 @@ cdef class Canvas:
                 b = (pixel >> 16) & 0xFF
                 my_canvas.SetPixel(xstart+col, ystart+row, r, g, b)
 
+    def SetPixels(self, buffer, int width, int height, int x = 0, int y = 0):
+        # Copy a row major RGB888 buffer (bytes, bytearray, memoryview, numpy array
+        # or anything else exposing a contiguous buffer) onto the canvas at x, y
+        cdef Py_buffer view
+        cdef const uint8_t* pixels
+        cdef cppinc.Canvas* my_canvas = self.__getCanvas()
+        cdef int col_start = max(0, -x)
+        cdef int col_end = min(width, my_canvas.width() - x)
+        cdef int row_start = max(0, -y)
+        cdef int row_end = min(height, my_canvas.height() - y)
+        cdef int row, col
+        cdef Py_ssize_t offset
+
+        PyObject_GetBuffer(buffer, &view, PyBUF_C_CONTIGUOUS)
+        try:
+            if width < 0 or height < 0 or view.len != <Py_ssize_t>width * height * 3:
+                raise ValueError("Buffer must hold width * height RGB888 pixels")
+
+            pixels = <const uint8_t*>view.buf
+            with nogil:
+                for row in range(row_start, row_end):
+                    offset = (<Py_ssize_t>row * width + col_start) * 3
+                    for col in range(col_start, col_end):
+                        my_canvas.SetPixel(x + col, y + row, pixels[offset], pixels[offset + 1], pixels[offset + 2])
+                        offset += 3
+        finally:
+            PyBuffer_Release(&view)
+
+    def SetFramebuffer(self, buffer):
+        # Replace the whole canvas with a row major RGB888 buffer of the same size
+        self.SetPixels(buffer, self.width, self.height)
+
 cdef class FrameCanvas(Canvas):
     def __dealloc__(self):
         if <void*>self.__canvas != NULL:
@@ -1,11 +1,14 @@
 import logging
 import sys
 import uvicorn
+from typing import Literal, Optional
 
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
-from models.matrix import Animation, Pixel
+from models.image import ImageOptions
+from models.matrix import Animation, Batch, Clock, Layer, Pixel, Scroll
+from models.scene import Scene
 from controllers.matrix_controller import MatrixController
 
 app = FastAPI()
@@ -32,65 +35,151 @@ v1_router = APIRouter(prefix="/v1", tags=["v1"])
 
 # Root endpoint
 @app.get("/")
-def read_root():
+async def read_root():
     return {"Hello": "World"}
 
 
 # # Health endpoint
 @app.get("/health")
-def get_health():
+async def get_health():
     return {"status": "up"}
 
 
 @app.get("/randomize-matrix", tags=["matrix"])
-def get_randomize_matrix():
-    return matrix_controller.randomize_matrix()
+async def get_randomize_matrix():
+    return await matrix_controller.randomize_matrix()
 
 
-# Matrix endpoint
+# Matrix endpoint. The body is a list of pixels, a compact JSON matrix with the
+# pixels as a flat [r, g, b, ...] array, or raw RGB888 as application/octet-stream.
+# Only its size is checked, there is no model to validate pixel by pixel.
 @app.post("/matrix", tags=["matrix"])
-def post_matrix(matrix: list[Pixel]):
-    return matrix_controller.set_matrix(matrix)
+async def post_matrix(request: Request):
+    return await matrix_controller.set_matrix(
+        await request.body(), request.headers.get("content-type", "")
+    )
+
+
+# Only the compact and raw forms, lists of pixels are what these replace
+@v1_router.post("/matrix", tags=["matrix"])
+async def post_matrix_v1(request: Request):
+    return await matrix_controller.set_matrix(
+        await request.body(), request.headers.get("content-type", ""), pixel_lists=False
+    )
 
 
 # Save matrix
 @app.post("/save-matrix", tags=["saving"])
-def post_save_matrix(matrix: list[Pixel]):
-    return matrix_controller.save_matrix(matrix)
+async def post_save_matrix(matrix: list[Pixel]):
+    return await matrix_controller.save_matrix(matrix)
+
+
+# Scene endpoint, rendered on the server and kept up to date if it shows the time
+@app.post("/scene", tags=["scene"])
+async def post_scene(scene: Scene):
+    return await matrix_controller.set_scene(scene)
+
+
+# Clock endpoint, the driver keeps the time up to date without the server
+@app.post("/clock", tags=["scene"])
+async def post_clock(clock: Clock):
+    return await matrix_controller.set_clock(clock)
+
+
+# Scrolling text or images, moved along by the driver at a steady speed
+@app.post("/scroll", tags=["scene"])
+async def post_scroll(scroll: Scroll):
+    return await matrix_controller.set_scroll(scroll)
+
+
+# Layers, blended by the driver with whatever it is showing
+@app.post("/layer", tags=["layers"])
+async def post_layer(layer: Layer):
+    return await matrix_controller.set_layer(layer)
+
+
+@app.post("/remove-layer", tags=["layers"])
+async def remove_layer(name: str):
+    return await matrix_controller.remove_layer(name)
+
+
+# Live stream, binary messages are whole RGB888 frames and text messages are JSON
+# pixel updates. The driver gets the latest frame at most STREAM_FPS times a second.
+@app.websocket("/stream")
+async def stream(websocket: WebSocket):
+    await websocket.accept()
+    await matrix_controller.stream(websocket)
+
+
+# Image endpoints, the body is the image file as it is. Images are fitted to the
+# matrix, then gamma and dithering are applied.
+@app.post("/image", tags=["image"])
+async def post_image(
+    request: Request,
+    fit: Literal["contain", "cover", "stretch"] = "contain",
+    gamma: float = 1.0,
+    dither: Literal["none", "ordered", "floyd-steinberg"] = "none",
+    bits: int = 8,
+    save: bool = False,
+):
+    options = ImageOptions(fit=fit, gamma=gamma, dither=dither, bits=bits)
+    return await matrix_controller.set_image(await request.body(), options, save)
+
+
+@app.post("/gif", tags=["image"])
+async def post_gif(
+    request: Request,
+    fit: Literal["contain", "cover", "stretch"] = "contain",
+    gamma: float = 1.0,
+    dither: Literal["none", "ordered", "floyd-steinberg"] = "none",
+    bits: int = 8,
+    save: bool = False,
+):
+    options = ImageOptions(fit=fit, gamma=gamma, dither=dither, bits=bits)
+    return await matrix_controller.set_gif(await request.body(), options, save)
 
 
 @app.post("/animation", tags=["animation"])
-def post_animation(animation: Animation):
-    return matrix_controller.set_animation(animation)
+async def post_animation(animation: Animation):
+    return await matrix_controller.set_animation(animation)
 
 
 @app.post("/save-animation", tags=["saving"])
-def post_save_animation(animation: Animation):
-    return matrix_controller.save_animation(animation)
+async def post_save_animation(animation: Animation):
+    return await matrix_controller.save_animation(animation)
+
+
+# Several operations applied at once, see MatrixController.run_batch
+@app.post("/batch", tags=["batch"])
+async def post_batch(batch: Batch):
+    return await matrix_controller.run_batch(batch)
 
 
 # Load matrix
 @app.post("/load-matrix", tags=["loading"])
-def post_load_matrix(timestamp: str):
-    return matrix_controller.load_matrix(timestamp)
+async def post_load_matrix(timestamp: str):
+    return await matrix_controller.load_matrix(timestamp)
 
 
 # Delete matrix
 @app.post("/delete-matrix", tags=["deleting"])
-def delete_matrix(timestamp: str):
-    return matrix_controller.delete_matrix(timestamp)
+async def delete_matrix(timestamp: str):
+    return await matrix_controller.delete_matrix(timestamp)
 
 
 # Get matrix
 @app.get("/get-matrix", tags=["getting"])
-def get_matrix(timestamp: str):
-    return matrix_controller.get_matrix(timestamp)
+async def get_matrix(timestamp: str):
+    return await matrix_controller.get_matrix(timestamp)
 
 
 # Get matrixes
 @app.get("/get-matrixes", tags=["getting"])
-def get_matrixes(page: int, limit: int):
-    return matrix_controller.get_matrixes(page, limit)
+async def get_matrixes(page: int = 0, limit: int = 10, before: Optional[str] = None):
+    return await matrix_controller.get_matrixes(page, limit, before)
+
+
+app.include_router(v1_router)
 
 
 if __name__ == "__main__":
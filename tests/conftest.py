@@ -0,0 +1,57 @@
+# The driver in client/ and the server in server/ both import their own modules as
+# models.x, like when they are run. Each side is imported on its own and handed to
+# tests as a namespace, so one test can send what the server encodes to the driver.
+import importlib
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLIENT_MODULES = [
+    "animation_file",
+    "framebuffer",
+    "matrix",
+    "protocol",
+    "scheduler",
+    "socket",
+]
+SERVER_MODULES = [
+    "animation_file",
+    "framebuffer",
+    "matrix_store",
+    "protocol",
+    "scene",
+]
+
+
+def _is_models(name: str) -> bool:
+    return name == "models" or name.startswith("models.")
+
+
+def load_side(directory: str, modules: list[str]) -> SimpleNamespace:
+    path = os.path.join(ROOT, directory)
+    others = {name: sys.modules.pop(name) for name in list(sys.modules) if _is_models(name)}
+    sys.path.insert(0, path)
+    try:
+        side = SimpleNamespace(
+            **{name: importlib.import_module(f"models.{name}") for name in modules}
+        )
+    finally:
+        sys.path.remove(path)
+        for name in [name for name in sys.modules if _is_models(name)]:
+            del sys.modules[name]
+        sys.modules.update(others)
+    return side
+
+
+@pytest.fixture(scope="session")
+def client() -> SimpleNamespace:
+    return load_side("client", CLIENT_MODULES)
+
+
+@pytest.fixture(scope="session")
+def server() -> SimpleNamespace:
+    return load_side("server", SERVER_MODULES)
@@ -0,0 +1,80 @@
+# .lcanim files written by the server and played back by the driver
+import numpy as np
+import pytest
+
+WIDTH, HEIGHT = 64, 32
+
+
+def frames(server, count=40):
+    # A dot moving along the top row, held on its last position for a while
+    framebuffers = []
+    for index in range(count):
+        framebuffer = server.framebuffer.Framebuffer(WIDTH, HEIGHT)
+        framebuffer.array[:, :] = [0, 0, 40]
+        framebuffer.array[0, min(index, 20)] = [255, 255, 255]
+        framebuffers.append(framebuffer)
+    return framebuffers
+
+
+def test_round_trip(server, client):
+    framebuffers = frames(server)
+    lengths = list(range(10, 10 + len(framebuffers)))
+    payload = server.animation_file.encode_animation(framebuffers, lengths, loop=True)
+
+    animation = client.animation_file.AnimationFile(buffer=payload)
+    assert (animation.width, animation.height) == (WIDTH, HEIGHT)
+    assert animation.loop
+    assert animation.frame_lengths == lengths
+    decoded = list(animation.frames())
+    assert len(decoded) == len(framebuffers)
+    for expected, framebuffer in zip(framebuffers, decoded):
+        assert np.array_equal(framebuffer.array, expected.array)
+
+
+def test_frames_after_the_first_are_deltas(server, client):
+    animation = client.animation_file.AnimationFile(
+        buffer=server.animation_file.encode_animation(frames(server), [10] * 40, loop=False)
+    )
+    encodings = client.animation_file.FRAME_ENCODING
+    assert animation.encodings[0] == encodings.KEYFRAME
+    assert encodings.DELTA in animation.encodings
+    assert not animation.loop
+
+    # A delta changes only the dot, which moved one pixel
+    _, rects = animation.decode(1, animation.decode(0)[0])
+    assert rects == [(0, 0, 2, 1)]
+
+
+def test_held_frames_share_their_payload(server, client):
+    animation = client.animation_file.AnimationFile(
+        buffer=server.animation_file.encode_animation(frames(server), [10] * 40, loop=True)
+    )
+    # Frames 22 onwards are the same as the one before them, up to the next keyframe
+    assert len(set(animation.offsets[22:32])) == 1
+
+
+def test_written_file_is_read_back(server, client, tmp_path):
+    filename = str(tmp_path / "dot.lcanim")
+    framebuffers = frames(server, 5)
+    server.animation_file.write_animation(filename, framebuffers, [100] * 5, loop=True)
+
+    with client.animation_file.AnimationFile(filename) as animation:
+        decoded = list(animation.frames())
+    assert np.array_equal(decoded[-1].array, framebuffers[-1].array)
+
+
+def test_frames_must_match_their_lengths(server):
+    with pytest.raises(ValueError):
+        server.animation_file.encode_animation(frames(server, 3), [10, 10], loop=True)
+
+
+@pytest.mark.parametrize("length", [0, 10, 20, 100])
+def test_truncated_file_is_rejected(server, client, length):
+    payload = server.animation_file.encode_animation(frames(server, 3), [10] * 3, loop=True)
+    with pytest.raises(ValueError):
+        client.animation_file.AnimationFile(buffer=payload[:length])
+
+
+def test_unknown_file_is_rejected(client):
+    with pytest.raises(ValueError):
+        client.animation_file.AnimationFile(buffer=b"GIF89a" + bytes(100))
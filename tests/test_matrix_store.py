@@ -0,0 +1,99 @@
+# Saved matrices in server/models/matrix_store.py, blobs shared between saves
+import json
+import os
+
+import numpy as np
+import pytest
+
+WIDTH, HEIGHT = 64, 32
+
+
+@pytest.fixture
+def store(server, tmp_path):
+    return server.matrix_store.MatrixStore(str(tmp_path), WIDTH, HEIGHT)
+
+
+def framebuffer(server, rgb):
+    framebuffer = server.framebuffer.Framebuffer(WIDTH, HEIGHT)
+    framebuffer.fill(rgb)
+    return framebuffer
+
+
+def blobs(tmp_path):
+    return sorted(os.listdir(tmp_path / "blobs"))
+
+
+def test_save_and_read(server, store):
+    saved = store.save("2024-01-01", framebuffer(server, [1, 2, 3]), brightness=40)
+    assert store.get("2024-01-01") == saved
+    assert saved["brightness"] == 40
+    assert np.array_equal(store.read("2024-01-01").array, framebuffer(server, [1, 2, 3]).array)
+
+
+def test_same_pixels_share_a_blob(server, store, tmp_path):
+    store.save("a", framebuffer(server, [1, 2, 3]))
+    store.save("b", framebuffer(server, [1, 2, 3]))
+    assert len(blobs(tmp_path)) == 1
+
+    # Kept until the last matrix using it is deleted
+    assert store.delete("a")
+    assert len(blobs(tmp_path)) == 1
+    assert store.read("b") is not None
+    assert store.delete("b")
+    assert blobs(tmp_path) == []
+    assert not store.delete("b")
+
+
+def test_saving_over_a_matrix_releases_its_blob(server, store, tmp_path):
+    store.save("a", framebuffer(server, [1, 2, 3]))
+    store.save("a", framebuffer(server, [1, 2, 3]))
+    store.save("a", framebuffer(server, [4, 5, 6]))
+    assert blobs(tmp_path) == [f"{store.get('a')['thumbnail_hash']}.rgb"]
+    assert store.count() == 1
+
+
+def test_list_pages_newest_first(server, store):
+    for day in range(1, 6):
+        store.save(f"2024-01-0{day}", framebuffer(server, [day, 0, 0]))
+
+    first = store.list(2)
+    assert [matrix["timestamp"] for matrix in first] == ["2024-01-05", "2024-01-04"]
+    after = store.list(2, before=first[-1]["timestamp"])
+    assert [matrix["timestamp"] for matrix in after] == ["2024-01-03", "2024-01-02"]
+
+
+@pytest.mark.parametrize("name", ["", "../escape", ".hidden", "a/b"])
+def test_names_outside_the_directory_are_rejected(server, store, name):
+    with pytest.raises(ValueError):
+        store.save(name, framebuffer(server, [1, 2, 3]))
+
+
+def test_json_files_are_imported_and_kept(server, tmp_path):
+    pixels = [
+        {"rgb": [9, 8, 7], "position": [0, 0]},
+        {"rgb": [0, 0, 0], "position": [1, 0]},
+        {"rgb": [1, 1, 1], "position": [100, 50]},
+    ]
+    (tmp_path / "old.json").write_text(json.dumps(pixels))
+    (tmp_path / "bright.json").write_text(json.dumps({"pixels": pixels, "brightness": 30}))
+    (tmp_path / "broken.json").write_text("{")
+
+    store = server.matrix_store.MatrixStore(str(tmp_path), 128, 64)
+    assert store.count() == 2
+    assert store.get("bright")["brightness"] == 30
+    # Read at the configured size, so the pixel beyond 64x32 is still there
+    old = store.read("old")
+    assert (old.width, old.height) == (128, 64)
+    assert old.get_pixel(100, 50) == [1, 1, 1]
+
+    # The originals are moved aside, an unreadable one is left where it was
+    assert sorted(os.listdir(tmp_path / "legacy")) == ["bright.json", "old.json"]
+    assert (tmp_path / "broken.json").exists()
+    assert json.loads((tmp_path / "legacy" / "old.json").read_text()) == pixels
+
+
+def test_json_files_are_only_imported_once(server, tmp_path):
+    server.matrix_store.MatrixStore(str(tmp_path), WIDTH, HEIGHT)
+    (tmp_path / "late.json").write_text("[]")
+    store = server.matrix_store.MatrixStore(str(tmp_path), WIDTH, HEIGHT)
+    assert store.count() == 0
@@ -0,0 +1,257 @@
+# What the server encodes in server/models/protocol.py, decoded by the driver's
+# client/models/protocol.py
+import numpy as np
+import pytest
+
+WIDTH, HEIGHT = 64, 32
+
+
+def random_framebuffer(side, seed=0, colours=None):
+    rng = np.random.default_rng(seed)
+    if colours is None:
+        array = rng.integers(0, 256, (HEIGHT, WIDTH, 3), dtype=np.uint8)
+    else:
+        palette = rng.integers(0, 256, (colours, 3), dtype=np.uint8)
+        array = palette[rng.integers(0, colours, (HEIGHT, WIDTH))]
+    return side.framebuffer.Framebuffer(WIDTH, HEIGHT, array)
+
+
+def test_message_header(server, client):
+    message = server.protocol.encode_message(
+        server.protocol.MESSAGE_TYPE.JSON, 7, b"{}"
+    )
+    magic, version, message_type, request_id, length = client.protocol.HEADER.unpack_from(
+        message
+    )
+    assert magic == client.protocol.PROTOCOL_MAGIC
+    assert version == client.protocol.PROTOCOL_VERSION
+    assert message_type == client.protocol.MESSAGE_TYPE.JSON
+    assert request_id == 7
+    assert message[client.protocol.HEADER.size:] == b"{}"
+    assert length == 2
+
+
+def test_rgb888_frame_round_trip(server, client):
+    framebuffer = random_framebuffer(server)
+    payload = server.protocol.encode_frame(
+        framebuffer, 55, server.protocol.PIXEL_FORMAT.RGB888, sequence=9
+    )
+
+    frame = client.protocol.decode_frame(payload)
+    assert (frame["width"], frame["height"]) == (WIDTH, HEIGHT)
+    assert frame["brightness"] == 55
+    assert frame["sequence"] == 9
+    assert np.array_equal(frame["framebuffer"].array, framebuffer.array)
+
+
+def test_rgb565_frame_round_trip(server, client):
+    framebuffer = random_framebuffer(server)
+    payload = server.protocol.encode_frame(
+        framebuffer, 80, server.protocol.PIXEL_FORMAT.RGB565
+    )
+
+    # Only the bits RGB565 keeps of each channel come back
+    expected = framebuffer.array & np.array([0xF8, 0xFC, 0xF8], dtype=np.uint8)
+    frame = client.protocol.decode_frame(payload)
+    assert np.array_equal(frame["framebuffer"].array, expected)
+
+
+def test_palette_frame_round_trip(server, client):
+    framebuffer = random_framebuffer(server, colours=200)
+    payload = server.protocol.encode_frame(
+        framebuffer, 80, server.protocol.PIXEL_FORMAT.PALETTE
+    )
+
+    frame = client.protocol.decode_frame(payload)
+    assert np.array_equal(frame["framebuffer"].array, framebuffer.array)
+
+
+def test_palette_frame_needs_256_colours_or_fewer(server):
+    with pytest.raises(ValueError):
+        server.protocol.encode_frame(
+            random_framebuffer(server, colours=257),
+            80,
+            server.protocol.PIXEL_FORMAT.PALETTE,
+        )
+
+
+@pytest.mark.parametrize("length", [0, 5, 100])
+def test_truncated_frame_is_rejected(server, client, length):
+    payload = server.protocol.encode_frame(random_framebuffer(server), 80)
+    with pytest.raises(ValueError):
+        client.protocol.decode_frame(payload[:length])
+
+
+def test_palette_frame_with_missing_colour_is_rejected(server, client):
+    payload = bytearray(
+        server.protocol.encode_frame(
+            random_framebuffer(server, colours=4), 80, server.protocol.PIXEL_FORMAT.PALETTE
+        )
+    )
+    payload[-1] = 200
+    with pytest.raises(ValueError):
+        client.protocol.decode_frame(bytes(payload))
+
+
+def test_dirty_rects_cover_every_change(server):
+    previous = random_framebuffer(server)
+    framebuffer = previous.copy()
+    framebuffer.array[3, 5] = [1, 2, 3]
+    framebuffer.array[4, 60] = [1, 2, 3]
+    framebuffer.array[20:25, 10:12] = 0
+    framebuffer.mark_changed()
+
+    rects = framebuffer.dirty_rects(previous)
+    covered = np.zeros((HEIGHT, WIDTH), dtype=bool)
+    for x, y, rect_width, rect_height in rects:
+        covered[y: y + rect_height, x: x + rect_width] = True
+    assert not (framebuffer.changed_mask(previous) & ~covered).any()
+    # Rows 3 and 4 are one band, rows 20 to 24 another
+    assert rects == [(5, 3, 56, 2), (10, 20, 2, 5)]
+
+
+def test_dirty_rects_of_an_unchanged_framebuffer(server):
+    framebuffer = random_framebuffer(server)
+    assert framebuffer.dirty_rects(framebuffer.copy()) == []
+
+
+def test_delta_applied_on_the_driver(server, client):
+    previous = random_framebuffer(server, seed=1)
+    framebuffer = previous.copy()
+    framebuffer.array[0:2, 0:64] = 255
+    framebuffer.array[30, 63] = [4, 5, 6]
+    framebuffer.mark_changed()
+    rects = framebuffer.dirty_rects(previous)
+
+    action = client.matrix.CurrentAction(
+        client.matrix.DATA_TYPE.MATRIX, {"pixels": [], "brightness": 80}
+    )
+    action.change_action(
+        client.matrix.DATA_TYPE.FRAME.value,
+        client.protocol.decode_frame(server.protocol.encode_frame(previous, 80, sequence=1)),
+    )
+    # The whole frame is drawn first
+    assert action.take_dirty_rects() is None
+
+    delta = client.protocol.decode_delta(
+        server.protocol.encode_delta(framebuffer, 70, rects, 2, 1)
+    )
+    assert delta["base_sequence"] == 1
+    assert delta["sequence"] == 2
+    action.change_action(client.matrix.DATA_TYPE.FRAME_DELTA.value, delta)
+
+    assert np.array_equal(action.framebuffer.array, framebuffer.array)
+    assert action.take_dirty_rects() == rects
+    assert action.brightness == 70
+
+
+def test_delta_rect_out_of_bounds_is_rejected(server, client):
+    framebuffer = random_framebuffer(server)
+    payload = bytearray(server.protocol.encode_delta(framebuffer, 80, [(60, 0, 4, 1)], 2, 1))
+    # Move the rectangle one pixel to the right, off the frame
+    offset = server.protocol.DELTA_HEADER.size
+    payload[offset: offset + 2] = (61).to_bytes(2, "big")
+    with pytest.raises(ValueError):
+        client.protocol.decode_delta(bytes(payload))
+
+
+def test_delta_with_trailing_bytes_is_rejected(server, client):
+    payload = server.protocol.encode_delta(random_framebuffer(server), 80, [(0, 0, 1, 1)], 2, 1)
+    with pytest.raises(ValueError):
+        client.protocol.decode_delta(payload + b"\0")
+
+
+def test_batch_round_trip(server, client):
+    messages = [
+        (server.protocol.MESSAGE_TYPE.JSON, b'{"data_type": "brightness"}'),
+        (server.protocol.MESSAGE_TYPE.FRAME, b""),
+        (server.protocol.MESSAGE_TYPE.FRAME_DELTA, bytes(range(256))),
+    ]
+    decoded = client.protocol.decode_batch(server.protocol.encode_batch(messages))
+    assert decoded == [(int(message_type), payload) for message_type, payload in messages]
+
+
+def test_truncated_batch_is_rejected(server, client):
+    payload = server.protocol.encode_batch([(server.protocol.MESSAGE_TYPE.JSON, b"{}")])
+    for length in range(1, len(payload)):
+        with pytest.raises(ValueError):
+            client.protocol.decode_batch(payload[:length])
+
+
+def test_datagram_round_trip(server, client):
+    framebuffer = random_framebuffer(server)
+    datagrams = server.protocol.encode_datagrams(framebuffer, 40, 3)
+
+    pixels = bytearray()
+    for datagram in datagrams:
+        brightness, sequence, width, height, offset, chunk = client.protocol.decode_datagram(
+            datagram
+        )
+        assert (brightness, sequence, width, height) == (40, 3, WIDTH, HEIGHT)
+        assert offset == len(pixels)
+        pixels += chunk
+    assert bytes(pixels) == framebuffer.tobytes()
+
+
+def test_datagram_chunk_sizes_agree(server, client):
+    assert server.protocol.DATAGRAM_PAYLOAD_SIZE == client.protocol.DATAGRAM_PAYLOAD_SIZE
+
+
+def datagram(client, offset, pixels, width=WIDTH, height=HEIGHT, sequence=1):
+    return (
+        client.protocol.DATAGRAM_HEADER.pack(
+            client.protocol.DATAGRAM_MAGIC,
+            client.protocol.DATAGRAM_VERSION,
+            80,
+            sequence,
+            width,
+            height,
+            offset,
+        )
+        + pixels
+    )
+
+
+@pytest.mark.parametrize(
+    "offset, length",
+    [
+        (100, 1440),  # Not on a chunk boundary
+        (0, 1000),  # A short chunk that isn't the last
+        (5760, 400),  # The last chunk is 384 bytes
+        (6144, 1),  # Past the end of the frame
+    ],
+)
+def test_datagram_outside_its_chunk_is_rejected(client, offset, length):
+    with pytest.raises(ValueError):
+        client.protocol.decode_datagram(datagram(client, offset, bytes(length)))
+
+
+def receive(client, datagrams):
+    receiver = client.socket.DataReceiver(udp_port=None)
+    protocol = client.socket.FrameDatagramProtocol(receiver)
+    for packet in datagrams:
+        protocol.datagram_received(packet, ("127.0.0.1", 0))
+    return receiver.get_data()
+
+
+def test_live_frame_is_assembled_in_any_order(server, client):
+    framebuffer = random_framebuffer(server)
+    request = receive(client, reversed(server.protocol.encode_datagrams(framebuffer, 40, 3)))
+    assert np.array_equal(request["data"]["framebuffer"].array, framebuffer.array)
+    assert request["data"]["brightness"] == 40
+
+
+def test_live_frame_needs_every_chunk(server, client):
+    datagrams = server.protocol.encode_datagrams(random_framebuffer(server), 40, 3)
+    # Repeating a chunk doesn't make up for one that never arrived
+    assert receive(client, datagrams[:-2] + datagrams[-3:-2] * 2) is None
+
+
+def test_overlapping_datagrams_dont_complete_a_frame(client):
+    packets = [datagram(client, offset, b"\xff" * 1440) for offset in range(0, 6144, 100)]
+    assert receive(client, packets) is None
+
+
+def test_live_frame_of_another_size_is_dropped(server, client):
+    framebuffer = server.framebuffer.Framebuffer(16, 16)
+    assert receive(client, server.protocol.encode_datagrams(framebuffer, 40, 3)) is None
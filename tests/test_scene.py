@@ -0,0 +1,62 @@
+# Scenes rendered on the server, elements reaching far past the panel
+import numpy as np
+import pytest
+
+WIDTH, HEIGHT = 64, 32
+
+
+def render(server, *elements):
+    return server.scene.render_scene(
+        {"elements": list(elements)}, WIDTH, HEIGHT, lambda timestamp: None
+    )
+
+
+def lit(framebuffer):
+    return framebuffer.array.any(axis=2)
+
+
+def test_line(server):
+    framebuffer = render(server, {"type": "line", "start": [0, 0], "end": [3, 3], "rgb": [255, 0, 0]})
+    assert np.flatnonzero(lit(framebuffer)).tolist() == [0, 65, 130, 195]
+
+
+def test_circle_outline(server):
+    framebuffer = render(
+        server, {"type": "circle", "center": [10, 10], "radius": 2, "rgb": [0, 255, 0]}
+    )
+    ys, xs = np.nonzero(lit(framebuffer))
+    assert np.allclose(np.hypot(xs - 10, ys - 10), 2, atol=0.5)
+    assert not lit(framebuffer)[10, 10]
+
+
+def test_huge_filled_circle_fills_the_panel(server):
+    framebuffer = render(
+        server,
+        {"type": "circle", "center": [10, 10], "radius": 100_000, "rgb": [1, 1, 1], "fill": True},
+    )
+    assert lit(framebuffer).all()
+
+
+def test_huge_circle_outline_is_off_the_panel(server):
+    framebuffer = render(
+        server, {"type": "circle", "center": [10, 10], "radius": 10**12, "rgb": [1, 1, 1]}
+    )
+    assert not lit(framebuffer).any()
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        ([-(10**12), 5], [10**12, 5]),
+        ([5, -(10**15)], [5, 10**15]),
+        ([-(10**12), -(10**12)], [10**12, 10**12]),
+    ],
+)
+def test_line_far_past_the_panel_is_clipped(server, start, end):
+    framebuffer = render(server, {"type": "line", "start": start, "end": end, "rgb": [1, 1, 1]})
+    assert 0 < lit(framebuffer).sum() <= max(WIDTH, HEIGHT)
+
+
+def test_negative_radius_is_rejected(server):
+    with pytest.raises(ValueError):
+        render(server, {"type": "circle", "center": [0, 0], "radius": -1, "rgb": [1, 1, 1]})
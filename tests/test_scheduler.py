@@ -0,0 +1,59 @@
+# Animation frame timing on the driver, with the clock passed in
+MS = 1_000_000
+
+
+def scheduler(client, frame_lengths, loop=True, skip_late_frames=True):
+    scheduler = client.scheduler.FrameScheduler(frame_lengths, loop, skip_late_frames)
+    scheduler.start(0)
+    return scheduler
+
+
+def test_frames_follow_their_lengths(client):
+    frames = scheduler(client, [100, 50, 200])
+    assert frames.advance(99 * MS) == 0
+    assert frames.advance(100 * MS) == 1
+    assert frames.current_frame == 1
+    assert frames.get_time_until_next_frame(120 * MS) == 0.03
+    assert frames.advance(150 * MS) == 1
+    assert frames.current_frame == 2
+
+
+def test_deadlines_dont_drift_with_late_polling(client):
+    frames = scheduler(client, [100, 100, 100, 100])
+    frames.advance(130 * MS)
+    # Still due at 200ms, not 100ms after we noticed the last one
+    assert frames.get_time_until_next_frame(130 * MS) == 0.07
+
+
+def test_late_frames_are_skipped(client):
+    frames = scheduler(client, [100, 100, 100, 100])
+    assert frames.advance(250 * MS) == 2
+    assert frames.current_frame == 2
+    assert frames.get_stats(250 * MS)["skipped_frames"] == 1
+
+
+def test_late_frames_are_shown_in_turn_without_skipping(client):
+    frames = scheduler(client, [100, 100, 100, 100], skip_late_frames=False)
+    assert frames.advance(250 * MS) == 1
+    assert frames.advance(250 * MS) == 1
+    assert frames.current_frame == 2
+
+
+def test_loop_goes_back_to_the_first_frame(client):
+    frames = scheduler(client, [100, 100])
+    frames.advance(200 * MS)
+    assert frames.current_frame == 0
+
+
+def test_last_frame_stays_without_looping(client):
+    frames = scheduler(client, [100, 100], loop=False)
+    frames.advance(10_000 * MS)
+    assert frames.current_frame == 1
+    assert frames.get_time_until_next_frame(10_000 * MS) is None
+
+
+def test_zero_length_frames_dont_hold_up_the_render_loop(client):
+    frames = scheduler(client, [0] * 1000)
+    # One pass at most per call, then it carries on from now
+    assert frames.advance(10_000 * MS) <= 1000
+    assert frames.get_time_until_next_frame(10_000 * MS) > 0